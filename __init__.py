@@ -11,13 +11,17 @@ bl_info = {
 }
 
 def register():
-    bootstrap.setup()
-    bootstrap.register_classes()
-    bootstrap.register_draw_functions()
-    bootstrap.register_handlers()
-    bootstrap.post_setup()
+    with bootstrap.time_startup_phase("register"):
+        bootstrap.setup()
+        bootstrap.register_classes()
+        bootstrap.register_handlers()
+        bootstrap.post_setup()
+
+    # Panel draws, the logger and caches are set up once Blender is idle
+    bootstrap.schedule_deferred_setup()
 
 def unregister():
+    bootstrap.cancel_deferred_setup()
     bootstrap.unregister_draw_functions()
     bootstrap.clear_state()
     bootstrap.unregister_classes()
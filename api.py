@@ -0,0 +1,40 @@
+"""
+Scripting API of the Custom Properties Manager, for reading and writing a property of many data objects at once:
+
+    from custom_properties_manager import api
+
+    objects = [obj for obj in bpy.data.objects if "mass" in obj]
+    masses = api.gather(objects, "mass")
+    api.scatter(objects, "mass", masses * 2)
+
+Values are typed arrays: NumPy arrays when NumPy is available (as it is in Blender), `array.array` otherwise. FLOAT,
+INT and BOOL properties and their arrays are supported. Writing keeps each property's type, UI data and group.
+"""
+from .application.managers import BulkPropertyManager
+
+def gather(data_objects, prop_name: str):
+    """
+    Reads a property of many data objects.
+
+    :param data_objects: The data objects (e.g. objects or pose bones), which all need to have the property with the
+    same type.
+    :param prop_name: The name of the property.
+
+    :return: The values, in the order of the data objects. Values of array properties are rows of a 2D NumPy array, or
+    concatenated in an `array.array`.
+    """
+    return BulkPropertyManager.gather(data_objects, prop_name)
+
+def scatter(data_objects, prop_name: str, values, clamp: bool = False) -> int:
+    """
+    Writes a property of many data objects. Values outside the min and max of a property's UI data raise a ValueError,
+    unless they are clamped.
+
+    :param data_objects: The data objects, which all need to have the property with the same type.
+    :param prop_name: The name of the property.
+    :param values: A value per data object, in the layout `gather` returns. Any sequence of numbers works as well.
+    :param clamp: Whether to clamp values outside their min and max instead of raising an error.
+
+    :return: The number of data objects written.
+    """
+    return BulkPropertyManager.scatter(data_objects, prop_name, values, clamp = clamp)
\ No newline at end of file
@@ -1,11 +1,21 @@
+from .bulk_property_manager import BulkPropertyManager
 from .field_manager import FieldManager
 from .group_data_manager import GroupDataManager
+from .job_manager import JobManager
 from .preferences_manager import PreferencesManager
+from .preset_manager import PresetManager
 from .property_data_manager import PropertyDataManager
+from .property_table_manager import PropertyTableManager
+from .selection_view_manager import SelectionViewManager
 
 __all__ = [
     "GroupDataManager",
     "PropertyDataManager",
     "FieldManager",
-    "PreferencesManager"
+    "PreferencesManager",
+    "PresetManager",
+    "JobManager",
+    "PropertyTableManager",
+    "BulkPropertyManager",
+    "SelectionViewManager"
 ]
\ No newline at end of file
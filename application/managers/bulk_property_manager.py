@@ -0,0 +1,271 @@
+from array import array
+from itertools import chain
+from typing import Iterable
+
+from .property_table_manager import PropertyTableManager
+from ..services import DataWalkerService, PropertyTypeService
+from ...shared import consts
+from ...shared.entities import LogLevel
+from ...shared.utils import SpanRecorder, StructuredLogger
+
+# Typecodes of the arrays values are gathered into, per property type. Blender stores ints with 32 bits.
+_TYPECODES = {
+    consts.PropertyTypes.FLOAT: "d",
+    consts.PropertyTypes.FLOAT_ARRAY: "d",
+    consts.PropertyTypes.INT: "i",
+    consts.PropertyTypes.INT_ARRAY: "i",
+    consts.PropertyTypes.BOOL: "b",
+    consts.PropertyTypes.BOOL_ARRAY: "b",
+}
+_DTYPES = {"d": "float64", "i": "int32", "b": "bool"}
+_ARRAY_TYPES = (consts.PropertyTypes.FLOAT_ARRAY, consts.PropertyTypes.INT_ARRAY, consts.PropertyTypes.BOOL_ARRAY)
+_PYTHON_TYPES = {"d": float, "i": int, "b": bool}
+
+class BulkPropertyManager:
+    """
+    Reads and writes one property of many data objects at once, as typed arrays: NumPy arrays when NumPy is available,
+    `array.array` otherwise. Only FLOAT, INT and BOOL properties and their arrays are supported. Values of array
+    properties are gathered as one row per data object; `array.array` has no rows, so they are concatenated instead.
+    """
+    logger = StructuredLogger(consts.MODULE_NAME)
+    property_type_service = PropertyTypeService
+    # NumPy, imported when it is first needed, or False if it is not available
+    _numpy = None
+
+    @classmethod
+    @SpanRecorder.timed("BulkPropertyManager.gather")
+    def gather(cls, data_objects: Iterable, prop_name: str):
+        """
+        Reads a property of many data objects.
+
+        :param data_objects: The data objects, which all need to have the property with the same type (and length, for
+        array properties).
+        :param prop_name: The name of the property.
+
+        :return: The values, in the order of the data objects.
+
+        :raises KeyError: If a data object does not have the property.
+        :raises TypeError: If the property's type is not supported, or differs between data objects.
+        :raises ValueError: If the lengths of an array property differ between data objects.
+        """
+        data_objects = list(data_objects)
+        prop_type, length = cls._get_layout(data_objects, prop_name)
+        typecode = _TYPECODES[prop_type]
+        if length is None:
+            values = [data_object[prop_name] for data_object in data_objects]
+        else:
+            values = [data_object[prop_name].to_list() for data_object in data_objects]
+
+        numpy = cls._get_numpy()
+        if numpy is not None:
+            result = numpy.array(values, dtype = _DTYPES[typecode])
+            if length is not None:
+                result = result.reshape(len(data_objects), length)
+        else:
+            result = array(typecode, values if length is None else chain.from_iterable(values))
+
+        cls.logger.log(
+            level = LogLevel.DEBUG,
+            message = "Gathered property values",
+            extra = {"property": prop_name, "data_objects": len(data_objects)}
+        )
+
+        return result
+
+    @classmethod
+    @SpanRecorder.timed("BulkPropertyManager.scatter")
+    def scatter(cls, data_objects: Iterable, prop_name: str, values, clamp: bool = False) -> int:
+        """
+        Writes a property of many data objects. Only existing properties are written, and their type, UI data and
+        group are kept. Values are checked against the min and max of each data object's UI data.
+
+        :param data_objects: The data objects, which all need to have the property with the same type (and length, for
+        array properties), and belong to the current file.
+        :param prop_name: The name of the property.
+        :param values: A value per data object, in the layout `gather` returns: any sequence for single values, and
+        either rows or one concatenated sequence for array properties.
+        :param clamp: Whether to clamp values outside their min and max, instead of raising an error.
+
+        :return: The number of data objects written.
+
+        :raises KeyError: If a data object does not have the property.
+        :raises TypeError: If the property's type is not supported, or differs between data objects.
+        :raises ValueError: If the number of values does not match, values are outside their min and max, or a data
+        object is linked from a library.
+        """
+        data_objects = list(data_objects)
+        prop_type, length = cls._get_layout(data_objects, prop_name)
+        linked = next((data_object for data_object in data_objects if not DataWalkerService.is_local(data_object)), None)
+        if linked is not None:
+            raise ValueError(f"'{linked.name}' is linked from a library and cannot be written.")
+
+        typecode = _TYPECODES[prop_type]
+        if typecode == "b":
+            # Booleans have no min and max
+            rows = cls._to_rows(values, len(data_objects), length, typecode)
+        else:
+            rows = cls._validate(data_objects, prop_name, values, length, typecode, clamp)
+
+        if length is None:
+            for data_object, value in zip(data_objects, rows):
+                # Assigning a value of the same type keeps the property's UI data
+                data_object[prop_name] = value
+        else:
+            for data_object, row in zip(data_objects, rows):
+                data_object[prop_name][:] = row
+
+        if prop_name in PropertyTableManager.table.values:
+            # Properties written from scripts do not cause depsgraph updates
+            PropertyTableManager.mark_dirty()
+
+        cls.logger.log(
+            level = LogLevel.DEBUG,
+            message = "Scattered property values",
+            extra = {"property": prop_name, "data_objects": len(data_objects)}
+        )
+
+        return len(data_objects)
+
+    @classmethod
+    def _get_layout(cls, data_objects: list, prop_name: str) -> tuple[str, int | None]:
+        """
+        Classifies a property of many data objects. The property of the first data object is classified by the
+        PropertyTypeService, the others only have to match its Python type (and typecode, for array properties).
+
+        :return: The property's type, and the length of array properties or None for single values.
+        """
+        if not data_objects:
+            # The type does not matter without data objects
+            return consts.PropertyTypes.FLOAT, None
+
+        first = data_objects[0]
+        if prop_name not in first:
+            raise KeyError(f"'{first.name}' has no property '{prop_name}'.")
+
+        prop_type = cls.property_type_service.get_property_type(first, prop_name)
+        if prop_type not in _TYPECODES:
+            raise TypeError(f"Properties of type {prop_type} cannot be read or written in bulk.")
+
+        value_type = type(first[prop_name])
+        is_array = prop_type in _ARRAY_TYPES
+        length = len(first[prop_name]) if is_array else None
+        typecode = first[prop_name].typecode if is_array else None
+        for data_object in data_objects:
+            value = data_object.get(prop_name)
+            if value is None and prop_name not in data_object:
+                raise KeyError(f"'{data_object.name}' has no property '{prop_name}'.")
+
+            if type(value) is not value_type or (is_array and value.typecode != typecode):
+                raise TypeError(f"'{prop_name}' of '{data_object.name}' is not of type {prop_type}.")
+
+            if is_array and len(value) != length:
+                raise ValueError(f"'{prop_name}' of '{data_object.name}' does not have {length} items.")
+
+        return prop_type, length
+
+    @classmethod
+    def _validate(
+            cls,
+            data_objects: list,
+            prop_name: str,
+            values,
+            length: int | None,
+            typecode: str,
+            clamp: bool) -> list:
+        """
+        Checks values against the min and max of each data object's UI data, all at once when NumPy is available.
+
+        :return: The values as plain Python values, one row per data object for array properties.
+
+        :raises ValueError: If values are outside their min and max and are not clamped.
+        """
+        ui_data = [data_object.id_properties_ui(prop_name).as_dict() for data_object in data_objects]
+        mins = [data.get("min", float("-inf")) for data in ui_data]
+        maxs = [data.get("max", float("inf")) for data in ui_data]
+
+        numpy = cls._get_numpy()
+        if numpy is not None:
+            checked = numpy.asarray(values, dtype = _DTYPES[typecode])
+            shape = (len(data_objects),) if length is None else (len(data_objects), length)
+            if checked.size != len(data_objects) * (length or 1):
+                raise ValueError(f"Expected {len(data_objects) * (length or 1)} values, got {checked.size}.")
+
+            checked = checked.reshape(shape)
+            low = numpy.asarray(mins, dtype = "float64")
+            high = numpy.asarray(maxs, dtype = "float64")
+            if length is not None:
+                low = low[:, None]
+                high = high[:, None]
+
+            outside = (checked < low) | (checked > high)
+            if outside.any():
+                if not clamp:
+                    first = int(numpy.argmax(outside.reshape(len(data_objects), -1).any(axis = 1)))
+                    cls._raise_outside(int(outside.sum()), prop_name, data_objects[first])
+
+                checked = numpy.clip(checked, low, high).astype(_DTYPES[typecode])
+
+            # NumPy scalars are converted to Python values, which Blender stores without changing the property's type
+            return checked.tolist()
+
+        rows = cls._to_rows(values, len(data_objects), length, typecode)
+        outside = 0
+        first = None
+        for index, (row, low, high) in enumerate(zip(rows, mins, maxs)):
+            items = [row] if length is None else row
+            if any(item < low or item > high for item in items):
+                outside += sum(1 for item in items if item < low or item > high)
+                first = index if first is None else first
+                if clamp:
+                    clamped = [_PYTHON_TYPES[typecode](min(max(item, low), high)) for item in items]
+                    rows[index] = clamped[0] if length is None else clamped
+
+        if outside and not clamp:
+            cls._raise_outside(outside, prop_name, data_objects[first])
+
+        return rows
+
+    @staticmethod
+    def _to_rows(values, count: int, length: int | None, typecode: str) -> list:
+        """Converts values to plain Python values, one row per data object for array properties."""
+        if hasattr(values, "tolist"):
+            # NumPy arrays, and array.array
+            values = values.tolist()
+
+        convert = _PYTHON_TYPES[typecode]
+        values = list(values)
+        if length is not None and len(values) == count * length and (not values or not hasattr(values[0], "__len__")):
+            # One concatenated sequence
+            values = [values[index:index + length] for index in range(0, len(values), length)]
+
+        if len(values) != count:
+            raise ValueError(f"Expected {count} values, got {len(values)}.")
+
+        if length is None:
+            return [convert(value) for value in values]
+
+        rows = [[convert(item) for item in row] for row in values]
+        if any(len(row) != length for row in rows):
+            raise ValueError(f"Expected rows of {length} items.")
+
+        return rows
+
+    @staticmethod
+    def _raise_outside(count: int, prop_name: str, data_object):
+        raise ValueError(
+            f"{count} values of '{prop_name}' are outside their min and max, e.g. for '{data_object.name}'. "
+            f"Pass clamp=True to clamp them."
+        )
+
+    @classmethod
+    def _get_numpy(cls):
+        """Gets the NumPy module, or None if it is not available."""
+        if cls._numpy is None:
+            try:
+                import numpy
+            except ImportError:
+                numpy = False
+
+            cls._numpy = numpy
+
+        return cls._numpy or None
\ No newline at end of file
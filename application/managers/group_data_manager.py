@@ -1,16 +1,41 @@
+import sys
+from typing import Iterable, Iterator
+
 import bpy
-import json
-from ...core import GroupData
+from .job_manager import JobManager
+from ..services import DataWalkerService, GroupDataStorageService, JsonGroupDataStorage
+from ...core import CacheStats, GroupData, GroupNameIndex, Job
 from ...shared import consts
-from ...shared.utils import StructuredLogger
+from ...shared.utils import SpanRecorder, StructuredLogger
 from ...shared.entities import LogLevel
 
 class GroupDataManager:
     logger = StructuredLogger(consts.MODULE_NAME)
-    _group_data_property_name: str = consts.CPM_SERIALIZED_GROUP_DATA
-    _cache: dict[str, GroupData] = {}
+    _storage: type[JsonGroupDataStorage] = JsonGroupDataStorage
+    _parse_executor: str = consts.ParseExecutors.AUTO
+    _cache: dict[int, GroupData] = {}
+    # Group data of linked and library override data. It is read-only and never serialized.
+    _linked_cache: dict[int, GroupData] = {}
+    _stats: CacheStats = CacheStats()
+    # Generation of each data object's group data, bumped whenever it may have changed. Generations are never reused, so
+    # state derived from group data stays invalid even after a memory address is reused.
+    _generations: dict[int, int] = {}
+    # Generation of each data object's property values, bumped whenever they may have changed, e.g. on every depsgraph
+    # update. Values changing does not change the group data, so state derived from it stays valid.
+    _value_generations: dict[int, int] = {}
+    _next_generation: int = 0
+    # Names of the groups of all data, for suggesting group names, and the names indexed per data object. The index is
+    # kept up to date by diffing the group names of a data object whenever its group data is loaded or saved. Once data
+    # was added or removed it is stale, and updated the next time it is searched. Undo clears it, so it is built again.
+    _group_names: GroupNameIndex = GroupNameIndex()
+    _indexed_groups: dict[int, frozenset[str]] = {}
+    _is_index_stale: bool = True
+    # Number of IDs in each of the `DATA_COLLECTIONS` when the index was built, to cheaply tell whether data was added
+    # or removed since
+    _indexed_id_counts: tuple[int, ...] = ()
 
     @classmethod
+    @SpanRecorder.timed("GroupDataManager.get_group_data")
     def get_group_data(cls, data_object: bpy.types.Object) -> GroupData:
         """
         Gets the group data for the provided blender object. Data is automatically
@@ -22,18 +47,23 @@ class GroupDataManager:
         """
         # Use an in-memory cache of group data keyed by data_object's unique identifier
         object_id = data_object.as_pointer()
+        cache = cls._cache if DataWalkerService.is_local(data_object) else cls._linked_cache
 
         # Return cached data if it exists
-        if object_id in cls._cache:
-            return cls._cache[object_id]
+        cached_data = cache.get(object_id)
+        if cached_data is not None:
+            cls._stats.hits += 1
+            return cached_data
 
         # Otherwise, load from the object and cache it
-        new_data = cls._load_json(data_object)
-        cls._cache[object_id] = new_data
+        cls._stats.misses += 1
+        new_data = cls._load_group_data(data_object)
+        cache[object_id] = new_data
 
         return new_data
 
     @classmethod
+    @SpanRecorder.timed("GroupDataManager.remove_property_group")
     def remove_property_group(cls, data_object: bpy.types.Object, group: str) -> bool:
         """
         Remove a property group from a Blender data object.
@@ -57,65 +87,555 @@ class GroupDataManager:
         if group in group_data:
             del group_data.cached_data[group]
             # Save updated group data back to the data object
-            data_object[cls._group_data_property_name] = json.dumps(group_data.as_dict())
+            cls.save_group_data(data_object)
 
             return True
 
         return False
 
     @classmethod
-    def _load_json(cls, data_object: bpy.types.Object) -> GroupData:
+    def move_property(cls, data_object: bpy.types.Object, prop_name: str, offset: int) -> bool:
         """
-        Loads the group data from a JSON string for the provided Blender object.
+        Moves a property within its group, switching the group to manual order.
 
-        :param data_object: The Blender object to get the group data for.
+        :param data_object: The Blender object the property belongs to.
+        :param prop_name: The name of the property to move.
+        :param offset: How many places to move the property, negative to move it up.
 
-        :return: The group data for the provided Blender object.
+        :return: True if the property was moved, False otherwise.
+        """
+        if not cls.get_group_data(data_object).move_property(prop_name, offset):
+            return False
+
+        cls.save_group_data(data_object)
+
+        return True
+
+    @classmethod
+    def set_group_order_mode(cls, data_object: bpy.types.Object, group: str, order_mode: str):
+        """
+        Sets how the properties of a group are ordered.
+
+        :param data_object: The Blender object the group belongs to.
+        :param group: The name of the group.
+        :param order_mode: One of the GroupOrderModes values.
+        """
+        cls.get_group_data(data_object).set_order_mode(group, order_mode)
+        cls.save_group_data(data_object)
+
+    @classmethod
+    def toggle_group_expanded(cls, data_object: bpy.types.Object, group: str):
+        """
+        Expands a collapsed group, or collapses an expanded one. The expand state is saved with the group data.
+
+        :param data_object: The Blender object the group belongs to.
+        :param group: The name of the group.
+        """
+        cls.get_group_data(data_object).toggle_group(group)
+        # What is drawn is derived from the expand state on every draw, so derived state stays valid
+        cls.save_group_data(data_object, invalidate = False)
+
+    @classmethod
+    def toggle_tree_expanded(cls, data_object: bpy.types.Object, tree_path: str):
+        """
+        Expands a collapsed node of a Python property's tree view, or collapses an expanded one. The expand state is
+        saved with the group data.
+
+        :param data_object: The Blender object the property belongs to.
+        :param tree_path: The path of the node, see `GroupData.get_tree_path`.
+        """
+        cls.get_group_data(data_object).toggle_tree(tree_path)
+        cls.save_group_data(data_object, invalidate = False)
+
+    @classmethod
+    def toggle_group_pinned(cls, data_object: bpy.types.Object, group: str):
+        """
+        Pins an unpinned group, or unpins a pinned one. The pin state is saved with the group data.
+
+        :param data_object: The Blender object the group belongs to.
+        :param group: The name of the group.
+        """
+        cls.get_group_data(data_object).toggle_pinned(group)
+        cls.save_group_data(data_object, invalidate = False)
+
+    @classmethod
+    @SpanRecorder.timed("GroupDataManager.save_group_data")
+    def save_group_data(cls, data_object: bpy.types.Object, invalidate: bool = True):
+        """
+        Writes the cached group data of the provided Blender object back to the object itself. Linked and library
+        override data is left untouched.
+
+        :param data_object: The Blender object to save the group data for.
+        :param invalidate: Whether to invalidate state derived from the group data. Only changes that no derived state
+        depends on, like expand state, can skip this.
         """
-        data_str = data_object.get(cls._group_data_property_name, "{}")
-        try:
-            group_data = json.loads(data_str)
-        except json.JSONDecodeError as e:
+        if invalidate:
+            cls.invalidate(data_object)
+
+        if not DataWalkerService.is_local(data_object):
             cls.logger.log(
-                level = LogLevel.ERROR,
-                message = "Could not load group data from JSON string",
+                level = LogLevel.DEBUG,
+                message = "Skipping save of group data for non-local data",
+                extra = {"data_object": data_object.name}
+            )
+
+            return
+
+        group_data = cls.get_group_data(data_object)
+        cls._index_group_names(data_object.as_pointer(), group_data.keys())
+        cls._storage.write(data_object, group_data.serialize())
+
+    @classmethod
+    def find_group_names(cls, prefix: str, limit: int = consts.GROUP_SEARCH_MAX_RESULTS) -> list[str]:
+        """
+        Finds the names of groups across the file starting with a prefix, ignoring case and surrounding whitespace.
+
+        :param prefix: The prefix, e.g. the group name typed so far.
+        :param limit: The maximum number of names to return.
+
+        :return: The matching group names, in sorted order.
+        """
+        if cls._is_index_stale:
+            cls._update_group_name_index()
+
+        return cls._group_names.search(prefix, limit)
+
+    @staticmethod
+    def on_group_search(operator_instance, context, edit_text: str) -> list[str]:
+        """Suggests existing group names while a group name is typed."""
+        return GroupDataManager.find_group_names(edit_text)
+
+    @classmethod
+    def set_storage(cls, storage_type: str):
+        """
+        Switches the backend group data is stored with. Group data already stored with another backend is migrated
+        the next time a file is loaded, or right away by calling `migrate_storage`.
+
+        :param storage_type: One of the GroupDataStorageTypes values.
+        """
+        cls._storage = GroupDataStorageService.get_storage(storage_type)
+
+    @classmethod
+    def set_parse_executor(cls, executor: str):
+        """
+        Sets how stored group data is parsed when all of it is loaded at once, e.g. when a file is loaded.
+
+        :param executor: One of the ParseExecutors values.
+        """
+        cls._parse_executor = executor
+
+    @classmethod
+    @SpanRecorder.timed("GroupDataManager.migrate_storage")
+    def migrate_storage(cls) -> int:
+        """
+        Moves group data stored with any other backend to the current backend. Must not be called from a draw
+        callback, since it writes to Blender data.
+
+        :return: The number of data objects whose group data was migrated.
+        """
+        other_storages = [
+            storage for storage in GroupDataStorageService.storages.values()
+            if storage is not cls._storage
+        ]
+
+        migrated = 0
+        for data_object in DataWalkerService.walk(local_only = True):
+            for storage in other_storages:
+                if storage.property_name not in data_object:
+                    continue
+
+                # Prefer data already stored with the current backend, which is the most recent
+                if cls._storage.property_name not in data_object:
+                    group_data = cls.get_group_data(data_object).serialize()
+                    cls._storage.write(data_object, group_data)
+
+                storage.remove(data_object)
+                migrated += 1
+
+        if migrated:
+            cls.logger.log(
+                level = LogLevel.INFO,
+                message = "Migrated group data storage",
                 extra = {
-                    "data_str": data_str,
-                    "json_decode_error": e
+                    "storage": cls._storage.__name__,
+                    "migrated": migrated
                 }
             )
 
-            group_data = {}
+        return migrated
+
+    @classmethod
+    def _load_group_data(cls, data_object: bpy.types.Object) -> GroupData:
+        """
+        Loads the group data for the provided Blender object. Group data that has not been migrated to the current
+        storage backend yet is read from the backend it was stored with.
+
+        :param data_object: The Blender object to get the group data for.
+
+        :return: The group data for the provided Blender object.
+        """
+        storage, raw = cls._read_raw(data_object)
 
-        new_data = GroupData(group_data = group_data)
-        new_data.verify(data_object)
+        return cls._create_group_data(data_object, None if raw is None else storage.parse(raw))
+
+    @classmethod
+    def _read_raw(cls, data_object: bpy.types.Object) -> tuple[type[JsonGroupDataStorage], object]:
+        """
+        Reads the stored group data of a Blender object without parsing it, preferring the current storage backend.
+
+        :param data_object: The Blender object to read from.
+
+        :return: The backend the group data was stored with, and the stored value or None if there is none.
+        """
+        raw = cls._storage.read_raw(data_object)
+        if raw is not None:
+            return cls._storage, raw
+
+        for storage in GroupDataStorageService.storages.values():
+            raw = storage.read_raw(data_object)
+            if raw is not None:
+                return storage, raw
+
+        return cls._storage, None
+
+    @classmethod
+    def _create_group_data(cls, data_object: bpy.types.Object, group_data: dict[str, list[str]] | None) -> GroupData:
+        """
+        Creates verified group data from parsed group data.
+
+        :param data_object: The Blender object the group data belongs to.
+        :param group_data: The parsed group data, or None if the object has no stored group data.
+
+        :return: The verified group data.
+        """
+        if group_data is None:
+            new_data = GroupData(group_data = {})
+        else:
+            cls._stats.parses += 1
+            new_data = GroupData.from_stored(group_data)
+
+        cls._stats.verify_prunes += new_data.verify(data_object)
+        cls._index_group_names(data_object.as_pointer(), new_data.keys())
 
         return new_data
 
     @classmethod
+    def _index_group_names(cls, object_id: int, group_names: Iterable[str]):
+        """
+        Updates the group name index with the groups of a data object. Only names added or removed since the data
+        object was last indexed are updated.
+
+        :param object_id: The memory address of the data object.
+        :param group_names: The names of the groups of the data object.
+        """
+        names = frozenset(group_names)
+        indexed = cls._indexed_groups.get(object_id, frozenset())
+        if names == indexed:
+            return
+
+        cls._group_names.remove(indexed - names)
+        cls._group_names.add(names - indexed)
+        cls._indexed_groups[object_id] = names
+
+    @classmethod
+    @SpanRecorder.timed("GroupDataManager._update_group_name_index")
+    def _update_group_name_index(cls):
+        """
+        Brings the group name index up to date with the data in the file. The names of data whose memory address is
+        gone are dropped, and data that is not indexed yet is indexed. Cached group data is used where available;
+        anything else is only read for its group names, without being verified or cached.
+        """
+        object_ids = set()
+        for data_object in DataWalkerService.walk():
+            object_id = data_object.as_pointer()
+            object_ids.add(object_id)
+            if object_id in cls._indexed_groups:
+                continue
+
+            group_data = cls._cache.get(object_id) or cls._linked_cache.get(object_id)
+            if group_data is None:
+                storage, raw = cls._read_raw(data_object)
+                if raw is None:
+                    continue
+
+                group_data = GroupData.from_stored(storage.parse(raw))
+
+            cls._index_group_names(object_id, group_data.keys())
+
+        for object_id in cls._indexed_groups.keys() - object_ids:
+            cls._group_names.remove(cls._indexed_groups.pop(object_id))
+
+        cls._indexed_id_counts = cls._get_id_counts()
+        cls._is_index_stale = False
+
+    @staticmethod
+    def _get_id_counts() -> tuple[int, ...]:
+        return tuple(len(getattr(bpy.data, collection_name, ())) for collection_name in consts.DATA_COLLECTIONS)
+
+    @classmethod
+    @SpanRecorder.timed("GroupDataManager.on_file_save")
     def on_file_save(cls):
         """
         Serializes grouping data for all Blender objects. The data is transformed into a string and stored as a custom
-        property on each Blender object.
+        property on each Blender object. Only local data is written; linked and library override data is skipped up
+        front, since it cannot be saved. Storage backends that write on every change skip this entirely.
         """
-        # If a cache exists, use it to update all objects
-        if not hasattr(cls, "_cache"):
-            all_objects = list(bpy.data.scenes) + list(bpy.data.objects)
-            for data_object in all_objects:
-                group_data = cls.get_group_data(data_object)
-                data_object[cls._group_data_property_name] = json.dumps(group_data.as_dict())
-
+        if not cls._storage.requires_save_pass:
             return
 
-        for object_id, group_data in cls._cache.items():
-            # Find the corresponding data_object
-            for data_object in list(bpy.data.scenes) + list(bpy.data.objects):
-                if data_object.as_pointer() == object_id:
-                    data_object[cls._group_data_property_name] = json.dumps(group_data.as_dict())
+        for data_object in DataWalkerService.walk(local_only = True):
+            group_data = cls._cache.get(data_object.as_pointer())
+            if group_data is None:
+                continue
+
+            # Avoid adding an empty property to data that never had any groups
+            if not group_data and cls._storage.property_name not in data_object:
+                continue
+
+            cls._storage.write(data_object, group_data.serialize())
 
     @classmethod
+    @SpanRecorder.timed("GroupDataManager.on_file_load")
     def on_file_load(cls):
-        """Run after the addon is enabled. Deserializes grouping data for all Blender objects."""
-        all_objects = list(bpy.data.scenes) + list(bpy.data.objects)
-        for data_object in all_objects:
-            cls._load_json(data_object)
\ No newline at end of file
+        """Run after a file is loaded. Deserializes grouping data for all Blender objects."""
+        # Memory addresses from the previous file are meaningless now
+        cls.clear_cache()
+        cls.warm_cache()
+        cls.migrate_storage()
+
+    @classmethod
+    @SpanRecorder.timed("GroupDataManager.warm_cache")
+    def warm_cache(cls, executor: str = None) -> int:
+        """
+        Loads the group data of all local data that has stored group data and is not cached yet, so it does not have
+        to be loaded while drawing. Group data of linked data is only loaded when it is first needed.
+
+        Loading is split in three phases: stored group data is read from all data in one sweep, parsed (in a pool when
+        there is enough of it), and finally verified and cached. Blender data is only accessed on the main thread.
+
+        :param executor: One of the ParseExecutors values. Defaults to the preferred executor.
+
+        :return: The number of data objects whose group data was loaded.
+        """
+        # Read the stored group data of all uncached data, grouped by the backend it was stored with
+        pending: dict[type[JsonGroupDataStorage], tuple[list, list]] = {}
+        for data_object in DataWalkerService.walk(local_only = True):
+            if data_object.as_pointer() in cls._cache:
+                continue
+
+            storage, raw = cls._read_raw(data_object)
+            if raw is None:
+                continue
+
+            data_objects, raw_values = pending.setdefault(storage, ([], []))
+            data_objects.append(data_object)
+            raw_values.append(raw)
+
+        loaded = 0
+        for storage, (data_objects, raw_values) in pending.items():
+            parsed = storage.parse_many(raw_values, executor or cls._parse_executor)
+
+            # Verify and cache the parsed group data
+            for data_object, group_data in zip(data_objects, parsed):
+                cls._cache[data_object.as_pointer()] = cls._create_group_data(data_object, group_data)
+                loaded += 1
+
+        return loaded
+
+    @classmethod
+    def get_generation(cls, data_object) -> int:
+        """
+        Gets the generation of the group data of a Blender object. State derived from the group data, like what a panel
+        draws, is valid as long as the generation is unchanged.
+
+        :param data_object: The Blender object to get the generation for.
+
+        :return: The generation.
+        """
+        object_id = data_object.as_pointer()
+        generation = cls._generations.get(object_id)
+        if generation is None:
+            generation = cls._generations[object_id] = cls._bump_generation()
+
+        return generation
+
+    @classmethod
+    def get_value_generation(cls, data_object) -> int:
+        """
+        Gets the generation of the property values of a Blender object. State derived from the values, like previews,
+        is valid as long as the generation is unchanged. It also changes whenever the group data generation does.
+
+        :param data_object: The Blender object to get the generation for.
+
+        :return: The generation.
+        """
+        object_id = data_object.as_pointer()
+        generation = cls._value_generations.get(object_id)
+        if generation is None:
+            generation = cls._value_generations[object_id] = cls._bump_generation()
+
+        return generation
+
+    @classmethod
+    def invalidate(cls, data_object):
+        """
+        Marks the group data of a Blender object as changed, invalidating state derived from it or from its values.
+
+        :param data_object: The Blender object whose group data changed.
+        """
+        object_id = data_object.as_pointer()
+        cls._generations[object_id] = cls._bump_generation()
+        cls._value_generations[object_id] = cls._bump_generation()
+
+    @classmethod
+    @SpanRecorder.timed("GroupDataManager.reconcile")
+    def reconcile(cls, data_ids: Iterable) -> int:
+        """
+        Verifies the cached group data of updated IDs and the data nested in them, removing entries of properties that
+        were removed outside CPM, e.g. by Blender's own remove button or by scripts. Only data whose group data is
+        cached is verified; anything else is verified when it is first loaded. The cost is proportional to the number
+        of updated IDs, not to the size of the file.
+
+        Updates only invalidate the values of the data. Its group data is only invalidated if stale entries were
+        removed, so editing values or playing back animation keeps draw models, list views and search results. Draw
+        models compare property names themselves, so properties added outside CPM are still picked up.
+
+        :param data_ids: The updated IDs.
+
+        :return: The number of stale entries that were removed.
+        """
+        if not cls._is_index_stale and cls._get_id_counts() != cls._indexed_id_counts:
+            # Data was added or removed, e.g. by deleting objects or purging materials, which updates do not report
+            cls._is_index_stale = True
+
+        pruned = 0
+        for data_id in data_ids:
+            for data_object in DataWalkerService.walk_owned(data_id):
+                object_id = data_object.as_pointer()
+                if object_id in cls._value_generations:
+                    cls._value_generations[object_id] = cls._bump_generation()
+
+                group_data = cls._cache.get(object_id) or cls._linked_cache.get(object_id)
+                if group_data is None:
+                    continue
+
+                # Saving invalidates the group data
+                stale = group_data.verify(data_object)
+                if stale:
+                    cls._stats.verify_prunes += stale
+                    pruned += stale
+                    cls.save_group_data(data_object)
+
+        if pruned:
+            cls.logger.log(
+                level = LogLevel.DEBUG,
+                message = "Reconciled group data",
+                extra = {"pruned": pruned}
+            )
+
+        return pruned
+
+    @classmethod
+    def schedule_verify_all(cls) -> Job:
+        """
+        Verifies the group data of all local data in a background job, removing stale entries. Large files stay
+        responsive while this runs.
+
+        :return: The queued job.
+        """
+        data_objects = list(DataWalkerService.walk(local_only = True))
+
+        return JobManager.submit(
+            name = consts.VERIFY_ALL_JOB_NAME,
+            steps = cls._verify_all_steps(data_objects),
+            total = len(data_objects)
+        )
+
+    @classmethod
+    def _verify_all_steps(cls, data_objects: list) -> Iterator[int]:
+        """
+        Job steps verifying the group data of one data object each.
+
+        :param data_objects: The data objects to verify, collected when the job was submitted.
+
+        :return: A generator yielding the number of data objects verified so far.
+        """
+        pruned = 0
+        for index, data_object in enumerate(data_objects, start = 1):
+            try:
+                group_data = cls._cache.get(data_object.as_pointer())
+                if group_data is None:
+                    # Loading verifies the group data without saving it, so count what loading removed
+                    prunes = cls._stats.verify_prunes
+                    cls.get_group_data(data_object)
+                    stale = cls._stats.verify_prunes - prunes
+                else:
+                    stale = group_data.verify(data_object)
+                    cls._stats.verify_prunes += stale
+
+                if stale:
+                    pruned += stale
+                    cls.save_group_data(data_object)
+            except ReferenceError:
+                # The data was removed while the job was running
+                pass
+
+            yield index
+
+        cls.logger.log(
+            level = LogLevel.INFO,
+            message = "Verified group data",
+            extra = {"data_objects": len(data_objects), "pruned": pruned}
+        )
+
+    @classmethod
+    @SpanRecorder.timed("GroupDataManager.on_undo_redo")
+    def on_undo_redo(cls):
+        """Run after an undo or redo step. Group data is restored with the data it is stored on, so reload it."""
+        cls.clear_cache()
+
+    @classmethod
+    def clear_cache(cls):
+        """Drops all cached group data, so it is read from Blender data again when it is next needed."""
+        cls._stats.evictions += len(cls._cache) + len(cls._linked_cache)
+        cls._cache.clear()
+        cls._linked_cache.clear()
+        cls._generations.clear()
+        cls._value_generations.clear()
+        cls._group_names.clear()
+        cls._indexed_groups.clear()
+        cls._is_index_stale = True
+
+    @classmethod
+    def _bump_generation(cls) -> int:
+        cls._next_generation += 1
+
+        return cls._next_generation
+
+    @classmethod
+    def get_cache_stats(cls, include_memory: bool = True) -> dict[str, int]:
+        """
+        Gets the activity counters of the group data cache since they were last reset, along with its current size.
+
+        :param include_memory: Whether to estimate the memory used by the cached group data. This walks all cached
+        data, so it is best left out when polling frequently.
+
+        :return: The counters (hits, misses, parses, verify_prunes, evictions), the number of cached local and linked
+        entries and, if requested, the estimated memory footprint in bytes.
+        """
+        stats = cls._stats.as_dict()
+        stats["entries"] = len(cls._cache)
+        stats["linked_entries"] = len(cls._linked_cache)
+        if include_memory:
+            stats["memory_bytes"] = (
+                sys.getsizeof(cls._cache) + sys.getsizeof(cls._linked_cache)
+                + sum(group_data.get_memory_size() for group_data in cls._cache.values())
+                + sum(group_data.get_memory_size() for group_data in cls._linked_cache.values())
+            )
+
+        return stats
+
+    @classmethod
+    def reset_cache_stats(cls):
+        """Resets the activity counters of the group data cache."""
+        cls._stats.reset()
@@ -0,0 +1,192 @@
+import time
+from collections import deque
+from typing import Callable, Iterator, Optional
+
+import bpy
+
+from ...core import Job
+from ...shared import consts
+from ...shared.utils import StructuredLogger
+from ...shared.entities import LogLevel
+
+class JobManager:
+    """
+    Runs long jobs cooperatively on a `bpy.app.timers` timer, so Blender stays responsive while they run. A job is a
+    generator that does one step of work per `next()` and yields the number of steps completed so far. Every tick runs
+    steps of the oldest job until the time budget is used up; jobs run one after another in the order they were
+    submitted.
+
+    Timers don't run in background mode, so jobs submitted there run to completion right away.
+    """
+    logger = StructuredLogger(consts.MODULE_NAME)
+    _queue: deque[Job] = deque()
+
+    @classmethod
+    def submit(cls, name: str, steps: Iterator[int], total: int,
+               on_finish: Optional[Callable[[Job], None]] = None) -> Job:
+        """
+        Queue a job.
+
+        :param name: A name for the job, shown in the interface and in logs.
+        :param steps: A generator that yields the number of steps completed so far after each step.
+        :param total: The number of steps the job takes, used to report progress.
+        :param on_finish: Called with the job once it finished, failed or was cancelled.
+
+        :return: The queued job.
+        """
+        job = Job(name = name, steps = steps, total = total, on_finish = on_finish)
+        cls.logger.log(
+            level = LogLevel.DEBUG,
+            message = "Submitting job",
+            extra = {"job": name, "total": total}
+        )
+
+        if bpy.app.background:
+            cls._start(job)
+            cls._run(job, budget = None)
+
+            return job
+
+        cls._queue.append(job)
+        if not bpy.app.timers.is_registered(cls._tick):
+            bpy.app.timers.register(cls._tick, first_interval = consts.JOB_TICK_INTERVAL)
+
+        return job
+
+    @classmethod
+    def cancel(cls, job: Optional[Job] = None):
+        """
+        Cancel a job, or all jobs. Work a cancelled job has already done is kept.
+
+        :param job: The job to cancel. Cancels every queued job if omitted.
+        """
+        jobs = list(cls._queue) if job is None else [job]
+        for cancelled_job in jobs:
+            if cancelled_job.finished:
+                continue
+
+            cancelled_job.cancelled = True
+            cancelled_job.steps.close()
+            cls._finish(cancelled_job)
+
+        if not cls._queue and bpy.app.timers.is_registered(cls._tick):
+            bpy.app.timers.unregister(cls._tick)
+
+    @classmethod
+    def get_jobs(cls) -> list[Job]:
+        """
+        :return: The queued jobs, the running job first.
+        """
+        return list(cls._queue)
+
+    @classmethod
+    def is_running(cls, name: str) -> bool:
+        """
+        :param name: The name of the job.
+
+        :return: True if a job with the given name is queued, False otherwise.
+        """
+        return any(job.name == name for job in cls._queue)
+
+    @classmethod
+    def _tick(cls) -> Optional[float]:
+        """Timer callback that runs queued jobs until the time budget is used up."""
+        deadline = time.perf_counter() + consts.JOB_TIME_BUDGET
+        while cls._queue:
+            job = cls._queue[0]
+            if not job.started:
+                cls._start(job)
+
+            if not cls._run(job, budget = deadline):
+                # Out of time, continue with the same job next tick
+                cls._update_progress(job)
+                break
+
+        # Returning None unregisters the timer once the queue is empty
+        return consts.JOB_TICK_INTERVAL if cls._queue else None
+
+    @classmethod
+    def _start(cls, job: Job):
+        job.started = True
+        window_manager = cls._get_window_manager()
+        if window_manager is not None:
+            window_manager.progress_begin(0, max(job.total, 1))
+
+    @classmethod
+    def _run(cls, job: Job, budget: Optional[float]) -> bool:
+        """
+        Run steps of a job.
+
+        :param job: The job to run.
+        :param budget: The `time.perf_counter()` value to stop at, or None to run the job to completion.
+
+        :return: True if the job is done, False if it ran out of time.
+        """
+        start = time.perf_counter()
+        try:
+            for job.progress in job.steps:
+                if budget is not None and time.perf_counter() >= budget:
+                    job.elapsed += time.perf_counter() - start
+                    return False
+        except Exception as e:
+            job.error = str(e)
+            cls.logger.log(
+                level = LogLevel.ERROR,
+                message = "Job failed",
+                extra = {"job": job.name, "progress": job.progress, "error": job.error}
+            )
+
+        job.elapsed += time.perf_counter() - start
+        cls._finish(job)
+
+        return True
+
+    @classmethod
+    def _finish(cls, job: Job):
+        job.finished = True
+        if job in cls._queue:
+            cls._queue.remove(job)
+
+        window_manager = cls._get_window_manager()
+        if job.started and window_manager is not None:
+            window_manager.progress_end()
+
+        cls.logger.log(
+            level = LogLevel.INFO,
+            message = "Job cancelled" if job.cancelled else "Job finished",
+            extra = {
+                "job": job.name,
+                "progress": job.progress,
+                "total": job.total,
+                "elapsed_ms": round(job.elapsed * 1000, 2)
+            }
+        )
+
+        if job.on_finish is not None:
+            job.on_finish(job)
+
+        cls._tag_redraw()
+
+    @classmethod
+    def _update_progress(cls, job: Job):
+        window_manager = cls._get_window_manager()
+        if window_manager is not None:
+            window_manager.progress_update(job.progress)
+
+        cls._tag_redraw()
+
+    @staticmethod
+    def _get_window_manager():
+        return getattr(bpy.context, "window_manager", None)
+
+    @staticmethod
+    def _tag_redraw():
+        """Redraw the areas that show job status, e.g. the preferences."""
+        window_manager = getattr(bpy.context, "window_manager", None)
+        if window_manager is None:
+            return
+
+        for window in window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'PREFERENCES':
+                    area.tag_redraw()
\ No newline at end of file
@@ -1,7 +1,27 @@
+from .group_data_manager import GroupDataManager
+from ...core import list_view_panels
 from ...shared import consts
-from ...shared.utils import StructuredLogger
+from ...shared.utils import SpanRecorder, StructuredLogger
 
 class PreferencesManager:
     @staticmethod
     def on_log_level_update(cpm_preferences, context):
-        StructuredLogger(consts.MODULE_NAME, int(cpm_preferences.log_level))
\ No newline at end of file
+        StructuredLogger(consts.MODULE_NAME, int(cpm_preferences.log_level))
+
+    @staticmethod
+    def on_group_data_storage_update(cpm_preferences, context):
+        GroupDataManager.set_storage(cpm_preferences.group_data_storage)
+        GroupDataManager.migrate_storage()
+
+    @staticmethod
+    def on_group_data_parsing_update(cpm_preferences, context):
+        GroupDataManager.set_parse_executor(cpm_preferences.group_data_parsing)
+
+    @staticmethod
+    def on_list_view_panels_update(cpm_preferences, context):
+        list_view_panels.clear()
+        list_view_panels.update(cpm_preferences.list_view_panels)
+
+    @staticmethod
+    def on_record_timings_update(cpm_preferences, context):
+        SpanRecorder.set_enabled(cpm_preferences.record_timings)
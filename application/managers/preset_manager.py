@@ -0,0 +1,308 @@
+import json
+import os
+import re
+from typing import Any
+
+from .property_data_manager import PropertyDataManager
+from ...core import PropertyPreset, PropertySnapshot, UIData
+from ...shared import consts, utils
+from ...shared.entities import LogLevel
+from ...shared.utils import StructuredLogger
+
+class PresetManager:
+    """
+    Manages the property preset library. Presets are stored as JSON files in the add-on's configuration directory:
+
+        {
+            "name": "Anim Controls",
+            "properties": [
+                {"name": "blink", "type": "FLOAT", "group": "Face", "value": 0.0, "ui_data": {"max": 1.0}},
+                ...
+            ]
+        }
+
+    Each file is parsed and compiled once. Compiled presets are only rebuilt when their file changes on disk.
+    """
+    logger = StructuredLogger(consts.MODULE_NAME)
+    property_data_manager = PropertyDataManager
+    _presets: dict[str, PropertyPreset] = {}
+    _file_cache: dict[str, tuple[float, PropertyPreset]] = {}
+    _enum_items: list[tuple[str, str, str]] = []
+
+    @classmethod
+    def get_presets_dir(cls) -> str:
+        """Get the directory presets are stored in."""
+        return utils.get_user_config_dir(consts.PRESETS_DIR)
+
+    @classmethod
+    def load_presets(cls) -> dict[str, PropertyPreset]:
+        """
+        Scan the preset directory and compile any preset that is new or has changed since it was last compiled.
+
+        :return: The compiled presets, keyed by preset name.
+        """
+        presets_dir = cls.get_presets_dir()
+        presets = {}
+        file_cache = {}
+        for file_name in sorted(os.listdir(presets_dir)):
+            if not file_name.endswith(consts.PRESET_FILE_EXTENSION):
+                continue
+
+            file_path = os.path.join(presets_dir, file_name)
+            modified_time = os.path.getmtime(file_path)
+            cached = cls._file_cache.get(file_path)
+            if cached is not None and cached[0] == modified_time:
+                preset = cached[1]
+            else:
+                preset = cls._load_preset_file(file_path)
+                if preset is None:
+                    continue
+
+            file_cache[file_path] = (modified_time, preset)
+            presets[preset.name] = preset
+
+        cls._file_cache = file_cache
+        cls._presets = presets
+        cls._enum_items = [
+            (name, name, f"{len(preset)} properties")
+            for name, preset in presets.items()
+        ]
+
+        return presets
+
+    @classmethod
+    def get_preset(cls, name: str) -> PropertyPreset | None:
+        """
+        Get a compiled preset by name.
+
+        :param name: The name of the preset.
+
+        :return: The compiled preset, or None if there is no such preset.
+        """
+        return cls._presets.get(name)
+
+    @classmethod
+    def get_preset_items(cls, _operator, _context) -> list[tuple[str, str, str]]:
+        """Enum items callback listing the loaded presets."""
+        # Blender requires the returned strings to stay referenced, so the list is kept on the class
+        return cls._enum_items
+
+    @classmethod
+    def apply_preset(cls, preset: PropertyPreset, data_objects: list, mode: str) -> int:
+        """
+        Apply a compiled preset to many Blender data objects.
+
+        :param preset: The compiled preset to apply.
+        :param data_objects: The Blender data objects to apply the preset to.
+        :param mode: One of the CopyModes values, deciding what happens to properties that already exist.
+
+        :return: The number of data objects the preset was applied to.
+        """
+        cls.logger.log(
+            level = LogLevel.DEBUG,
+            message = "Applying preset",
+            extra = {
+                "preset": preset.name,
+                "targets": len(data_objects),
+                "mode": mode
+            }
+        )
+
+        for data_object in data_objects:
+            cls.property_data_manager.apply_snapshots(data_object, preset.snapshots, mode)
+
+        return len(data_objects)
+
+    @classmethod
+    def save_preset(cls, name: str, snapshots: list[PropertySnapshot]) -> str:
+        """
+        Save property snapshots as a new preset, replacing any preset with the same file name.
+
+        :param name: The name of the preset.
+        :param snapshots: The property snapshots the preset consists of.
+
+        :return: The path of the written preset file.
+        """
+        properties = []
+        for snapshot in snapshots:
+            try:
+                prop_type = cls._get_snapshot_type(snapshot)
+            except TypeError:
+                # Data-blocks and other references cannot be stored in a preset
+                cls.logger.log(
+                    level = LogLevel.WARNING,
+                    message = "Skipping property that cannot be stored in a preset",
+                    extra = {"preset": name, "property": snapshot.name}
+                )
+
+                continue
+
+            properties.append({
+                "name": snapshot.name,
+                "type": prop_type,
+                "group": snapshot.group,
+                "value": snapshot.value,
+                "ui_data": dict(snapshot.ui_data)
+            })
+
+        file_name = re.sub(r"[^\w\- ]", "_", name).strip() or "preset"
+        file_path = os.path.join(cls.get_presets_dir(), file_name + consts.PRESET_FILE_EXTENSION)
+        with open(file_path, "w", encoding = "utf-8") as file:
+            json.dump({"name": name, "properties": properties}, file, indent = 4)
+
+        cls.load_presets()
+
+        return file_path
+
+    @classmethod
+    def compile_preset(cls, preset_data: dict, file_path: str = "") -> PropertyPreset:
+        """
+        Compile a parsed preset into snapshots. Missing values and UI data are filled in from the defaults of each
+        property's type.
+
+        :param preset_data: The parsed preset.
+        :param file_path: The file the preset was loaded from, if any.
+
+        :return: The compiled preset.
+        """
+        snapshots = []
+        for prop_data in preset_data.get("properties", []):
+            prop_type = prop_data.get("type", consts.PropertyTypes.FLOAT)
+            if prop_type not in _TYPE_DEFAULTS:
+                cls.logger.log(
+                    level = LogLevel.ERROR,
+                    message = "Unsupported property type in preset",
+                    extra = {
+                        "preset": preset_data.get("name"),
+                        "property": prop_data.get("name"),
+                        "property_type": prop_type
+                    }
+                )
+
+                continue
+
+            default_value, default_ui_data, cast_type = _TYPE_DEFAULTS[prop_type]
+            ui_data_overrides = prop_data.get("ui_data", {})
+            ui_data = UIData(**{**default_ui_data, **ui_data_overrides})
+            value = prop_data.get("value", ui_data.get("default", default_value))
+            value = [cast_type(v) for v in value] if isinstance(value, list) else cast_type(value)
+            if "default" in default_ui_data and "default" not in ui_data_overrides:
+                # Without an explicit default, the preset's value becomes the default
+                ui_data["default"] = value
+
+            snapshots.append(PropertySnapshot(
+                name = prop_data["name"],
+                value = value,
+                ui_data = ui_data,
+                group = prop_data.get("group", "")
+            ))
+
+        return PropertyPreset(
+            name = preset_data.get("name") or os.path.splitext(os.path.basename(file_path))[0],
+            snapshots = tuple(snapshots),
+            file_path = file_path
+        )
+
+    @classmethod
+    def _load_preset_file(cls, file_path: str) -> PropertyPreset | None:
+        try:
+            with open(file_path, encoding = "utf-8") as file:
+                preset_data = json.load(file)
+
+            return cls.compile_preset(preset_data, file_path)
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            cls.logger.log(
+                level = LogLevel.ERROR,
+                message = "Could not load preset",
+                extra = {
+                    "file_path": file_path,
+                    "error": str(e)
+                }
+            )
+
+            return None
+
+    @staticmethod
+    def _get_snapshot_type(snapshot: PropertySnapshot) -> str:
+        value = snapshot.value
+        match value:
+            case bool():
+                return consts.PropertyTypes.BOOL
+            case int():
+                return consts.PropertyTypes.INT
+            case float():
+                return consts.PropertyTypes.FLOAT
+            case str():
+                return consts.PropertyTypes.STRING
+            case dict():
+                return consts.PropertyTypes.PYTHON
+            case [bool(), *_]:
+                return consts.PropertyTypes.BOOL_ARRAY
+            case [int(), *_] if not any(isinstance(v, float) for v in value):
+                return consts.PropertyTypes.INT_ARRAY
+            case [int() | float(), *_]:
+                return consts.PropertyTypes.FLOAT_ARRAY
+
+        raise TypeError(f"Unsupported preset value: {type(value).__name__}")
+
+def _identity(value: Any) -> Any:
+    return value
+
+# Default value, default UI data and value cast for each property type a preset can contain
+_TYPE_DEFAULTS: dict[str, tuple[Any, UIData, Any]] = {
+    consts.PropertyTypes.FLOAT: (consts.DEFAULT_VALUE_FLOAT, UIData(
+        subtype = consts.DEFAULT_SUBTYPE,
+        description = consts.DEFAULT_DESCRIPTION,
+        min = consts.DEFAULT_MIN_FLOAT,
+        max = consts.DEFAULT_MAX_FLOAT,
+        soft_min = consts.DEFAULT_SOFT_MIN_FLOAT,
+        soft_max = consts.DEFAULT_SOFT_MAX_FLOAT,
+        step = consts.DEFAULT_STEP_FLOAT,
+        precision = consts.DEFAULT_PRECISION_FLOAT,
+        default = consts.DEFAULT_VALUE_FLOAT
+    ), float),
+    consts.PropertyTypes.FLOAT_ARRAY: (consts.DEFAULT_FLOAT_ARRAY, UIData(
+        subtype = consts.DEFAULT_SUBTYPE,
+        description = consts.DEFAULT_DESCRIPTION,
+        min = consts.DEFAULT_MIN_FLOAT_ARRAY,
+        max = consts.DEFAULT_MAX_FLOAT_ARRAY,
+        soft_min = consts.DEFAULT_SOFT_MIN_FLOAT_ARRAY,
+        soft_max = consts.DEFAULT_SOFT_MAX_FLOAT_ARRAY,
+        step = consts.DEFAULT_STEP_FLOAT_ARRAY,
+        precision = consts.DEFAULT_PRECISION_FLOAT_ARRAY,
+        default = consts.DEFAULT_FLOAT_ARRAY
+    ), float),
+    consts.PropertyTypes.INT: (consts.DEFAULT_VALUE_INT, UIData(
+        subtype = consts.DEFAULT_SUBTYPE,
+        description = consts.DEFAULT_DESCRIPTION,
+        min = consts.DEFAULT_MIN_INT,
+        max = consts.DEFAULT_MAX_INT,
+        soft_min = consts.DEFAULT_SOFT_MIN_INT,
+        soft_max = consts.DEFAULT_SOFT_MAX_INT,
+        step = consts.DEFAULT_STEP_INT,
+        default = consts.DEFAULT_VALUE_INT
+    ), int),
+    consts.PropertyTypes.INT_ARRAY: (consts.DEFAULT_INT_ARRAY, UIData(
+        subtype = consts.DEFAULT_SUBTYPE,
+        description = consts.DEFAULT_DESCRIPTION,
+        min = consts.DEFAULT_MIN_INT_ARRAY,
+        max = consts.DEFAULT_MAX_INT_ARRAY,
+        soft_min = consts.DEFAULT_SOFT_MIN_INT_ARRAY,
+        soft_max = consts.DEFAULT_SOFT_MAX_INT_ARRAY,
+        step = consts.DEFAULT_STEP_INT_ARRAY,
+        default = consts.DEFAULT_INT_ARRAY
+    ), int),
+    consts.PropertyTypes.BOOL: (consts.DEFAULT_VALUE_BOOL, UIData(
+        description = consts.DEFAULT_DESCRIPTION,
+        default = consts.DEFAULT_VALUE_BOOL
+    ), bool),
+    consts.PropertyTypes.BOOL_ARRAY: (consts.DEFAULT_BOOL_ARRAY, UIData(
+        description = consts.DEFAULT_DESCRIPTION,
+        default = consts.DEFAULT_BOOL_ARRAY
+    ), bool),
+    consts.PropertyTypes.STRING: (consts.DEFAULT_VALUE_STRING, UIData(
+        description = consts.DEFAULT_DESCRIPTION,
+        default = consts.DEFAULT_VALUE_STRING
+    ), str),
+    consts.PropertyTypes.PYTHON: ({}, UIData(), _identity),
+}
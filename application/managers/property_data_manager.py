@@ -3,8 +3,8 @@ from typing import Union
 import bpy
 
 from .group_data_manager import GroupDataManager
-from ..services import PropertyTypeService, UIDataService
-from ...core import Field, FieldNames
+from ..services import DataWalkerService, PropertyTypeService, UIDataService
+from ...core import Field, FieldNames, PropertySnapshot, UIData
 from ...shared import consts, utils
 from ...shared.entities import LogLevel
 from ...shared.utils import StructuredLogger
@@ -128,6 +128,163 @@ class PropertyDataManager:
             extra = {**new_data}
         )
 
+    @classmethod
+    def snapshot_properties(cls, data_object) -> list[PropertySnapshot]:
+        """
+        Take a detached copy of every public custom property on a Blender data object, including its UI data and
+        group membership. The snapshot can be applied to any number of other data objects afterward.
+
+        :param data_object: The Blender data object to take the snapshot from.
+
+        :return: A snapshot of each property.
+        """
+        cls.logger.log(
+            level = LogLevel.DEBUG,
+            message = "Taking snapshot of properties",
+            extra = {"data_object": data_object.name}
+        )
+
+        property_groups = GroupDataManager.get_group_data(data_object).get_property_groups()
+        snapshots = []
+        for prop_name in data_object.keys():
+            if prop_name.startswith("_"):
+                # Skip private properties, including CPM's own serialized data
+                continue
+
+            value = data_object[prop_name]
+            if type(value).__name__ == consts.PropertyTypes.ID_PROPERTY_GROUP:
+                # PYTHON types have no UI data
+                ui_data = UIData()
+            else:
+                ui_data = UIData(**data_object.id_properties_ui(prop_name).as_dict())
+
+            snapshots.append(PropertySnapshot(
+                name = prop_name,
+                value = cls._copy_value(value),
+                ui_data = ui_data,
+                group = property_groups.get(prop_name, "")
+            ))
+
+        return snapshots
+
+    @classmethod
+    def apply_snapshots(cls, data_object, snapshots: list[PropertySnapshot], mode: str) -> int:
+        """
+        Apply property snapshots to a Blender data object. The object's group data is saved once, after all
+        snapshots have been applied.
+
+        :param data_object: The Blender data object to apply the snapshots to.
+        :param snapshots: The property snapshots to apply.
+        :param mode: One of the CopyModes values, deciding what happens to properties that already exist.
+
+        :return: The number of snapshots that were applied.
+        """
+        applied = 0
+        group_assignments = {}
+        for snapshot in snapshots:
+            exists = snapshot.name in data_object
+            if exists and mode == consts.CopyModes.SKIP:
+                continue
+
+            applied += 1
+
+            if not exists or mode == consts.CopyModes.OVERWRITE:
+                data_object[snapshot.name] = snapshot.value
+
+            if snapshot.ui_data:
+                try:
+                    data_object.id_properties_ui(snapshot.name).update(**snapshot.ui_data)
+                except (TypeError, ValueError) as e:
+                    # Merged properties may keep a type the UI data does not fit
+                    cls.logger.log(
+                        level = LogLevel.WARNING,
+                        message = "Could not apply UI data to property",
+                        extra = {
+                            "data_object": data_object.name,
+                            "property": snapshot.name,
+                            "error": str(e)
+                        }
+                    )
+
+            if mode != consts.CopyModes.MERGE or snapshot.group:
+                group_assignments[snapshot.name] = snapshot.group
+
+        if group_assignments:
+            GroupDataManager.get_group_data(data_object).assign_groups(group_assignments)
+            GroupDataManager.save_group_data(data_object)
+
+        cls.logger.log(
+            level = LogLevel.DEBUG,
+            message = "Applied property snapshots",
+            extra = {
+                "data_object": data_object.name,
+                "mode": mode,
+                "applied": applied
+            }
+        )
+
+        return applied
+
+    @classmethod
+    def set_value(cls, data_object, prop_name: str, value) -> bool:
+        """
+        Set the value of an existing FLOAT, INT, BOOL or STRING property, keeping its type, UI data and group. Numbers
+        are clamped to the property's min and max.
+
+        :param data_object: The Blender data object the property belongs to.
+        :param prop_name: The name of the property.
+        :param value: The new value, converted to the property's type.
+
+        :return: True if the value was set, False if the property is missing, not local or not of a scalar type.
+        """
+        if prop_name not in data_object or not DataWalkerService.is_local(data_object):
+            return False
+
+        prop_type = cls.property_type_service.get_property_type(data_object, prop_name)
+        converters = {
+            consts.PropertyTypes.FLOAT: float,
+            consts.PropertyTypes.INT: int,
+            consts.PropertyTypes.BOOL: bool,
+            consts.PropertyTypes.STRING: str
+        }
+        if prop_type not in converters:
+            cls.logger.log(
+                level = LogLevel.WARNING,
+                message = "Cannot set value of non-scalar property",
+                extra = {"data_object": data_object.name, "property": prop_name, "type": prop_type}
+            )
+
+            return False
+
+        value = converters[prop_type](value)
+        if prop_type in (consts.PropertyTypes.FLOAT, consts.PropertyTypes.INT):
+            ui_data = data_object.id_properties_ui(prop_name).as_dict()
+            if "min" in ui_data:
+                value = max(value, ui_data["min"])
+            if "max" in ui_data:
+                value = min(value, ui_data["max"])
+
+        data_object[prop_name] = value
+
+        cls.logger.log(
+            level = LogLevel.DEBUG,
+            message = "Property value set",
+            extra = {"data_object": data_object.name, "property": prop_name}
+        )
+
+        return True
+
+    @staticmethod
+    def _copy_value(value):
+        """Detach a property value from its owner so it can be assigned elsewhere."""
+        if hasattr(value, "to_dict"):
+            return value.to_dict()
+
+        if hasattr(value, "to_list"):
+            return value.to_list()
+
+        return value
+
     @classmethod
     def _update_array_length(cls, operator_instance) -> Union[None, int]:
         """Resize the array when length changes"""
@@ -302,6 +459,7 @@ class PropertyDataManager:
             prop_name = old_name,
             new_name = new_name
         )
+        GroupDataManager.save_group_data(data_object)
 
         # Update the property name in the data object
         update_data_object_prop_name()
@@ -354,6 +512,7 @@ class PropertyDataManager:
             prop_name = operator_instance.name,
             new_group = operator_instance.group
         )
+        GroupDataManager.save_group_data(data_object)
 
         # Log method exit
         cls.logger.log(
@@ -0,0 +1,156 @@
+from typing import Iterable
+
+import bpy
+
+from ..services import PreviewService
+from ...core import PropertyTable
+from ...shared import consts, utils
+from ...shared.entities import LogLevel
+from ...shared.utils import SpanRecorder, StructuredLogger
+
+class PropertyTableManager:
+    """
+    Keeps the property table, a columnar cache of the custom property values of all objects, in sync with Blender data.
+    A column is read in one sweep over `bpy.data.objects` when it is added or the objects changed, while single rows are
+    refreshed as depsgraph updates report changed objects.
+    """
+    logger = StructuredLogger(consts.MODULE_NAME)
+    table: PropertyTable = PropertyTable()
+    # Names of the public custom properties of all objects, offered when adding a column
+    property_names: set[str] = set()
+    _is_dirty: bool = True
+
+    @classmethod
+    def get_table(cls) -> PropertyTable:
+        """
+        Gets the property table, reading it again first if objects were added, removed or renamed. Reading only touches
+        Blender data, so this can be done while drawing.
+
+        :return: The property table.
+        """
+        if cls._is_dirty or len(bpy.data.objects) != len(cls.table.row_names):
+            cls.rebuild()
+
+        return cls.table
+
+    @classmethod
+    @SpanRecorder.timed("PropertyTableManager.rebuild")
+    def rebuild(cls):
+        """Reads the rows and every column of the table again."""
+        objects = list(bpy.data.objects)
+        cls.table.set_rows(
+            [data_object.name for data_object in objects],
+            [utils.get_data_path(data_object) for data_object in objects]
+        )
+        cls.property_names = {
+            prop_name
+            for data_object in objects
+            for prop_name in data_object.keys()
+            if not prop_name.startswith("_")
+        }
+        for column in list(cls.table.values):
+            cls._read_column(column, objects)
+
+        cls._is_dirty = False
+
+        cls.logger.log(
+            level = LogLevel.DEBUG,
+            message = "Rebuilt property table",
+            extra = {"rows": len(objects), "columns": len(cls.table.values)}
+        )
+
+    @classmethod
+    def add_column(cls, prop_name: str) -> bool:
+        """
+        Adds a column showing a property.
+
+        :param prop_name: The name of the property.
+
+        :return: True if the column was added, False if the table already has it.
+        """
+        table = cls.get_table()
+        if prop_name in table.values:
+            return False
+
+        cls._read_column(prop_name, list(bpy.data.objects))
+
+        return True
+
+    @classmethod
+    def remove_column(cls, prop_name: str):
+        cls.table.remove_column(prop_name)
+
+    @classmethod
+    def refresh(cls, data_ids: Iterable) -> int:
+        """
+        Refreshes the rows of updated objects. Objects the table does not know yet make it read everything again the
+        next time it is needed.
+
+        :param data_ids: The updated IDs.
+
+        :return: The number of cells whose value changed.
+        """
+        if cls._is_dirty or not cls.table.values:
+            # Nothing is shown, or everything is read again anyway
+            return 0
+
+        changed = 0
+        for data_id in data_ids:
+            if not isinstance(data_id, bpy.types.Object):
+                continue
+
+            row = cls.table.get_row(utils.get_data_path(data_id))
+            if row is None:
+                # Added or renamed
+                cls._is_dirty = True
+                return changed
+
+            changed += cls.refresh_row(data_id, row)
+
+        return changed
+
+    @classmethod
+    def refresh_row(cls, data_object: bpy.types.Object, row: int = None) -> int:
+        """
+        Reads the values of a single object again.
+
+        :param data_object: The object.
+        :param row: The row of the object, looked up if not given.
+
+        :return: The number of cells whose value changed.
+        """
+        if row is None:
+            row = cls.table.get_row(utils.get_data_path(data_object))
+            if row is None:
+                cls._is_dirty = True
+                return 0
+
+        changed = 0
+        for column in cls.table.values:
+            value = PreviewService.detach(data_object.get(column))
+            text = PreviewService.format_value(value, consts.TABLE_CELL_MAX_LENGTH)
+            changed += cls.table.set_cell(row, column, value, text)
+
+        cls.property_names.update(prop_name for prop_name in data_object.keys() if not prop_name.startswith("_"))
+
+        return changed
+
+    @classmethod
+    def mark_dirty(cls):
+        """Makes the table read everything again the next time it is needed, e.g. after a file was loaded."""
+        cls._is_dirty = True
+
+    @classmethod
+    def clear(cls):
+        cls.table.clear()
+        cls.property_names.clear()
+        cls._is_dirty = True
+
+    @classmethod
+    def _read_column(cls, prop_name: str, objects: list):
+        values = [PreviewService.detach(data_object.get(prop_name)) for data_object in objects]
+        cls.table.set_column(
+            prop_name,
+            values,
+            [PreviewService.format_value(value, consts.TABLE_CELL_MAX_LENGTH) for value in values]
+        )
\ No newline at end of file
@@ -0,0 +1,105 @@
+from .group_data_manager import GroupDataManager
+from ..services import PreviewService
+from ...core import SelectionView
+from ...shared import consts
+from ...shared.entities import LogLevel
+from ...shared.utils import SpanRecorder, StructuredLogger
+
+class SelectionViewManager:
+    """
+    Keeps the selection view, the union of the custom properties of the selected data objects with the values they
+    share. It is only built again once the selection, or the group data or values of a selected data object changed,
+    so redrawing only compares the selection and value generations.
+    """
+    logger = StructuredLogger(consts.MODULE_NAME)
+    group_data_manager = GroupDataManager
+    view: SelectionView = SelectionView()
+    _is_dirty: bool = True
+
+    @classmethod
+    def get_view(cls, data_objects: list) -> SelectionView:
+        """
+        Gets the selection view of data objects, building it first if they or their group data changed. Building only
+        reads Blender data, so this can be done while drawing.
+
+        :param data_objects: The selected data objects, in drawing order.
+
+        :return: The selection view.
+        """
+        key = tuple(
+            (data_object.as_pointer(), cls.group_data_manager.get_value_generation(data_object))
+            for data_object in data_objects
+        )
+        if cls._is_dirty or cls.view.key != key:
+            cls.rebuild(data_objects, key)
+
+        return cls.view
+
+    @classmethod
+    @SpanRecorder.timed("SelectionViewManager.rebuild")
+    def rebuild(cls, data_objects: list, key: tuple):
+        """
+        Builds the selection view. Groups and the properties in them are in the order they are first found in,
+        starting with the first data object. Properties grouped differently on several data objects stay in the group
+        they were first found in.
+        """
+        groups: dict[str, list[str]] = {}
+        grouped = set()
+        counts: dict[str, int] = {}
+        values = {}
+        mixed = set()
+        for data_object in data_objects:
+            for group_name, props in cls.group_data_manager.get_group_data(data_object).items():
+                group_props = groups.setdefault(group_name, [])
+                for prop_name in props:
+                    # Group data may still list properties removed without a depsgraph update
+                    if prop_name not in grouped and prop_name in data_object:
+                        grouped.add(prop_name)
+                        group_props.append(prop_name)
+
+            for prop_name in data_object.keys():
+                if prop_name.startswith("_"):
+                    continue
+
+                value = PreviewService.detach(data_object[prop_name])
+                count = counts.get(prop_name, 0)
+                counts[prop_name] = count + 1
+                if not count:
+                    values[prop_name] = value
+                elif prop_name not in mixed and not _is_equal(values[prop_name], value):
+                    mixed.add(prop_name)
+                    del values[prop_name]
+
+        cls.view = SelectionView(
+            key = key,
+            groups = list(groups.items()),
+            ungrouped = sorted(counts.keys() - grouped, key = lambda x: x.lower()),
+            counts = counts,
+            values = values,
+            texts = {
+                prop_name: PreviewService.format_value(value, consts.PREVIEW_MAX_LENGTH)
+                for prop_name, value in values.items()
+            },
+            mixed = mixed
+        )
+        cls._is_dirty = False
+
+        cls.logger.log(
+            level = LogLevel.DEBUG,
+            message = "Rebuilt selection view",
+            extra = {"data_objects": len(data_objects), "properties": len(counts), "mixed": len(mixed)}
+        )
+
+    @classmethod
+    def mark_dirty(cls):
+        """Makes the selection view build again the next time it is needed, e.g. after values were written."""
+        cls._is_dirty = True
+
+    @classmethod
+    def clear(cls):
+        cls.view = SelectionView()
+        cls._is_dirty = True
+
+def _is_equal(value, other) -> bool:
+    # 1 and 1.0 (or True) are equal, but are not the same value of a property
+    return type(value) is type(other) and value == other
\ No newline at end of file
@@ -1,7 +1,15 @@
+from .data_walker_service import DataWalkerService
+from .group_data_storage_service import GroupDataStorageService, JsonGroupDataStorage, NativeGroupDataStorage
+from .preview_service import PreviewService
 from .property_type_service import PropertyTypeService
 from .ui_data_service import UIDataService
 
 __all__ = [
+    "DataWalkerService",
+    "GroupDataStorageService",
+    "JsonGroupDataStorage",
+    "NativeGroupDataStorage",
+    "PreviewService",
     "PropertyTypeService",
     "UIDataService"
 ]
\ No newline at end of file
@@ -0,0 +1,73 @@
+from typing import Iterator
+
+import bpy
+
+from ...shared import consts
+
+class DataWalkerService:
+    @classmethod
+    def walk(cls, local_only: bool = False) -> Iterator:
+        """
+        Visits every piece of Blender data that can hold group data exactly once, driven by the `DATA_COLLECTIONS`
+        and `NESTED_DATA_PATHS` registries. The cost scales linearly with the amount of data in the file.
+
+        :param local_only: Whether to skip data linked from libraries and library overrides, which CPM cannot write to.
+        Such data is skipped with a single check per ID.
+
+        :return: An iterator over the data.
+        """
+        for collection_name in consts.DATA_COLLECTIONS:
+            collection = getattr(bpy.data, collection_name, None)
+            if collection is None:
+                # Not available in this Blender version
+                continue
+
+            nested_paths = consts.NESTED_DATA_PATHS.get(collection_name, ())
+            for data_id in collection:
+                if local_only and not cls.is_local(data_id):
+                    continue
+
+                yield data_id
+
+                for nested_path in nested_paths:
+                    yield from cls._resolve_nested(data_id, nested_path)
+
+    @classmethod
+    def walk_owned(cls, data_id) -> Iterator:
+        """
+        Visits an ID and the data nested in it that can hold group data, e.g. an object and its pose bones.
+
+        :param data_id: The ID to visit.
+
+        :return: An iterator over the data.
+        """
+        yield data_id
+
+        for nested_paths in consts.NESTED_DATA_PATHS.values():
+            for nested_path in nested_paths:
+                yield from cls._resolve_nested(data_id, nested_path)
+
+    @staticmethod
+    def is_local(data) -> bool:
+        """
+        Checks whether data belongs to the current file, as opposed to being linked from a library or being a library
+        override. Data nested in an ID (e.g. pose bones) shares the state of that ID.
+
+        :param data: The Blender data to check.
+
+        :return: True if the data is local, False otherwise.
+        """
+        owner = getattr(data, "id_data", None) or data
+
+        return (getattr(owner, "library", None) is None
+                and getattr(owner, "override_library", None) is None)
+
+    @staticmethod
+    def _resolve_nested(data_id, nested_path: str) -> Iterator:
+        nested = data_id
+        for attr in nested_path.split("."):
+            nested = getattr(nested, attr, None)
+            if nested is None:
+                return
+
+        yield from nested
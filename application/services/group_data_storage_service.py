@@ -0,0 +1,203 @@
+import json
+import os
+from typing import Union
+
+from ...shared import consts
+from ...shared.entities import LogLevel
+from ...shared.utils import StructuredLogger
+
+class JsonGroupDataStorage:
+    """
+    Stores group data as a JSON string. Writes are deferred to a serialization pass when the file is saved.
+
+    Backends store group data in the form written by `GroupData.serialize` and read it back as is, so they are not
+    concerned with its format or version.
+    """
+    logger = StructuredLogger(consts.MODULE_NAME)
+    property_name: str = consts.CPM_SERIALIZED_GROUP_DATA
+    requires_save_pass: bool = True
+
+    @classmethod
+    def read(cls, data_object) -> Union[dict, None]:
+        """
+        Reads the group data stored on a Blender data object.
+
+        :param data_object: The Blender data object to read from.
+
+        :return: The group data, or None if the data object has no stored group data.
+        """
+        raw = cls.read_raw(data_object)
+        if raw is None:
+            return None
+
+        return cls.parse(raw)
+
+    @classmethod
+    def read_raw(cls, data_object):
+        """
+        Reads the group data stored on a Blender data object without parsing it, so parsing can be done elsewhere,
+        e.g. in a pool. Must be called from the main thread.
+
+        :param data_object: The Blender data object to read from.
+
+        :return: The stored value, or None if the data object has no stored group data.
+        """
+        return data_object.get(cls.property_name)
+
+    @classmethod
+    def parse(cls, raw) -> dict:
+        """
+        Parses group data read with `read_raw`. Does not access Blender data, so it is safe to call from any thread.
+
+        :param raw: The stored value.
+
+        :return: The group data.
+        """
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError as e:
+            cls.logger.log(
+                level = LogLevel.ERROR,
+                message = "Could not load group data from JSON string",
+                extra = {
+                    "data_str": raw,
+                    "json_decode_error": e
+                }
+            )
+
+            return {}
+
+    @classmethod
+    def parse_many(cls, raw_values: list, executor: str = consts.ParseExecutors.AUTO) -> list[dict]:
+        """
+        Parses the group data of many data objects at once. Values are joined into a few large JSON arrays, which are
+        parsed in a pool when there is enough data for that to pay off. Batches that fail to parse, e.g. because one
+        of their values is malformed, are parsed value by value on the calling thread.
+
+        :param raw_values: Stored values read with `read_raw`.
+        :param executor: One of the ParseExecutors values.
+
+        :return: The group data of each value, in the same order.
+        """
+        workers = os.cpu_count() or 1
+        if executor == consts.ParseExecutors.AUTO:
+            executor = cls._choose_executor(raw_values)
+
+        if executor == consts.ParseExecutors.SERIAL or len(raw_values) < 2:
+            return [cls.parse(raw) for raw in raw_values]
+
+        from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+        batch_size = -(-len(raw_values) // (workers * consts.PARSE_BATCHES_PER_WORKER))
+        batches = [raw_values[start:start + batch_size] for start in range(0, len(raw_values), batch_size)]
+        pool_type = ProcessPoolExecutor if executor == consts.ParseExecutors.PROCESS else ThreadPoolExecutor
+        try:
+            with pool_type(max_workers = workers) as pool:
+                # `json.loads` is the worker, since worker processes cannot import the add-on
+                futures = [
+                    pool.submit(json.loads, "[" + ",".join(batch) + "]") if all(isinstance(raw, str) for raw in batch)
+                    else None
+                    for batch in batches
+                ]
+
+                results = []
+                for batch, future in zip(batches, futures):
+                    results.extend(cls._get_batch_result(batch, future))
+        except (OSError, RuntimeError) as e:
+            # Pools may be unavailable, e.g. if processes cannot be started
+            cls.logger.log(
+                level = LogLevel.WARNING,
+                message = "Could not parse group data in a pool, parsing serially",
+                extra = {"executor": executor, "error": str(e)}
+            )
+
+            return [cls.parse(raw) for raw in raw_values]
+
+        return results
+
+    @classmethod
+    def _get_batch_result(cls, batch: list, future) -> list[dict]:
+        """Gets the parsed values of a batch, falling back to parsing them one by one if the batch failed to parse."""
+        if future is not None:
+            try:
+                parsed = future.result()
+            except ValueError:
+                parsed = None
+
+            # A malformed value can still join into valid JSON, e.g. `1], [2`, so check the shape as well
+            if (isinstance(parsed, list) and len(parsed) == len(batch)
+                    and all(isinstance(group_data, dict) for group_data in parsed)):
+                return parsed
+
+        return [cls.parse(raw) for raw in batch]
+
+    @staticmethod
+    def _choose_executor(raw_values: list) -> str:
+        # Process pools start Blender's own executable from inside Blender, so they are only used when chosen
+        total_size = sum(len(raw) for raw in raw_values if isinstance(raw, str))
+        if total_size < consts.PARALLEL_PARSE_MIN_BYTES:
+            return consts.ParseExecutors.SERIAL
+
+        return consts.ParseExecutors.THREAD
+
+    @classmethod
+    def write(cls, data_object, group_data: dict):
+        """
+        Writes group data to a Blender data object.
+
+        :param data_object: The Blender data object to write to.
+        :param group_data: The serialized group data to write.
+        """
+        data_object[cls.property_name] = json.dumps(group_data)
+
+    @classmethod
+    def remove(cls, data_object):
+        """Removes the stored group data from a Blender data object, if there is any."""
+        if cls.property_name in data_object:
+            del data_object[cls.property_name]
+
+class NativeGroupDataStorage(JsonGroupDataStorage):
+    """
+    Stores group data as a nested ID property group of string arrays. Every write updates the ID property directly, so
+    undo captures group data natively and nothing is left to do when the file is saved.
+    """
+    property_name: str = consts.CPM_NATIVE_GROUP_DATA
+    requires_save_pass: bool = False
+
+    @classmethod
+    def read_raw(cls, data_object) -> Union[dict, None]:
+        # ID properties can only be read on the main thread, so they are converted right away
+        stored = data_object.get(cls.property_name)
+        if stored is None:
+            return None
+
+        return stored.to_dict()
+
+    @classmethod
+    def parse(cls, raw: dict) -> dict:
+        return raw
+
+    @classmethod
+    def parse_many(cls, raw_values: list, executor: str = consts.ParseExecutors.AUTO) -> list[dict]:
+        return raw_values
+
+    @classmethod
+    def write(cls, data_object, group_data: dict):
+        data_object[cls.property_name] = group_data
+
+class GroupDataStorageService:
+    storages = {
+        consts.GroupDataStorageTypes.JSON: JsonGroupDataStorage,
+        consts.GroupDataStorageTypes.NATIVE: NativeGroupDataStorage
+    }
+
+    @classmethod
+    def get_storage(cls, storage_type: str) -> type[JsonGroupDataStorage]:
+        """
+        Gets the storage backend for a storage type.
+
+        :param storage_type: One of the GroupDataStorageTypes values.
+
+        :return: The storage backend.
+        """
+        return cls.storages[storage_type]
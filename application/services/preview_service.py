@@ -0,0 +1,163 @@
+from collections import OrderedDict
+
+import bpy
+
+from ...shared import consts
+
+class PreviewService:
+    """
+    Short text previews of Python properties (ID property groups), for drawing them in panels. Previews are bounded in
+    length and written without ever converting the whole value to a string, and they are cached per data object and
+    property path until the data object's value generation changes.
+    """
+    _cache: OrderedDict[tuple[int, str], tuple[int, str]] = OrderedDict()
+
+    @classmethod
+    def get_preview(cls, data_object, path: str, value, generation: int) -> str:
+        """
+        Gets the preview of a value, from the cache if it is still valid.
+
+        :param data_object: The Blender data object the value belongs to.
+        :param path: The path of the value within the data object, e.g. the property name followed by nested keys.
+        :param value: The value.
+        :param generation: The current value generation of the data object.
+
+        :return: The preview.
+        """
+        key = (data_object.as_pointer(), path)
+        cached = cls._cache.get(key)
+        if cached is not None and cached[0] == generation:
+            cls._cache.move_to_end(key)
+            return cached[1]
+
+        preview = cls.format_preview(value, consts.PREVIEW_MAX_LENGTH)
+        cls._cache[key] = (generation, preview)
+        if len(cls._cache) > consts.PREVIEW_CACHE_SIZE:
+            # Forget the least recently drawn preview
+            cls._cache.popitem(last = False)
+
+        return preview
+
+    @classmethod
+    def format_preview(cls, value, max_length: int) -> str:
+        """
+        Writes a value as text, stopping once the text is longer than the maximum length.
+
+        :param value: The value.
+        :param max_length: The maximum length of the preview.
+
+        :return: The preview, ending with an ellipsis if it was truncated.
+        """
+        parts = []
+        cls._write(value, parts, [max_length + 1])
+        preview = "".join(parts)
+        if len(preview) > max_length:
+            preview = preview[:max_length - 1] + "…"
+
+        return preview
+
+    @classmethod
+    def format_value(cls, value, max_length: int) -> str:
+        """
+        Writes a value as the short text of a single cell, e.g. of the property table.
+
+        :param value: The value, as returned by `detach`.
+        :param max_length: The maximum length of the text.
+
+        :return: The text, empty for missing values.
+        """
+        if value is None:
+            return ""
+
+        if isinstance(value, str):
+            return value if len(value) <= max_length else value[:max_length - 1] + "…"
+
+        if isinstance(value, float):
+            return f"{value:.3f}"
+
+        return cls.format_preview(value, max_length)
+
+    @staticmethod
+    def detach(value):
+        """Converts a property value to a plain Python value, so caches never hold on to Blender data."""
+        if isinstance(value, bpy.types.ID):
+            return value.name
+
+        if hasattr(value, "to_dict"):
+            return value.to_dict()
+
+        if hasattr(value, "to_list"):
+            return value.to_list()
+
+        return value
+
+    @staticmethod
+    def get_children(value) -> list[tuple[str, object]]:
+        """
+        Gets the nested values of a value, up to the maximum number of children drawn per level.
+
+        :param value: An ID property group, or a sequence.
+
+        :return: The (key, child) pairs. Keys of sequence items are their indices.
+        """
+        if hasattr(value, "keys"):
+            items = value.items()
+        else:
+            items = ((str(index), item) for index, item in enumerate(value))
+
+        children = []
+        for key, child in items:
+            if len(children) == consts.PREVIEW_MAX_CHILDREN:
+                break
+
+            children.append((key, child))
+
+        return children
+
+    @staticmethod
+    def is_nested(value) -> bool:
+        """Checks whether a value has nested values that can be expanded."""
+        return hasattr(value, "keys") or (hasattr(value, "__len__") and not isinstance(value, (str, bytes)))
+
+    @classmethod
+    def _write(cls, value, parts: list[str], budget: list[int]):
+        """Appends the text of a value to parts, until the remaining budget of characters is used up."""
+        if budget[0] <= 0:
+            return
+
+        if hasattr(value, "keys"):
+            opening, closing = "{", "}"
+            items = value.items()
+        elif cls.is_nested(value):
+            opening, closing = "[", "]"
+            items = ((None, item) for item in value)
+        else:
+            # Long strings are cut before quoting them, so they are never copied whole
+            text = repr(value[:budget[0]] if isinstance(value, str) else value)
+            parts.append(text)
+            budget[0] -= len(text)
+            return
+
+        parts.append(opening)
+        budget[0] -= 1
+        for index, (key, item) in enumerate(items):
+            if budget[0] <= 0:
+                return
+
+            if index:
+                parts.append(", ")
+                budget[0] -= 2
+
+            if key is not None:
+                text = f"{key!r}: "
+                parts.append(text)
+                budget[0] -= len(text)
+
+            cls._write(item, parts, budget)
+
+        parts.append(closing)
+        budget[0] -= 1
+
+    @classmethod
+    def clear_cache(cls):
+        cls._cache.clear()
\ No newline at end of file
@@ -29,9 +29,19 @@ class PropertyTypeService:
             }
         )
 
+        return cls.get_property_type(utils.resolve_data_object(operator_instance.data_path), operator_instance.name)
+
+    @classmethod
+    def get_property_type(cls, data_object, prop_name: str) -> str:
+        """
+        Get the type of a property of a Blender data object.
+
+        :param data_object: The Blender data object the property belongs to.
+        :param prop_name: The name of the property.
+
+        :return: One of the PropertyTypes enum values
+        """
         # Initialize property data
-        data_object = utils.resolve_data_object(operator_instance.data_path)
-        prop_name = operator_instance.name
         value = data_object[prop_name]
         prop_type = type(value).__name__
         return_value: str
@@ -132,13 +142,14 @@ class PropertyTypeService:
             )
             return consts.PropertyTypes.FLOAT_ARRAY
 
+        # Booleans are ints as well, so they are matched first
         match value[0]:
             case float():
                 return_value = consts.PropertyTypes.FLOAT_ARRAY
-            case int():
-                return_value = consts.PropertyTypes.INT_ARRAY
             case bool():
                 return_value = consts.PropertyTypes.BOOL_ARRAY
+            case int():
+                return_value = consts.PropertyTypes.INT_ARRAY
             case _:
                 # We have an incorrect property type
                 cls.logger.log(
@@ -0,0 +1,8 @@
+"""
+Benchmarks for Custom Properties Manager.
+
+They run outside Blender against a minimal stand-in for `bpy` (see `benchmarks/stubs`), which is only put on the path
+when the real `bpy` cannot be imported. Timings therefore measure the add-on's own Python code, not Blender's.
+
+    python -m benchmarks.run --help
+"""
@@ -0,0 +1,201 @@
+import gc
+import importlib
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Callable
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+ADDON_DIR = os.path.dirname(BENCHMARKS_DIR)
+STUBS_DIR = os.path.join(BENCHMARKS_DIR, "stubs")
+RESULTS_DIR = os.path.join(BENCHMARKS_DIR, "results")
+ADDON_MODULE_NAME = "custom_properties_manager"
+# Panel classes `new_panel` created, by name
+_panel_classes = {}
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    size: int
+    repeats: int
+    min_s: float
+    median_s: float
+    mean_s: float
+
+def use_stand_in_bpy():
+    """Make the stand-in `bpy` importable, unless running inside Blender."""
+    if STUBS_DIR not in sys.path and importlib.util.find_spec("bpy") is None:
+        sys.path.insert(0, STUBS_DIR)
+
+def is_stand_in() -> bool:
+    """Whether the stand-in `bpy` is used, rather than Blender's."""
+    return STUBS_DIR in sys.path
+
+def import_addon():
+    """
+    Import the add-on as a package named `custom_properties_manager`, regardless of the directory it is checked out
+    in. Repeated calls return the already imported package.
+
+    :return: The add-on's root module.
+    """
+    if ADDON_MODULE_NAME in sys.modules:
+        return sys.modules[ADDON_MODULE_NAME]
+
+    use_stand_in_bpy()
+    spec = importlib.util.spec_from_file_location(
+        ADDON_MODULE_NAME,
+        os.path.join(ADDON_DIR, "__init__.py"),
+        submodule_search_locations = [ADDON_DIR]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[ADDON_MODULE_NAME] = module
+    spec.loader.exec_module(module)
+
+    return module
+
+def install_addon():
+    """
+    Import and register the add-on, the way Blender does when it is enabled.
+
+    :return: The add-on's root module.
+    """
+    addon = import_addon()
+    import bpy
+
+    if not is_stand_in():
+        raise RuntimeError("Registering the add-on is only supported with the stand-in bpy. In Blender, enable the "
+                           "add-on through the preferences instead.")
+
+    if ADDON_MODULE_NAME not in bpy.context.preferences.addons:
+        preferences_type = addon_module("infrastructure.ui").CPMPreferences
+        bpy.context.preferences.addons[ADDON_MODULE_NAME] = type("Addon", (), {"preferences": preferences_type()})()
+        addon.register()
+
+    return addon
+
+def addon_module(relative_name: str):
+    """
+    Import one of the add-on's modules.
+
+    :param relative_name: The module's name relative to the add-on, e.g. "application.managers".
+
+    :return: The imported module.
+    """
+    return importlib.import_module(f"{ADDON_MODULE_NAME}.{relative_name}")
+
+def new_panel(panel_name: str = "OBJECT_PT_custom_props"):
+    """
+    Create a panel to draw into, of a class named like one of the Blender panels CPM draws, since some state (e.g. the
+    search) is kept per panel.
+
+    :param panel_name: The name of the panel's class.
+
+    :return: The panel.
+    """
+    import bpy
+
+    panel_class = _panel_classes.get(panel_name)
+    if panel_class is None:
+        panel_class = _panel_classes[panel_name] = type(panel_name, (bpy.types.Panel,), {})
+
+    return panel_class()
+
+
+def new_file():
+    """Start over from an empty file, dropping anything CPM cached for the previous one."""
+    import bpy
+
+    if hasattr(bpy, "reset"):
+        bpy.reset()
+    else:
+        bpy.ops.wm.read_factory_settings(use_empty = True)
+
+    addon_module("application.managers").GroupDataManager.clear_cache()
+
+def measure(
+        name: str,
+        size: int,
+        function: Callable[[], object],
+        setup: Callable[[], object] = None,
+        min_time: float = 0.2,
+        max_repeats: int = 50) -> BenchmarkResult:
+    """
+    Time a function. It is repeated until `min_time` has passed (at least once, at most `max_repeats` times). Like
+    `timeit`, garbage collection is paused while timing, so collections triggered by earlier allocations do not skew
+    the results.
+
+    :param name: Name of the benchmark.
+    :param size: The workload size the function runs at.
+    :param function: The function to time.
+    :param setup: Called before every repeat, outside the timed region.
+    :param min_time: Total time after which no more repeats are started.
+    :param max_repeats: Maximum number of repeats.
+
+    :return: The timing result.
+    """
+    timings = []
+    while len(timings) < max_repeats and (not timings or sum(timings) < min_time):
+        if setup is not None:
+            setup()
+
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+
+    return BenchmarkResult(
+        name = name,
+        size = size,
+        repeats = len(timings),
+        min_s = min(timings),
+        median_s = statistics.median(timings),
+        mean_s = statistics.fmean(timings)
+    )
+
+def write_results(results: list[BenchmarkResult], output_path: str = None, extra_meta: dict = None) -> str:
+    """
+    Write benchmark results to a JSON file.
+
+    :param results: The results to write.
+    :param output_path: The file to write. Defaults to a timestamped file in `benchmarks/results`.
+    :param extra_meta: Additional metadata to store with the results.
+
+    :return: The path of the written file.
+    """
+    timestamp = datetime.now(timezone.utc)
+    if output_path is None:
+        os.makedirs(RESULTS_DIR, exist_ok = True)
+        output_path = os.path.join(RESULTS_DIR, f"{timestamp.strftime('%Y%m%dT%H%M%SZ')}.json")
+
+    import bpy
+
+    payload = {
+        "meta": {
+            "timestamp": timestamp.isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "blender": getattr(bpy.app, "version_string", None),
+            "stand_in_bpy": is_stand_in(),
+            **(extra_meta or {})
+        },
+        "results": [asdict(result) for result in results]
+    }
+
+    with open(output_path, "w", encoding = "utf-8") as file:
+        json.dump(payload, file, indent = 4)
+
+    return output_path
+
+def format_result(result: BenchmarkResult) -> str:
+    return (f"{result.name:<52} n={result.size:<8} min={result.min_s * 1000:10.3f} ms  "
+            f"median={result.median_s * 1000:10.3f} ms  ({result.repeats} runs)")
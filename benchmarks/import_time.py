@@ -0,0 +1,113 @@
+"""
+Measures how long importing the add-on takes, the equivalent of `python -X importtime` for the add-on alone.
+
+Every run imports the add-on in a fresh interpreter with the stand-in `bpy` already imported, so only the add-on's own
+modules and the modules it pulls in are measured:
+
+    python -m benchmarks.import_time [--runs 5] [--addon-dir path/to/other/checkout] [--preload json dataclasses]
+
+Pass `--addon-dir` to compare against another checkout (e.g. a `git worktree` of an older commit). Use `--preload` for
+modules Blender has already imported at startup, so they are not attributed to the add-on.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+from . import harness
+
+_SENTINEL = "cpm-import-time-start"
+
+_RUN_ADDON_IMPORT = """
+import importlib.util, sys, time
+sys.path.insert(0, {stubs_dir!r})
+import bpy
+for module_name in {preload!r}:
+    __import__(module_name)
+
+sys.stderr.write({sentinel!r} + "\\n")
+sys.stderr.flush()
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location(
+    {module_name!r}, {init_path!r}, submodule_search_locations = [{addon_dir!r}])
+module = importlib.util.module_from_spec(spec)
+sys.modules[{module_name!r}] = module
+spec.loader.exec_module(module)
+print(time.perf_counter() - start)
+"""
+
+def measure_import(addon_dir: str, preload: list[str]) -> tuple[float, list[tuple[str, int]]]:
+    """
+    Import the add-on in a fresh interpreter.
+
+    :param addon_dir: The add-on's root directory.
+    :param preload: Modules to import before the add-on.
+
+    :return: The wall time of the import in seconds, and the self time in microseconds of every module it imported.
+    """
+    code = _RUN_ADDON_IMPORT.format(
+        stubs_dir = harness.STUBS_DIR,
+        preload = preload,
+        sentinel = _SENTINEL,
+        module_name = harness.ADDON_MODULE_NAME,
+        init_path = os.path.join(addon_dir, "__init__.py"),
+        addon_dir = addon_dir
+    )
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output = True,
+        text = True,
+        check = True
+    )
+
+    modules = []
+    started = False
+    for line in completed.stderr.splitlines():
+        if line == _SENTINEL:
+            started = True
+            continue
+
+        if not started or not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_time, _cumulative, name = line.removeprefix("import time:").split("|")
+        modules.append((name.strip(), int(self_time)))
+
+    return float(completed.stdout.strip()), modules
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description = "Measure how long importing the add-on takes")
+    parser.add_argument("--runs", type = int, default = 5, help = "Number of fresh interpreters to import in")
+    parser.add_argument("--addon-dir", default = harness.ADDON_DIR, help = "Root directory of the add-on to measure")
+    parser.add_argument("--preload", nargs = "*", default = [], help = "Modules to import before the add-on")
+    parser.add_argument("--top", type = int, default = 15, help = "Number of slowest modules to list")
+    args = parser.parse_args(argv)
+
+    wall_times = []
+    addon_times = []
+    module_times: dict[str, list[int]] = {}
+    for _ in range(args.runs):
+        wall_time, modules = measure_import(os.path.abspath(args.addon_dir), args.preload)
+        wall_times.append(wall_time)
+        addon_times.append(sum(
+            self_time for name, self_time in modules
+            if name.startswith(harness.ADDON_MODULE_NAME)
+        ))
+        for name, self_time in modules:
+            module_times.setdefault(name, []).append(self_time)
+
+    medians = {name: statistics.median(times) for name, times in module_times.items()}
+    dependencies = sorted(name for name in medians if not name.startswith(harness.ADDON_MODULE_NAME))
+
+    print(f"Add-on import (median of {args.runs}): {statistics.median(wall_times) * 1000:.2f} ms wall, "
+          f"{statistics.median(addon_times) / 1000:.2f} ms in the add-on's own modules")
+    print(f"Modules pulled in besides the add-on's ({len(dependencies)}): {', '.join(dependencies) or '-'}")
+    print(f"Slowest modules (self time):")
+    for name, self_time in sorted(medians.items(), key = lambda item: item[1], reverse = True)[:args.top]:
+        print(f"    {self_time / 1000:8.2f} ms  {name}")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,258 @@
+"""
+Micro-benchmarks for CPM's hot paths.
+
+Usage (from the add-on's root directory):
+
+    python -m benchmarks.run [--sizes 10 1000 100000] [--filter draw] [--output results.json]
+
+Every benchmark runs once per size, where the size is the total number of custom properties involved. Results are
+printed and written as JSON to `benchmarks/results` (or `--output`).
+"""
+import argparse
+import logging
+import sys
+
+from . import harness
+
+PROPS_PER_GROUP = 10
+PROPS_PER_OBJECT = 10
+
+def _managers():
+    return harness.addon_module("application.managers")
+
+def _populate_object(data_object, prop_count: int, group_size: int = PROPS_PER_GROUP) -> dict[str, list[str]]:
+    """Add float properties to a data object and group them. Returns the group data."""
+    groups = {}
+    for index in range(prop_count):
+        prop_name = f"prop_{index}"
+        data_object[prop_name] = float(index)
+        groups.setdefault(f"Group {index // group_size}", []).append(prop_name)
+
+    return groups
+
+def _single_object(size: int):
+    """A new file with one active object holding `size` grouped properties."""
+    import bpy
+
+    harness.new_file()
+    data_object = bpy.data.objects.new("Benchmark")
+    bpy.context.active_object = data_object
+    groups = _populate_object(data_object, size)
+    group_data = _managers().GroupDataManager.get_group_data(data_object)
+    group_data.cached_data.update(groups)
+
+    return data_object
+
+def _many_objects(size: int, storage_type: str) -> list:
+    """A new file with `size` grouped properties spread over objects, stored with the given backend."""
+    import bpy
+
+    harness.new_file()
+    group_data_manager = _managers().GroupDataManager
+    group_data_manager.set_storage(storage_type)
+    data_objects = []
+    for object_index in range(max(1, size // PROPS_PER_OBJECT)):
+        data_object = bpy.data.objects.new(f"Object {object_index}")
+        groups = _populate_object(data_object, min(size, PROPS_PER_OBJECT), group_size = 5)
+        group_data_manager.get_group_data(data_object).cached_data.update(groups)
+        group_data_manager.save_group_data(data_object)
+        data_objects.append(data_object)
+
+    return data_objects
+
+def bench_draw_panels(size: int) -> list[harness.BenchmarkResult]:
+    import bpy
+
+    draw_panels = harness.addon_module("infrastructure.ui").draw_panels
+    _single_object(size)
+
+    return [harness.measure(
+        "draw_panels",
+        size,
+        lambda: draw_panels(harness.new_panel(), bpy.context, "active_object")
+    )]
+
+def bench_draw_selection(size: int) -> list[harness.BenchmarkResult]:
+    import bpy
+
+    panel_type = harness.addon_module("infrastructure.ui").VIEW3D_PT_cpm_selection
+    data_objects = _many_objects(size, "JSON")
+    for data_object in data_objects:
+        data_object.select_set(True)
+
+    def draw_next_selection():
+        # The active object changes on every draw, like when scrubbing through a selection during playback
+        draw_next_selection.index = (draw_next_selection.index + 1) % len(data_objects)
+        bpy.context.active_object = data_objects[draw_next_selection.index]
+        panel_type().draw(bpy.context)
+
+    draw_next_selection.index = 0
+
+    return [harness.measure("VIEW3D_PT_cpm_selection.draw", size, draw_next_selection)]
+
+def bench_group_data(size: int) -> list[harness.BenchmarkResult]:
+    data_object = _single_object(size)
+    group_data = _managers().GroupDataManager.get_group_data(data_object)
+    last_prop = f"prop_{size - 1}"
+
+    def move_back_and_forth():
+        group_data.update_property_group(prop_name = last_prop, new_group = "Moved")
+        group_data.update_property_group(prop_name = last_prop, new_group = "Group 0")
+
+    return [
+        harness.measure("GroupData.verify", size, lambda: group_data.verify(data_object)),
+        harness.measure("GroupData.update_property_group", size, move_back_and_forth),
+        harness.measure("GroupData.get_group_name", size, lambda: group_data.get_group_name(last_prop)),
+        harness.measure("GroupData.get_property_groups", size, group_data.get_property_groups),
+    ]
+
+def bench_group_data_manager(size: int) -> list[harness.BenchmarkResult]:
+    import bpy
+
+    group_data_manager = _managers().GroupDataManager
+    results = []
+    for storage_type in ("JSON", "NATIVE"):
+        data_objects = _many_objects(size, storage_type)
+
+        def save_all():
+            for data_object in data_objects:
+                group_data_manager.save_group_data(data_object)
+
+        results.append(harness.measure(f"GroupDataManager.save_group_data[{storage_type}]", size, save_all))
+        results.append(harness.measure(
+            f"GroupDataManager.on_file_save[{storage_type}]",
+            size,
+            group_data_manager.on_file_save
+        ))
+        results.append(harness.measure(
+            f"GroupDataManager.on_file_load[{storage_type}]",
+            size,
+            group_data_manager.on_file_load
+        ))
+
+        # Reading group data the first time it is drawn, e.g. after undo
+        results.append(harness.measure(
+            f"GroupDataManager.get_group_data[{storage_type}, uncached]",
+            size,
+            lambda: [group_data_manager.get_group_data(data_object) for data_object in bpy.data.objects],
+            setup = group_data_manager.clear_cache
+        ))
+
+    group_data_manager.set_storage("JSON")
+
+    return results
+
+def bench_warm_cache(size: int) -> list[harness.BenchmarkResult]:
+    group_data_manager = _managers().GroupDataManager
+    _many_objects(size, "JSON")
+
+    # Loading a file materializes all group data: serial parsing against both pools
+    return [
+        harness.measure(
+            f"GroupDataManager.warm_cache[{executor}]",
+            size,
+            lambda: group_data_manager.warm_cache(executor),
+            setup = group_data_manager.clear_cache
+        )
+        for executor in ("SERIAL", "THREAD", "PROCESS")
+    ]
+
+def _invoked_edit_operator(prop_name: str):
+    import bpy
+
+    operator = bpy.types.CPM_OT_edit_property()
+    operator.data_path = "active_object"
+    operator.name = prop_name
+    operator.invoke(bpy.context, None)
+
+    return operator
+
+def bench_field_manager(size: int) -> list[harness.BenchmarkResult]:
+    import bpy
+
+    _single_object(size)
+    field_manager = _managers().FieldManager
+    operator = _invoked_edit_operator("prop_0")
+    operator_type = bpy.types.CPM_OT_edit_property
+
+    return [
+        harness.measure(
+            "FieldManager.setup_fields",
+            size,
+            lambda: field_manager.setup_fields(operator_instance = operator, operator_type = operator_type)
+        ),
+        harness.measure("FieldManager.load_fields", size, lambda: field_manager.load_fields(operator.fields)),
+    ]
+
+def bench_edit_apply(size: int) -> list[harness.BenchmarkResult]:
+    import bpy
+
+    _single_object(size)
+
+    def apply_edit():
+        # Full round trip of the edit dialog: open it, move the property to another group and apply
+        operator = _invoked_edit_operator(f"prop_{size - 1}")
+        operator.group = "Moved" if operator.group != "Moved" else "Group 0"
+        operator.execute(bpy.context)
+
+    return [harness.measure("EditPropertyMenuOperator.invoke+execute", size, apply_edit)]
+
+def bench_bulk_properties(size: int) -> list[harness.BenchmarkResult]:
+    import bpy
+
+    harness.new_file()
+    data_objects = []
+    for object_index in range(size):
+        data_object = bpy.data.objects.new(f"Object {object_index}")
+        data_object["mass"] = float(object_index)
+        data_objects.append(data_object)
+
+    api = harness.addon_module("api")
+    values = api.gather(data_objects, "mass")
+
+    # Scripted retuning of a property across many objects
+    return [
+        harness.measure("api.gather", size, lambda: api.gather(data_objects, "mass")),
+        harness.measure("api.scatter", size, lambda: api.scatter(data_objects, "mass", values)),
+    ]
+
+BENCHMARKS = {
+    "draw_panels": bench_draw_panels,
+    "draw_selection": bench_draw_selection,
+    "group_data": bench_group_data,
+    "group_data_manager": bench_group_data_manager,
+    "warm_cache": bench_warm_cache,
+    "field_manager": bench_field_manager,
+    "edit_apply": bench_edit_apply,
+    "bulk_properties": bench_bulk_properties,
+}
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description = "Run CPM micro-benchmarks")
+    parser.add_argument("--sizes", type = int, nargs = "+", default = [10, 1_000, 100_000],
+                        help = "Numbers of properties to run every benchmark at")
+    parser.add_argument("--filter", default = "", help = "Only run benchmarks whose name contains this text")
+    parser.add_argument("--output", default = None, help = "Path of the JSON results file")
+    args = parser.parse_args(argv)
+
+    harness.install_addon()
+    # Keep the log quiet, so logging does not dominate the timings
+    logging.getLogger(harness.addon_module("shared").consts.MODULE_NAME).setLevel(logging.CRITICAL)
+
+    results = []
+    for name, benchmark in BENCHMARKS.items():
+        if args.filter not in name:
+            continue
+
+        for size in args.sizes:
+            for result in benchmark(size):
+                print(harness.format_result(result))
+                results.append(result)
+
+    output_path = harness.write_results(results, args.output, {"sizes": args.sizes})
+    print(f"Results written to {output_path}")
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
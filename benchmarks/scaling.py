@@ -0,0 +1,222 @@
+"""
+Scaling regression gate.
+
+Times CPM's hot paths on synthetic scenes of growing size, fits a power law (time ~ N^k) to each path and compares the
+fitted exponent against the stored baselines in `benchmarks/baselines/scaling.json`. The gate fails when a path scales
+worse than its baseline allows, e.g. when it turns quadratic.
+
+    python -m benchmarks.scaling [--sizes 1000 4000 16000 64000] [--update-baselines]
+    blender -b --factory-startup --python benchmarks/scaling.py -- [--sizes ...]
+
+Inside Blender, paths that need registered classes or a UI (like `draw_panels`) are skipped.
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import sys
+from dataclasses import dataclass
+from typing import Callable
+
+if __package__ in (None, ""):
+    # Run as a script, e.g. by Blender's --python
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    __package__ = "benchmarks"
+
+from . import harness
+from .scene_generator import SceneSpec, generate_scene
+
+BASELINES_PATH = os.path.join(harness.BENCHMARKS_DIR, "baselines", "scaling.json")
+DEFAULT_SIZES = [1_000, 4_000, 16_000, 64_000]
+DEFAULT_TOLERANCE = 0.25
+# Exponent allowed for paths without a baseline. Anything above grows faster than linearly.
+LINEAR_EXPONENT = 1.0
+PROPS_PER_OBJECT = 50
+
+@dataclass
+class ScalingCase:
+    """
+    A code path to fit a scaling curve for.
+
+    :param prepare: Generates the workload for a size and returns the function to time, plus an optional setup
+    function that is called before every repeat.
+    :param needs_registration: Whether the path needs the add-on's classes registered, which is only done with the
+    stand-in `bpy`.
+    """
+    prepare: Callable[[int], tuple[Callable[[], object], Callable[[], object] | None]]
+    needs_registration: bool = False
+
+def _managers():
+    return harness.addon_module("application.managers")
+
+def _single_object(size: int):
+    harness.new_file()
+    return generate_scene(SceneSpec(object_count = 1, props_per_object = size))[0]
+
+def _many_objects(size: int) -> list:
+    harness.new_file()
+    return generate_scene(SceneSpec(object_count = max(1, size // PROPS_PER_OBJECT), props_per_object = PROPS_PER_OBJECT))
+
+def _prepare_verify(size: int):
+    group_data_type = harness.addon_module("core").GroupData
+    data_object = _single_object(size)
+    stored = group_data_type.from_stored(
+        harness.addon_module("application.services").JsonGroupDataStorage.read(data_object))
+    state = {}
+
+    def setup():
+        state["group_data"] = group_data_type(
+            {name: list(props) for name, props in stored.items()}, order_modes = dict(stored.order_modes))
+
+    return lambda: state["group_data"].verify(data_object), setup
+
+def _prepare_get_group_data(size: int):
+    group_data_manager = _managers().GroupDataManager
+    data_object = _single_object(size)
+
+    return lambda: group_data_manager.get_group_data(data_object), group_data_manager.clear_cache
+
+def _prepare_file_load(size: int):
+    _many_objects(size)
+
+    return _managers().GroupDataManager.on_file_load, None
+
+def _prepare_file_save(size: int):
+    _many_objects(size)
+    group_data_manager = _managers().GroupDataManager
+    group_data_manager.on_file_load()
+
+    return group_data_manager.on_file_save, None
+
+def _prepare_draw_panels(size: int):
+    import bpy
+
+    draw_panels = harness.addon_module("infrastructure.ui").draw_panels
+    bpy.context.active_object = _single_object(size)
+
+    return lambda: draw_panels(harness.new_panel(), bpy.context, "active_object"), None
+
+CASES = {
+    "GroupData.verify": ScalingCase(_prepare_verify),
+    "GroupDataManager.get_group_data": ScalingCase(_prepare_get_group_data),
+    "GroupDataManager.on_file_load": ScalingCase(_prepare_file_load),
+    "GroupDataManager.on_file_save": ScalingCase(_prepare_file_save),
+    "draw_panels": ScalingCase(_prepare_draw_panels, needs_registration = True),
+}
+
+def fit_exponent(sizes: list[int], timings: list[float]) -> tuple[float, float]:
+    """
+    Least-squares fit of log(time) = k * log(N) + c.
+
+    :param sizes: The workload sizes.
+    :param timings: The time taken at each size, in seconds.
+
+    :return: The exponent k and the coefficient e^c, the estimated time at N = 1.
+    """
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(timing, 1e-9)) for timing in timings]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if variance == 0:
+        raise ValueError("At least two different sizes are needed to fit a scaling curve")
+
+    exponent = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+
+    return exponent, math.exp(mean_y - exponent * mean_x)
+
+def load_baselines(path: str = BASELINES_PATH) -> dict:
+    if not os.path.exists(path):
+        return {"cases": {}}
+
+    with open(path, encoding = "utf-8") as file:
+        return json.load(file)
+
+def run_case(name: str, case: ScalingCase, sizes: list[int]) -> dict:
+    results = []
+    for size in sizes:
+        function, setup = case.prepare(size)
+        results.append(harness.measure(name, size, function, setup = setup))
+
+    exponent, coefficient = fit_exponent(sizes, [result.min_s for result in results])
+
+    return {
+        "exponent": exponent,
+        "coefficient": coefficient,
+        "sizes": sizes,
+        "timings": [result.min_s for result in results]
+    }
+
+def check(name: str, fit: dict, baselines: dict, tolerance: float) -> str | None:
+    """
+    Compare a fitted curve with its baseline.
+
+    :return: A description of the regression, or None if the path scales as well as its baseline allows.
+    """
+    baseline = baselines.get("cases", {}).get(name)
+    allowed = (baseline["exponent"] if baseline else LINEAR_EXPONENT) + tolerance
+    if fit["exponent"] <= allowed:
+        return None
+
+    reference = f"baseline {baseline['exponent']:.2f}" if baseline else "no baseline, linear expected"
+    return f"{name} scales as N^{fit['exponent']:.2f}, more than the allowed N^{allowed:.2f} ({reference})"
+
+def main(argv: list[str] = None) -> int:
+    if argv is None:
+        # Blender passes the script's own arguments after "--"
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:]
+
+    parser = argparse.ArgumentParser(description = "Check how CPM's hot paths scale with the number of properties")
+    parser.add_argument("--sizes", type = int, nargs = "+", default = DEFAULT_SIZES,
+                        help = "Numbers of properties to time every path at")
+    parser.add_argument("--filter", default = "", help = "Only check paths whose name contains this text")
+    parser.add_argument("--tolerance", type = float, default = DEFAULT_TOLERANCE,
+                        help = "How much the fitted exponent may exceed the baseline")
+    parser.add_argument("--update-baselines", action = "store_true",
+                        help = "Store the fitted curves as the new baselines instead of checking them")
+    args = parser.parse_args(argv)
+
+    harness.use_stand_in_bpy()
+    if harness.is_stand_in():
+        harness.install_addon()
+    else:
+        harness.import_addon()
+
+    logging.getLogger(harness.addon_module("shared").consts.MODULE_NAME).setLevel(logging.CRITICAL)
+
+    baselines = load_baselines()
+    fits = {}
+    failures = []
+    for name, case in CASES.items():
+        if args.filter not in name:
+            continue
+
+        if case.needs_registration and not harness.is_stand_in():
+            print(f"{name:<40} skipped, needs the stand-in bpy")
+            continue
+
+        fit = run_case(name, case, args.sizes)
+        fits[name] = fit
+        print(f"{name:<40} N^{fit['exponent']:.2f}  ({fit['timings'][-1] * 1000:.2f} ms at N={args.sizes[-1]})")
+        failure = check(name, fit, baselines, args.tolerance)
+        if failure is not None:
+            failures.append(failure)
+
+    if args.update_baselines:
+        baselines.setdefault("cases", {}).update(fits)
+        os.makedirs(os.path.dirname(BASELINES_PATH), exist_ok = True)
+        with open(BASELINES_PATH, "w", encoding = "utf-8") as file:
+            json.dump(baselines, file, indent = 4)
+
+        print(f"Baselines written to {BASELINES_PATH}")
+
+        return 0
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
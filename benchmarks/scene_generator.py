@@ -0,0 +1,122 @@
+"""
+Reproducible synthetic workloads: many data-blocks carrying custom properties of every type, grouped the way CPM
+stores them.
+
+Only `bpy.data` and ID property access are used, so scenes can be generated both with the stand-in `bpy` and inside
+Blender running in the background:
+
+    blender -b --factory-startup --python benchmarks/scaling.py -- --sizes 1000 4000 16000
+"""
+import random
+from dataclasses import dataclass
+
+from . import harness
+
+# Property types the generator creates, matching PROPERTY_TYPES
+GENERATED_TYPES = (
+    "FLOAT",
+    "FLOAT_ARRAY",
+    "INT",
+    "INT_ARRAY",
+    "BOOL",
+    "BOOL_ARRAY",
+    "STRING",
+    "DATA_BLOCK",
+    "PYTHON",
+)
+
+@dataclass(frozen = True)
+class SceneSpec:
+    """
+    Describes a synthetic scene.
+
+    :param object_count: Number of objects to create.
+    :param props_per_object: Number of custom properties on each object. Types are cycled through GENERATED_TYPES.
+    :param group_count: Number of groups on each object.
+    :param grouped_ratio: Share of each object's properties that belong to a group.
+    :param stale_ratio: Number of stale group entries (properties that no longer exist), relative to the number of
+    grouped properties.
+    :param python_blob_size: Number of keys in each PYTHON property.
+    :param storage_type: The group data storage backend to write group data with.
+    :param seed: Seed of the random values, so the same spec always produces the same scene.
+    """
+    object_count: int
+    props_per_object: int
+    group_count: int = 8
+    grouped_ratio: float = 0.8
+    stale_ratio: float = 0.1
+    python_blob_size: int = 8
+    storage_type: str = "JSON"
+    seed: int = 0
+
+    @property
+    def prop_count(self) -> int:
+        return self.object_count * self.props_per_object
+
+def generate_scene(spec: SceneSpec) -> list:
+    """
+    Generate a synthetic scene in the current file. Group data is written to the data-blocks directly, with stale
+    entries included, the way it is found after loading an older file. Nothing is cached by CPM.
+
+    :param spec: The scene to generate.
+
+    :return: The generated objects.
+    """
+    import bpy
+
+    storage = harness.addon_module("application.services").GroupDataStorageService.get_storage(spec.storage_type)
+    rng = random.Random(spec.seed)
+    data_objects = []
+    for object_index in range(spec.object_count):
+        data_object = bpy.data.objects.new(f"CPM Synthetic {object_index}", None)
+        # Data-block properties point at the previous object, or the object itself for the first one
+        target = data_objects[-1] if data_objects else data_object
+        prop_names = []
+        for prop_index in range(spec.props_per_object):
+            prop_type = GENERATED_TYPES[prop_index % len(GENERATED_TYPES)]
+            prop_name = f"{prop_type.lower()}_{prop_index}"
+            data_object[prop_name] = _make_value(prop_type, rng, spec, target)
+            prop_names.append(prop_name)
+
+        storage.write(data_object, _make_groups(prop_names, rng, spec))
+        data_objects.append(data_object)
+
+    return data_objects
+
+def _make_value(prop_type: str, rng: random.Random, spec: SceneSpec, target):
+    match prop_type:
+        case "FLOAT":
+            return rng.uniform(-100.0, 100.0)
+        case "FLOAT_ARRAY":
+            return [rng.uniform(-1.0, 1.0) for _ in range(3)]
+        case "INT":
+            return rng.randint(-1000, 1000)
+        case "INT_ARRAY":
+            return [rng.randint(0, 255) for _ in range(4)]
+        case "BOOL":
+            return rng.random() < 0.5
+        case "BOOL_ARRAY":
+            return [rng.random() < 0.5 for _ in range(3)]
+        case "STRING":
+            return "".join(rng.choices("abcdefghijklmnopqrstuvwxyz_", k = 16))
+        case "DATA_BLOCK":
+            return target
+        case "PYTHON":
+            return {
+                f"key_{index}": {"value": rng.random(), "tags": [rng.randint(0, 9) for _ in range(3)]}
+                for index in range(spec.python_blob_size)
+            }
+
+    raise ValueError(f"Unsupported property type: {prop_type}")
+
+def _make_groups(prop_names: list[str], rng: random.Random, spec: SceneSpec) -> dict[str, list[str]]:
+    groups = {f"Group {index}": [] for index in range(max(1, spec.group_count))}
+    group_names = list(groups)
+    grouped = prop_names[:int(len(prop_names) * spec.grouped_ratio)]
+    for prop_name in grouped:
+        groups[rng.choice(group_names)].append(prop_name)
+
+    for stale_index in range(int(len(grouped) * spec.stale_ratio)):
+        groups[rng.choice(group_names)].append(f"stale_{stale_index}")
+
+    return groups
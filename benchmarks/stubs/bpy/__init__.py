@@ -0,0 +1,192 @@
+"""
+A lightweight stand-in for Blender's ``bpy`` module.
+
+It models just enough of the API for CPM's managers, services, operators and draw callbacks to run in a plain Python
+interpreter: ID data-blocks with custom properties and UI data, ``bpy.data`` collections, a context, recording layouts,
+handler lists and manually fired timers. Use ``reset`` to start from an empty file.
+"""
+import re
+
+from . import app, msgbus, props, types, utils
+
+
+class _IDCollection(list):
+    """A ``bpy.data`` collection."""
+
+    def __init__(self, id_type):
+        super().__init__()
+        self._id_type = id_type
+
+    def new(self, name: str, *args):
+        if self._id_type is types.Object:
+            data_block = types.Object(name, args[0] if args else None)
+        else:
+            data_block = self._id_type(name)
+
+        self.append(data_block)
+        return data_block
+
+    def remove(self, data_block, **kwargs):
+        list.remove(self, data_block)
+
+    def get(self, key, default = None):
+        """Looks up a data-block by name, or by name and library file path (None for local data) as a tuple."""
+        name, library_path, by_library = (*key, True) if isinstance(key, tuple) else (key, None, False)
+        for data_block in self:
+            if data_block.name != name:
+                continue
+
+            library = data_block.library
+            if not by_library or library_path == (None if library is None else library.filepath):
+                return data_block
+
+        return default
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            data_block = self.get(key)
+            if data_block is None:
+                raise KeyError(key)
+
+            return data_block
+
+        return list.__getitem__(self, key)
+
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return self.get(key) is not None
+
+        return list.__contains__(self, key)
+
+
+_DATA_COLLECTIONS = {
+    "objects": types.Object,
+    "scenes": types.Scene,
+    "meshes": types.Mesh,
+    "materials": types.Material,
+    "lights": types.Light,
+    "cameras": types.Camera,
+    "curves": types.Curve,
+    "armatures": types.Armature,
+    "collections": types.Collection,
+    "node_groups": types.NodeTree,
+    "worlds": types.World,
+    "textures": types.Texture,
+    "images": types.Image,
+    "actions": types.Action,
+    "window_managers": types.WindowManager,
+}
+
+
+class _Data:
+    """Stand-in for ``bpy.data`` (a ``BlendData``)."""
+
+    def __init__(self):
+        for attr_name, id_type in _DATA_COLLECTIONS.items():
+            setattr(self, attr_name, _IDCollection(id_type))
+
+        self.filepath = ""
+        self.is_dirty = False
+
+
+class _Addon:
+    def __init__(self, preferences):
+        self.preferences = preferences
+
+
+class _Addons(dict):
+    def get(self, key, default = None):
+        return dict.get(self, key, default)
+
+
+class _Preferences:
+    def __init__(self):
+        self.addons = _Addons()
+
+
+class _Area:
+    def __init__(self, area_type: str):
+        self.type = area_type
+        self.redraws = 0
+
+    def tag_redraw(self):
+        self.redraws += 1
+
+
+class _Screen:
+    def __init__(self):
+        self.areas = [_Area('PROPERTIES'), _Area('VIEW_3D')]
+
+
+class _Context:
+    """
+    Stand-in for ``bpy.context``. Selection is derived from ``Object.select_get`` so scripts can select objects the same
+    way as in Blender.
+    """
+
+    def __init__(self, data_: _Data):
+        self._data = data_
+        self.preferences = _Preferences()
+        self.view_layer = types.ViewLayer()
+        self.screen = _Screen()
+        self.area = self.screen.areas[0]
+        self.region = None
+        self.active_object = None
+        self.active_bone = None
+        self.active_pose_bone = None
+        self.material = None
+        self.mode = 'OBJECT'
+
+    @property
+    def scene(self):
+        return self._data.scenes[0] if self._data.scenes else None
+
+    @property
+    def window_manager(self):
+        return self._data.window_managers[0]
+
+    @property
+    def object(self):
+        return self.active_object
+
+    @property
+    def selected_objects(self):
+        return [data_object for data_object in self._data.objects if data_object.select_get()]
+
+    @property
+    def collection(self):
+        return self._data.collections[0] if self._data.collections else None
+
+    @property
+    def world(self):
+        return self.scene.world if self.scene else None
+
+    def path_resolve(self, path: str, coerce: bool = True):
+        """Resolves paths like ``scene.objects["Cube"]``. Every object belongs to the scene here."""
+        match = re.fullmatch(r'scene\.objects\["(.*)"\]', path)
+        data_object = self._data.objects.get(utils.unescape_identifier(match.group(1))) if match else None
+        if data_object is None:
+            raise ValueError(f"Path could not be resolved: {path!r}")
+
+        return data_object
+
+    def evaluated_depsgraph_get(self):
+        return types.Depsgraph()
+
+
+data = _Data()
+context = _Context(data)
+
+
+def reset():
+    """Start over from an empty file with a single scene and window manager, keeping registered add-on preferences."""
+    global data
+    preferences = context.preferences
+    data.__init__()
+    context.__init__(data)
+    context.preferences = preferences
+    data.scenes.new("Scene")
+    data.window_managers.new("WinMan")
+
+
+reset()
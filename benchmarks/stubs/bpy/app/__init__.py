@@ -0,0 +1,6 @@
+"""Stand-in for ``bpy.app``."""
+from . import handlers, timers
+
+version = (4, 4, 3)
+version_string = "4.4.3"
+background = True
@@ -0,0 +1,14 @@
+"""Stand-in for ``bpy.app.handlers``. Handlers are plain lists the caller fires manually."""
+
+save_pre = []
+save_post = []
+load_pre = []
+load_post = []
+depsgraph_update_post = []
+undo_post = []
+redo_post = []
+
+
+def persistent(function):
+    function._bpy_persistent = True
+    return function
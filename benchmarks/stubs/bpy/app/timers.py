@@ -0,0 +1,41 @@
+"""
+Stand-in for ``bpy.app.timers``. Nothing runs on its own; call ``run_pending`` to fire every timer once, the way
+Blender's event loop would on an idle tick.
+"""
+_registered = {}
+
+
+def register(function, first_interval: float = 0, persistent: bool = False):
+    _registered[function] = first_interval
+
+
+def unregister(function):
+    if function not in _registered:
+        raise ValueError("Error: function is not registered")
+
+    del _registered[function]
+
+
+def is_registered(function) -> bool:
+    return function in _registered
+
+
+def run_pending() -> int:
+    """
+    Fire every registered timer once. Timers returning ``None`` are removed, like in Blender.
+
+    :return: The number of timers that were fired.
+    """
+    fired = 0
+    for function in list(_registered):
+        if function not in _registered:
+            continue
+
+        fired += 1
+        interval = function()
+        if interval is None:
+            _registered.pop(function, None)
+        else:
+            _registered[function] = interval
+
+    return fired
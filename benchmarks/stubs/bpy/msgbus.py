@@ -0,0 +1,16 @@
+"""Stand-in for ``bpy.msgbus``. Subscriptions are recorded so they can be published manually."""
+subscriptions = []
+
+
+def subscribe_rna(*, key, owner, args, notify, options = set()):
+    subscriptions.append((key, owner, args, notify))
+
+
+def clear_by_owner(owner):
+    subscriptions[:] = [subscription for subscription in subscriptions if subscription[1] is not owner]
+
+
+def publish_rna(*, key):
+    for subscribed_key, _owner, args, notify in list(subscriptions):
+        if subscribed_key == key:
+            notify(*args)
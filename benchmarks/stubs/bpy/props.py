@@ -0,0 +1,64 @@
+"""Stand-in for ``bpy.props``. Property functions return deferred definitions, like Blender does."""
+
+
+class _PropertyDeferred:
+    def __init__(self, function, keywords):
+        self.function = function
+        self.keywords = keywords
+
+    def __get__(self, instance, owner):
+        # Properties assigned to a registered class, e.g. `bpy.types.WindowManager.prop = ...`, get a default per instance
+        if instance is None:
+            return self
+
+        from .types import _default_for
+
+        for klass in owner.__mro__:
+            for name, value in vars(klass).items():
+                if value is self:
+                    default = instance.__dict__[name] = _default_for(self)
+                    return default
+
+        return self
+
+    def __repr__(self):
+        return f"<_PropertyDeferred {self.function.__name__} {self.keywords}>"
+
+
+def _deferred(function):
+    def wrapper(**keywords):
+        return _PropertyDeferred(wrapper, keywords)
+
+    wrapper.__name__ = function.__name__
+    return wrapper
+
+
+@_deferred
+def BoolProperty(): ...
+
+@_deferred
+def BoolVectorProperty(): ...
+
+@_deferred
+def CollectionProperty(): ...
+
+@_deferred
+def EnumProperty(): ...
+
+@_deferred
+def FloatProperty(): ...
+
+@_deferred
+def FloatVectorProperty(): ...
+
+@_deferred
+def IntProperty(): ...
+
+@_deferred
+def IntVectorProperty(): ...
+
+@_deferred
+def PointerProperty(): ...
+
+@_deferred
+def StringProperty(): ...
@@ -0,0 +1,590 @@
+"""
+Stand-in for ``bpy.types``.
+
+Only the behaviour CPM relies on is modelled: ID custom properties and their UI data, registrable classes whose
+annotated properties get default values, and layouts that record every call made on them.
+"""
+from . import props as _props
+
+_NUMERIC_UI_DATA = {
+    "float": {
+        "subtype": 'NONE', "description": "", "min": -3.4e38, "max": 3.4e38, "soft_min": -3.4e38,
+        "soft_max": 3.4e38, "step": 0.1, "precision": 3, "default": 0.0
+    },
+    "int": {
+        "subtype": 'NONE', "description": "", "min": -2147483648, "max": 2147483647, "soft_min": -2147483648,
+        "soft_max": 2147483647, "step": 1, "default": 0
+    },
+    "bool": {"subtype": 'NONE', "description": "", "default": False},
+    "str": {"subtype": 'NONE', "description": "", "default": ""},
+}
+
+
+class bpy_struct:
+    """Base of every Blender struct. Annotated ``bpy.props`` definitions become instance defaults."""
+
+    def __init__(self, *args, **kwargs):
+        for klass in reversed(type(self).__mro__):
+            for attr_name, definition in vars(klass).get("__annotations__", {}).items():
+                if isinstance(definition, _props._PropertyDeferred):
+                    object.__setattr__(self, attr_name, _default_for(definition))
+
+    def as_pointer(self) -> int:
+        return id(self)
+
+
+class bpy_prop_collection(list):
+    """A list that also supports ``add``/``remove``/``clear`` and name lookups."""
+
+    def __init__(self, item_type = None):
+        super().__init__()
+        self._item_type = item_type
+
+    def add(self):
+        item = self._item_type() if self._item_type is not None else PropertyGroup()
+        self.append(item)
+        return item
+
+    def remove(self, index):
+        del self[index]
+
+    def get(self, key, default = None):
+        for item in self:
+            if getattr(item, "name", None) == key:
+                return item
+
+        return default
+
+    def find(self, key) -> int:
+        for index, item in enumerate(self):
+            if getattr(item, "name", None) == key:
+                return index
+
+        return -1
+
+
+def _default_for(definition):
+    name = definition.function.__name__
+    keywords = definition.keywords
+    if name == "CollectionProperty":
+        return bpy_prop_collection(keywords.get("type"))
+
+    if name == "PointerProperty":
+        pointer_type = keywords.get("type")
+        return pointer_type() if pointer_type is not None else None
+
+    if "default" in keywords:
+        default = keywords["default"]
+        if name == "EnumProperty" and isinstance(default, int):
+            items = keywords.get("items")
+            return items[default][0] if isinstance(items, (list, tuple)) and default < len(items) else ""
+        if isinstance(default, set):
+            return set(default)
+
+        return default
+
+    if name == "EnumProperty":
+        items = keywords.get("items")
+        options = keywords.get("options", set())
+        if 'ENUM_FLAG' in options:
+            return set()
+        if isinstance(items, (list, tuple)) and items:
+            return items[0][0]
+
+        return ""
+
+    return {
+        "BoolProperty": False,
+        "IntProperty": 0,
+        "FloatProperty": 0.0,
+        "StringProperty": "",
+        "BoolVectorProperty": [False, False, False],
+        "IntVectorProperty": [0, 0, 0],
+        "FloatVectorProperty": [0.0, 0.0, 0.0],
+    }.get(name)
+
+
+class IDPropertyArray(list):
+    """Typed array ID property. Behaves like a list, as Blender's does for reading."""
+
+    def to_list(self) -> list:
+        return list(self)
+
+    @property
+    def typecode(self) -> str:
+        if self and isinstance(self[0], bool):
+            return "b"
+        if self and isinstance(self[0], int):
+            return "i"
+
+        return "d"
+
+
+class IDPropertyGroup(dict):
+    """Nested ID property group (the PYTHON property type)."""
+
+    def to_dict(self) -> dict:
+        return {
+            key: value.to_dict() if isinstance(value, IDPropertyGroup)
+            else value.to_list() if isinstance(value, IDPropertyArray)
+            else list(value) if isinstance(value, list)
+            else value
+            for key, value in self.items()
+        }
+
+
+def _convert_value(value):
+    if isinstance(value, IDPropertyGroup):
+        return IDPropertyGroup({key: _convert_value(item) for key, item in value.items()})
+    if isinstance(value, dict):
+        return IDPropertyGroup({key: _convert_value(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        if value and all(isinstance(item, (bool, int, float)) for item in value):
+            # Numeric arrays are promoted to the widest element type, as Blender does
+            if any(isinstance(item, float) for item in value):
+                return IDPropertyArray(float(item) for item in value)
+
+            return IDPropertyArray(value)
+
+        return [_convert_value(item) for item in value]
+
+    return value
+
+
+class _IDPropertyUIManager:
+    def __init__(self, owner, prop_name):
+        self._owner = owner
+        self._prop_name = prop_name
+
+    def _base(self) -> dict:
+        value = self._owner._properties[self._prop_name]
+        if isinstance(value, IDPropertyGroup):
+            raise TypeError(f"IDProperty \"{self._prop_name}\" does not support UI data")
+        if isinstance(value, (IDPropertyArray, list)):
+            kind = type(value[0]).__name__ if value else "float"
+            base = dict(_NUMERIC_UI_DATA.get(kind, _NUMERIC_UI_DATA["float"]))
+            base["default"] = [base["default"]] * len(value)
+            return base
+        if isinstance(value, ID) or value is None:
+            return {"description": "", "id_type": "OBJECT"}
+
+        return dict(_NUMERIC_UI_DATA.get(type(value).__name__, {"description": ""}))
+
+    def as_dict(self) -> dict:
+        data = self._base()
+        data.update(self._owner._ui_data.get(self._prop_name, {}))
+        return data
+
+    def update(self, **kwargs):
+        self._base()
+        self._owner._ui_data.setdefault(self._prop_name, {}).update(kwargs)
+
+    def update_from(self, other):
+        self.update(**other.as_dict())
+
+    def clear(self):
+        self._owner._ui_data.pop(self._prop_name, None)
+
+
+class _RNAProperty:
+    def __init__(self, enum_items):
+        self.enum_items = enum_items
+
+
+class _EnumItem:
+    def __init__(self, identifier):
+        self.identifier = identifier
+        self.name = identifier.title()
+        self.description = ""
+
+
+class _BlRNA:
+    properties = {
+        "id_type": _RNAProperty([_EnumItem(identifier) for identifier in ("OBJECT", "MESH", "MATERIAL")])
+    }
+
+
+class ID(bpy_struct):
+    """Any data-block. Stores custom properties like Blender's ``IDProperty`` root group."""
+    bl_rna = _BlRNA()
+
+    def __init__(self, name: str = ""):
+        super().__init__()
+        self.name = name
+        self.library = None
+        self.override_library = None
+        self.users = 1
+        self.is_evaluated = False
+        self._properties = {}
+        self._ui_data = {}
+        self._overridable = set()
+
+    # Custom property access
+    def keys(self):
+        return list(self._properties.keys())
+
+    def values(self):
+        return list(self._properties.values())
+
+    def items(self):
+        return list(self._properties.items())
+
+    def get(self, key, default = None):
+        return self._properties.get(key, default)
+
+    def pop(self, key, *default):
+        self._ui_data.pop(key, None)
+        return self._properties.pop(key, *default)
+
+    def __getitem__(self, key):
+        return self._properties[key]
+
+    def __setitem__(self, key, value):
+        old_value = self._properties.get(key)
+        new_value = _convert_value(value)
+        if type(old_value) is not type(new_value):
+            self._ui_data.pop(key, None)
+
+        self._properties[key] = new_value
+
+    def __delitem__(self, key):
+        del self._properties[key]
+        self._ui_data.pop(key, None)
+
+    def __contains__(self, key):
+        return key in self._properties
+
+    def __len__(self):
+        return len(self._properties)
+
+    def id_properties_ui(self, key):
+        if key not in self._properties:
+            raise KeyError(f"Property \"{key}\" not found")
+
+        return _IDPropertyUIManager(self, key)
+
+    def is_property_overridable_library(self, path: str) -> bool:
+        return path in self._overridable
+
+    def property_overridable_library_set(self, path: str, overridable: bool) -> bool:
+        if overridable:
+            self._overridable.add(path)
+        else:
+            self._overridable.discard(path)
+
+        return True
+
+    @property
+    def original(self):
+        return self
+
+    @property
+    def id_data(self):
+        return self
+
+    def path_resolve(self, path: str, coerce: bool = True):
+        """Resolves attribute paths like ``pose.bones``. Collection lookups are not modelled."""
+        value = self
+        for attr in path.split("."):
+            if not hasattr(value, attr):
+                raise ValueError(f"Path could not be resolved: {path!r}")
+
+            value = getattr(value, attr)
+
+        return value
+
+    def update_tag(self, refresh = None):
+        pass
+
+
+class Object(ID):
+    id_type = 'OBJECT'
+
+    def __init__(self, name: str = "", data = None):
+        super().__init__(name)
+        self.data = data
+        self.type = 'EMPTY' if data is None else getattr(data, "_object_type", 'MESH')
+        self.pose = None
+        self.active_material = None
+        self._selected = False
+
+    def select_get(self, view_layer = None) -> bool:
+        return self._selected
+
+    def select_set(self, state: bool, view_layer = None):
+        self._selected = state
+
+
+class Scene(ID):
+    id_type = 'SCENE'
+
+    def __init__(self, name: str = ""):
+        super().__init__(name)
+        self.world = None
+
+
+class Mesh(ID):
+    id_type = 'MESH'
+    _object_type = 'MESH'
+
+
+class Material(ID):
+    id_type = 'MATERIAL'
+
+
+class Light(ID):
+    id_type = 'LIGHT'
+    _object_type = 'LIGHT'
+
+
+class Camera(ID):
+    id_type = 'CAMERA'
+    _object_type = 'CAMERA'
+
+
+class Curve(ID):
+    id_type = 'CURVE'
+    _object_type = 'CURVE'
+
+
+class Armature(ID):
+    id_type = 'ARMATURE'
+    _object_type = 'ARMATURE'
+
+
+class Collection(ID):
+    id_type = 'COLLECTION'
+
+
+class NodeTree(ID):
+    id_type = 'NODETREE'
+
+
+class World(ID):
+    id_type = 'WORLD'
+
+
+class Texture(ID):
+    id_type = 'TEXTURE'
+
+
+class Image(ID):
+    id_type = 'IMAGE'
+
+
+class Action(ID):
+    id_type = 'ACTION'
+
+
+class WindowManager(ID):
+    def __init__(self, name: str = "WinMan"):
+        super().__init__(name)
+        self.windows = []
+        self.progress_calls = []
+
+    def progress_begin(self, min_value, max_value):
+        self.progress_calls.append(("begin", min_value, max_value))
+
+    def progress_update(self, value):
+        self.progress_calls.append(("update", value))
+
+    def progress_end(self):
+        self.progress_calls.append(("end",))
+
+    def invoke_props_dialog(self, operator, **kwargs):
+        return {'RUNNING_MODAL'}
+
+    def invoke_search_popup(self, operator):
+        pass
+
+    def invoke_popup(self, operator, **kwargs):
+        return {'RUNNING_MODAL'}
+
+    def fileselect_add(self, operator):
+        return {'RUNNING_MODAL'}
+
+
+class ViewLayer(bpy_struct):
+    """View layers are not IDs, but they do hold custom properties."""
+
+    def __init__(self, name: str = "ViewLayer"):
+        super().__init__()
+        self.name = name
+        self._properties = {}
+        self._ui_data = {}
+        self._overridable = set()
+
+    keys = ID.keys
+    values = ID.values
+    items = ID.items
+    get = ID.get
+    pop = ID.pop
+    __getitem__ = ID.__getitem__
+    __setitem__ = ID.__setitem__
+    __delitem__ = ID.__delitem__
+    __contains__ = ID.__contains__
+    __len__ = ID.__len__
+    id_properties_ui = ID.id_properties_ui
+    is_property_overridable_library = ID.is_property_overridable_library
+    property_overridable_library_set = ID.property_overridable_library_set
+
+
+class _OperatorProperties:
+    """Returned by ``UILayout.operator``. Records the properties assigned to the button."""
+
+    def __init__(self, idname):
+        object.__setattr__(self, "bl_idname", idname)
+        object.__setattr__(self, "assigned", {})
+
+    def __setattr__(self, key, value):
+        self.assigned[key] = value
+
+
+class UILayout:
+    """A layout that records every call made on it (and on its children) in ``calls``."""
+
+    def __init__(self, calls: list = None):
+        self.calls = calls if calls is not None else []
+        self.enabled = True
+        self.active = True
+        self.alignment = 'EXPAND'
+        self.use_property_split = False
+        self.use_property_decorate = True
+        self.scale_y = 1.0
+
+    def _child(self, kind, **kwargs):
+        self.calls.append((kind, kwargs))
+        return UILayout(self.calls)
+
+    def row(self, **kwargs):
+        return self._child("row", **kwargs)
+
+    def column(self, **kwargs):
+        return self._child("column", **kwargs)
+
+    def box(self):
+        return self._child("box")
+
+    def split(self, **kwargs):
+        return self._child("split", **kwargs)
+
+    def grid_flow(self, **kwargs):
+        return self._child("grid_flow", **kwargs)
+
+    def column_flow(self, **kwargs):
+        return self._child("column_flow", **kwargs)
+
+    def panel(self, idname, **kwargs):
+        self.calls.append(("panel", {"idname": idname, **kwargs}))
+        return UILayout(self.calls), UILayout(self.calls)
+
+    def label(self, **kwargs):
+        self.calls.append(("label", kwargs))
+
+    def prop(self, data = None, property = None, **kwargs):
+        self.calls.append(("prop", {"data": data, "property": property, **kwargs}))
+
+    def prop_search(self, data, property, search_data, search_property, **kwargs):
+        self.calls.append(("prop_search", {"property": property, **kwargs}))
+
+    def operator(self, operator, **kwargs):
+        properties = _OperatorProperties(operator)
+        self.calls.append(("operator", {"operator": operator, **kwargs}))
+        return properties
+
+    def separator(self, **kwargs):
+        self.calls.append(("separator", kwargs))
+
+    def template_list(self, listtype_name, list_id, dataptr, propname, active_dataptr, active_propname, **kwargs):
+        self.calls.append(("template_list", {"listtype_name": listtype_name, "list_id": list_id, **kwargs}))
+
+    def menu(self, menu, **kwargs):
+        self.calls.append(("menu", {"menu": menu, **kwargs}))
+
+    def progress(self, **kwargs):
+        self.calls.append(("progress", kwargs))
+
+
+class Operator(bpy_struct):
+    # bl_idname and friends are left undefined, so mixins listed after Operator can provide them, as in Blender
+
+    def __init__(self):
+        super().__init__()
+        self.layout = UILayout()
+        self.reports = []
+
+    def report(self, level, message):
+        self.reports.append((level, message))
+
+
+class Panel(bpy_struct):
+    bl_idname = ""
+
+    def __init__(self):
+        super().__init__()
+        self.layout = UILayout()
+
+    def draw(self, context):
+        pass
+
+
+class Menu(Panel):
+    pass
+
+
+class UIList(bpy_struct):
+    bitflag_filter_item = 1 << 30
+
+    def __init__(self):
+        super().__init__()
+        self.layout = UILayout()
+        self.filter_name = ""
+        self.use_filter_sort_alpha = False
+        self.use_filter_invert = False
+
+
+class UI_UL_list(UIList):
+    @staticmethod
+    def filter_items_by_name(pattern, bitflag, items, propname = "name", flags = None, reverse = False):
+        pattern = pattern.lower().strip("*")
+        if not flags:
+            flags = [0] * len(items)
+        for index, item in enumerate(items):
+            matched = pattern in getattr(item, propname).lower()
+            if matched != reverse:
+                flags[index] |= bitflag
+
+        return flags
+
+    @staticmethod
+    def sort_items_by_name(items, propname = "name"):
+        order = sorted(range(len(items)), key = lambda index: getattr(items[index], propname).lower())
+        return [order.index(index) for index in range(len(items))]
+
+
+class PropertyGroup(bpy_struct):
+    pass
+
+
+class AddonPreferences(bpy_struct):
+    bl_idname = ""
+
+    def __init__(self):
+        super().__init__()
+        self.layout = UILayout()
+
+
+class Depsgraph:
+    def __init__(self, updates = ()):
+        self.updates = list(updates)
+
+
+class DepsgraphUpdate:
+    def __init__(self, id_data, is_updated_geometry = False, is_updated_transform = False):
+        self.id = id_data
+        self.is_updated_geometry = is_updated_geometry
+        self.is_updated_transform = is_updated_transform
+
+
+class LayerObjects(bpy_struct):
+    pass
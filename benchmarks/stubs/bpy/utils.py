@@ -0,0 +1,53 @@
+"""Stand-in for ``bpy.utils``."""
+import os
+import re
+import tempfile
+
+from . import types
+
+_USER_ROOT = os.path.join(tempfile.gettempdir(), "cpm_fake_bpy_user")
+
+
+def _rna_name(cls) -> str:
+    idname = getattr(cls, "bl_idname", "")
+    if issubclass(cls, types.Operator) and "." in idname:
+        category, operation = idname.split(".", 1)
+        return f"{category.upper()}_OT_{operation}"
+
+    return cls.__name__
+
+
+def register_class(cls):
+    setattr(types, _rna_name(cls), cls)
+    if _rna_name(cls) != cls.__name__:
+        setattr(types, cls.__name__, cls)
+
+
+def unregister_class(cls):
+    for name in {_rna_name(cls), cls.__name__}:
+        if getattr(types, name, None) is cls:
+            delattr(types, name)
+
+
+def extension_path_user(package: str, *, path: str = "", create: bool = False) -> str:
+    directory = os.path.join(_USER_ROOT, "extensions", ".user", package, path)
+    if create:
+        os.makedirs(directory, exist_ok = True)
+
+    return directory
+
+
+def user_resource(resource_type: str, *, path: str = "", create: bool = False) -> str:
+    directory = os.path.join(_USER_ROOT, resource_type.lower(), path)
+    if create:
+        os.makedirs(directory, exist_ok = True)
+
+    return directory
+
+
+def escape_identifier(string: str) -> str:
+    return string.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def unescape_identifier(string: str) -> str:
+    return re.sub(r'\\(.)', r'\1', string)
@@ -1,17 +1,46 @@
+from .entities.cache_stats import CacheStats
+from .entities.draw_model import DrawModel
 from .entities.field import Field
 from .entities.field_configs import FieldNames, field_configs
 from .entities.group_data import GroupData
+from .entities.group_name_index import GroupNameIndex
+from .entities.job import Job
+from .entities.list_mirror import ListMirror
+from .entities.property_index import PropertyIndex
+from .entities.property_preset import PropertyPreset
+from .entities.property_snapshot import PropertySnapshot
+from .entities.property_table import PropertyTable
 from .entities.reporting_mixin import ReportingMixin
-from .entities.state import expand_states, original_draws
+from .entities.selection_view import SelectionView
+from .entities.state import (
+    draw_models,
+    list_mirrors,
+    list_view_panels,
+    original_draws,
+    startup_timings
+)
 from .entities.ui_data import UIData
 
 __all__ = [
     "GroupData",
     "ReportingMixin",
     "Field",
-    "expand_states",
+    "draw_models",
+    "list_view_panels",
+    "list_mirrors",
     "original_draws",
+    "startup_timings",
     "field_configs",
     "FieldNames",
-    "UIData"
+    "UIData",
+    "PropertySnapshot",
+    "PropertyPreset",
+    "CacheStats",
+    "Job",
+    "DrawModel",
+    "ListMirror",
+    "PropertyIndex",
+    "PropertyTable",
+    "SelectionView",
+    "GroupNameIndex"
 ]
\ No newline at end of file
@@ -0,0 +1,17 @@
+from dataclasses import asdict, dataclass, fields
+
+@dataclass
+class CacheStats:
+    """Counters of a cache's activity since they were last reset."""
+    hits: int = 0
+    misses: int = 0
+    parses: int = 0
+    verify_prunes: int = 0
+    evictions: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+    def reset(self):
+        for counter in fields(self):
+            setattr(self, counter.name, 0)
\ No newline at end of file
@@ -0,0 +1,80 @@
+from dataclasses import dataclass, field
+
+from .property_index import PropertyIndex
+
+@dataclass
+class DrawModel:
+    """
+    What a custom properties panel draws for a data object: its groups and ungrouped properties in drawing order. It is
+    valid as long as the data object's group data generation and property names are unchanged.
+    """
+    generation: int
+    keys: list[str]
+    groups: list[tuple[str, list[str]]]
+    ungrouped: list[str]
+    # Built on the first search, and dropped along with the draw model once it is invalid
+    _index: PropertyIndex | None = field(default = None, repr = False)
+    _positions: dict[str, tuple[int, str]] = field(default_factory = dict, repr = False)
+    _filtered: dict[str, "DrawModel"] = field(default_factory = dict, repr = False)
+
+    def is_valid(self, generation: int, keys: list[str]) -> bool:
+        return self.generation == generation and self.keys == keys
+
+    def filter(self, query: str, cache_size: int) -> "DrawModel":
+        """
+        Gets the draw model restricted to the properties matching a search query. Results are cached per query, and
+        only the matching properties are visited to build them.
+
+        :param query: The search query, matched with a `PropertyIndex`.
+        :param cache_size: The number of most recent queries to keep results for.
+
+        :return: The filtered draw model, which lists every group with a match. Returns this draw model if the query
+        does not filter anything.
+        """
+        filtered = self._filtered.get(query)
+        if filtered is not None:
+            return filtered
+
+        if self._index is None:
+            self._build_index()
+
+        matches = self._index.search(query)
+        if matches is None:
+            return self
+
+        groups: dict[str, list[str]] = {}
+        ungrouped = []
+        for prop_name in sorted(matches, key = self._positions.__getitem__):
+            group_name = self._positions[prop_name][1]
+            if group_name is None:
+                ungrouped.append(prop_name)
+            else:
+                groups.setdefault(group_name, []).append(prop_name)
+
+        filtered = DrawModel(
+            generation = self.generation,
+            keys = self.keys,
+            groups = list(groups.items()),
+            ungrouped = ungrouped
+        )
+        if len(self._filtered) >= cache_size:
+            # Forget the oldest query
+            del self._filtered[next(iter(self._filtered))]
+
+        self._filtered[query] = filtered
+
+        return filtered
+
+    def _build_index(self):
+        position = 0
+        for group_name, props in self.groups:
+            for prop_name in props:
+                self._positions[prop_name] = (position, group_name)
+                position += 1
+
+        for prop_name in self.ungrouped:
+            if not prop_name.startswith("_"):
+                self._positions[prop_name] = (position, None)
+                position += 1
+
+        self._index = PropertyIndex(list(self._positions))
\ No newline at end of file
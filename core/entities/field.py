@@ -1,3 +1,5 @@
+import functools
+
 import bpy
 
 from typing import Any, List, Optional, Union, get_type_hints
@@ -181,7 +183,7 @@ class Field(ReportingMixin):
         :return: The generated ui data attribute name.
         """
         ui_data_attr = self.attr_prefix.removesuffix("_").removesuffix("_array")
-        search_result = ui_data_attr in get_type_hints(UIData).keys()
+        search_result = ui_data_attr in _get_ui_data_attrs()
 
         self.logger.log(
             level = LogLevel.DEBUG,
@@ -203,4 +205,9 @@ class Field(ReportingMixin):
             }
         )
 
-        return None
\ No newline at end of file
+        return None
+
+@functools.cache
+def _get_ui_data_attrs() -> frozenset[str]:
+    """The keys UIData may contain. Resolving type hints is slow, so they are resolved once, when first needed."""
+    return frozenset(get_type_hints(UIData))
\ No newline at end of file
@@ -1,4 +1,6 @@
-﻿from typing import ItemsView, Iterator, KeysView, List, ValuesView
+﻿import sys
+from bisect import insort
+from typing import ItemsView, Iterator, KeysView, List, ValuesView
 
 import bpy
 
@@ -7,17 +9,40 @@ from ...shared import consts
 
 class GroupData(ReportingMixin):
     cached_data: dict[str, list[str]]
+    # Order mode of each group. Groups without one are sorted alphabetically.
+    order_modes: dict[str, str]
+    # Names of the collapsed groups. Groups are expanded by default.
+    collapsed_groups: set[str]
+    # Paths of the expanded nodes of Python property trees. Nodes are collapsed by default.
+    expanded_trees: set[str]
+    # Names of the pinned groups, which the sidebar can be limited to
+    pinned_groups: set[str]
     _group_data_name: str
 
-    def __init__(self, group_data: dict[str, list[str]] = None):
+    def __init__(
+            self,
+            group_data: dict[str, list[str]] = None,
+            order_modes: dict[str, str] = None,
+            collapsed_groups: set[str] = None,
+            expanded_trees: set[str] = None,
+            pinned_groups: set[str] = None):
         """
-        Initialize GroupData.
+        Initialize GroupData. Properties of alphabetically ordered groups are sorted once here, and kept in order as
+        they change afterward, so the groups never have to be sorted when they are drawn.
         :param group_data: A string representing the serialized group data.
+        :param order_modes: The order mode of each group, one of the GroupOrderModes values.
+        :param collapsed_groups: The names of the collapsed groups.
+        :param expanded_trees: The paths of the expanded tree nodes, see `get_tree_path`.
+        :param pinned_groups: The names of the pinned groups.
         """
 
         # Remove ourselves from the property list to avoid recursion
         super().__init__()
         self.cached_data = group_data
+        self.order_modes = order_modes or {}
+        self.collapsed_groups = collapsed_groups or set()
+        self.expanded_trees = expanded_trees or set()
+        self.pinned_groups = pinned_groups or set()
         self._group_data_name = consts.CPM_SERIALIZED_GROUP_DATA
         if self._group_data_name in self:
             del self[self._group_data_name]
@@ -25,6 +50,49 @@ class GroupData(ReportingMixin):
         if group_data is None:
             raise ValueError("Argument `group_data` cannot be empty.")
 
+        for group_name, props in self.cached_data.items():
+            if self.get_order_mode(group_name) == consts.GroupOrderModes.ALPHABETICAL:
+                props.sort(key = _sort_key)
+
+    @classmethod
+    def from_stored(cls, stored: dict) -> "GroupData":
+        """
+        Creates group data from its stored form, as written by `serialize`. Group data stored before the format was
+        versioned is a mapping of group names to properties.
+
+        :param stored: The stored group data.
+
+        :return: The group data.
+        """
+        if isinstance(stored.get("version"), int):
+            return cls(
+                group_data = stored.get("groups", {}),
+                order_modes = stored.get("order_modes", {}),
+                collapsed_groups = set(stored.get("collapsed_groups", ())),
+                expanded_trees = set(stored.get("expanded_trees", ())),
+                pinned_groups = set(stored.get("pinned_groups", ()))
+            )
+
+        return cls(group_data = stored)
+
+    def serialize(self) -> dict:
+        """
+        Gets the group data in the form it is stored in.
+
+        :return: The group data, its order modes, its expand and pin state and the version of the format.
+        """
+        return {
+            "version": consts.GROUP_DATA_VERSION,
+            "groups": self.as_dict(),
+            "order_modes": {
+                group_name: order_mode for group_name, order_mode in self.order_modes.items()
+                if group_name in self.cached_data
+            },
+            "collapsed_groups": sorted(self.collapsed_groups.intersection(self.cached_data)),
+            "expanded_trees": sorted(self.expanded_trees),
+            "pinned_groups": sorted(self.pinned_groups.intersection(self.cached_data))
+        }
+
     def __delitem__(self, key) -> bool:
         """
         Removes the specified property from the group dataset.
@@ -54,6 +122,8 @@ class GroupData(ReportingMixin):
         :param value: The list of properties to set for the provided group.
         """
         self.cached_data[key] = value
+        if self.get_order_mode(key) == consts.GroupOrderModes.ALPHABETICAL:
+            value.sort(key = _sort_key)
 
     def __iter__(self) -> Iterator[str]:
         """
@@ -119,7 +189,12 @@ class GroupData(ReportingMixin):
         for group, props in self.cached_data.items():
             if prop_name in props:
                 index = props.index(prop_name)
-                props[index] = new_name
+                if self.get_order_mode(group) == consts.GroupOrderModes.ALPHABETICAL:
+                    # The new name may belong elsewhere in the group
+                    del props[index]
+                    insort(props, new_name, key = _sort_key)
+                else:
+                    props[index] = new_name
                 found = True
                 break
 
@@ -144,15 +219,14 @@ class GroupData(ReportingMixin):
         if not new_group:
             return
 
-        for group_name, props in self.cached_data.items():
-            if group_name == new_group:
-                props.append(prop_name)
-                return
+        if new_group in self.cached_data:
+            self._insert(new_group, prop_name)
+            return
 
         # Group does not exist, create it
         self.cached_data[new_group] = [prop_name]
 
-    def verify(self, data_object: bpy.types.Object):
+    def verify(self, data_object: bpy.types.Object) -> int:
         """
         Verifies the group data of the provided blender object. During this
         process, the cache is automatically updated.
@@ -160,21 +234,65 @@ class GroupData(ReportingMixin):
         :param data_object: (bpy.types.Object) The blender object that
         will be synchronized.
 
-        :return: None
+        :return: The number of stale entries that were removed.
         """
 
-        # Clean up any unused properties from the group data
-        # Retrieve properties to be removed
+        # Clean up any unused properties from the group data. Each group is filtered in a single pass, since removing
+        # properties one at a time rescans every group per property.
         data_object_keys = set(data_object.keys())
-        keys_to_remove = []
-        for group in self.cached_data.values():
-            for prop in group:
-                if prop not in data_object_keys or prop.startswith("_"):
-                    keys_to_remove.append(prop)
+        pruned = 0
+        for props in self.cached_data.values():
+            if any(prop not in data_object_keys or prop.startswith("_") for prop in props):
+                kept = [
+                    prop for prop in props
+                    if prop in data_object_keys and not prop.startswith("_")
+                ]
+                pruned += len(props) - len(kept)
+                props[:] = kept
+
+        # Expand and pin state of removed groups and properties is dropped as well. It is only UI state, so it is not
+        # counted as stale entries and does not cause a save on its own.
+        self.collapsed_groups.intersection_update(self.cached_data)
+        self.pinned_groups.intersection_update(self.cached_data)
+        self.expanded_trees = {
+            path for path in self.expanded_trees
+            if path.partition(consts.TREE_PATH_SEPARATOR)[0] in data_object_keys
+        }
+
+        return pruned
+
+    def assign_groups(self, assignments: dict[str, str]):
+        """
+        Moves many properties to new groups at once. Unlike calling `update_property_group` for each property, every
+        group is only scanned once.
 
-        # Remove properties from GroupData
-        for key in keys_to_remove:
-            del self[key]
+        :param assignments: A mapping of property names to the name of their new group. An empty group name leaves the
+        property ungrouped.
+        """
+        if not assignments:
+            return
+
+        # Remove the properties from their old groups
+        for group_name, props in self.cached_data.items():
+            props[:] = [prop for prop in props if prop not in assignments]
+
+        # Place the properties into their new groups, creating groups as needed
+        for prop_name, new_group in assignments.items():
+            if new_group:
+                self.cached_data.setdefault(new_group, [])
+                self._insert(new_group, prop_name)
+
+    def get_property_groups(self) -> dict[str, str]:
+        """
+        Builds a reverse lookup of the group data.
+
+        :return: A mapping of property names to the name of the group they belong to.
+        """
+        return {
+            prop_name: group_name
+            for group_name, props in self.cached_data.items()
+            for prop_name in props
+        }
 
     def get_group_name(self, prop_name: str) -> str:
         for group_name, props in self.cached_data.items():
@@ -184,5 +302,127 @@ class GroupData(ReportingMixin):
         # Property wasn't found in any group
         return ""
 
+    def get_order_mode(self, group_name: str) -> str:
+        """
+        :param group_name: The name of the group.
+
+        :return: How the properties of the group are ordered, one of the GroupOrderModes values.
+        """
+        return self.order_modes.get(group_name, consts.GroupOrderModes.ALPHABETICAL)
+
+    def set_order_mode(self, group_name: str, order_mode: str):
+        """
+        Sets how the properties of a group are ordered. Switching to alphabetical order sorts the group once, while
+        switching to manual order keeps the current order.
+
+        :param group_name: The name of the group.
+        :param order_mode: One of the GroupOrderModes values.
+        """
+        self.order_modes[group_name] = order_mode
+        if order_mode == consts.GroupOrderModes.ALPHABETICAL and group_name in self.cached_data:
+            self.cached_data[group_name].sort(key = _sort_key)
+
+    def move_property(self, prop_name: str, offset: int) -> bool:
+        """
+        Moves a property within its group. The group is switched to manual order, so the move sticks.
+
+        :param prop_name: The name of the property to move.
+        :param offset: How many places to move the property, negative to move it up.
+
+        :return: True if the property was moved, False if it is not grouped or cannot move any further.
+        """
+        for group_name, props in self.cached_data.items():
+            if prop_name not in props:
+                continue
+
+            index = props.index(prop_name)
+            new_index = index + offset
+            if not 0 <= new_index < len(props):
+                return False
+
+            self.order_modes[group_name] = consts.GroupOrderModes.MANUAL
+            props.insert(new_index, props.pop(index))
+
+            return True
+
+        return False
+
+    def is_group_expanded(self, group_name: str) -> bool:
+        return group_name not in self.collapsed_groups
+
+    def toggle_group(self, group_name: str):
+        """
+        Expands a collapsed group, or collapses an expanded one.
+
+        :param group_name: The name of the group.
+        """
+        if group_name in self.collapsed_groups:
+            self.collapsed_groups.remove(group_name)
+        else:
+            self.collapsed_groups.add(group_name)
+
+    def toggle_tree(self, path: str):
+        """
+        Expands a collapsed tree node, or collapses an expanded one.
+
+        :param path: The path of the node, see `get_tree_path`.
+        """
+        if path in self.expanded_trees:
+            self.expanded_trees.remove(path)
+        else:
+            self.expanded_trees.add(path)
+
+    def toggle_pinned(self, group_name: str):
+        """
+        Pins an unpinned group, or unpins a pinned one.
+
+        :param group_name: The name of the group.
+        """
+        if group_name in self.pinned_groups:
+            self.pinned_groups.remove(group_name)
+        else:
+            self.pinned_groups.add(group_name)
+
+    @staticmethod
+    def get_tree_path(parent_path: str, key) -> str:
+        """
+        Gets the path of a node in the tree view of a Python property.
+
+        :param parent_path: The path of the parent node, or the property name for the top level nodes.
+        :param key: The key of the node in its parent.
+
+        :return: The path of the node.
+        """
+        return parent_path + consts.TREE_PATH_SEPARATOR + str(key)
+
+    def _insert(self, group_name: str, prop_name: str):
+        """Inserts a property into a group, at its sorted position if the group is ordered alphabetically."""
+        props = self.cached_data[group_name]
+        if self.get_order_mode(group_name) == consts.GroupOrderModes.ALPHABETICAL:
+            insort(props, prop_name, key = _sort_key)
+        else:
+            props.append(prop_name)
+
+    def get_memory_size(self) -> int:
+        """
+        Estimates the memory used by this group data, by summing the sizes of the objects it holds. Strings shared with
+        other objects are counted as well, so this is an upper bound.
+
+        :return: The estimated size in bytes.
+        """
+        size = sys.getsizeof(self) + sys.getsizeof(self.__dict__) + sys.getsizeof(self.cached_data)
+        for group_name, props in self.cached_data.items():
+            size += sys.getsizeof(group_name) + sys.getsizeof(props)
+            size += sum(sys.getsizeof(prop) for prop in props)
+
+        return size
+
     def clear(self):
-        self.cached_data.clear()
\ No newline at end of file
+        self.cached_data.clear()
+        self.order_modes.clear()
+        self.collapsed_groups.clear()
+        self.expanded_trees.clear()
+        self.pinned_groups.clear()
+
+def _sort_key(prop_name: str) -> str:
+    return prop_name.lower()
\ No newline at end of file
@@ -0,0 +1,85 @@
+from bisect import bisect_left, insort
+from typing import Iterable
+
+class GroupNameIndex:
+    """
+    A prefix index over the group names of many data objects. Names are kept sorted by their case-folded form without
+    surrounding whitespace, so the names starting with a prefix are found by bisecting, and names that only differ in
+    case or whitespace (e.g. "Face" and "face ") are suggested together. Each name is counted once per data object
+    having the group, and stays in the index until the last of them no longer has it.
+    """
+
+    def __init__(self):
+        self._counts: dict[str, int] = {}
+        # (key, name) pairs, sorted
+        self._entries: list[tuple[str, str]] = []
+
+    @staticmethod
+    def get_key(name: str) -> str:
+        """Gets the form names are compared by when searching."""
+        return name.strip().casefold()
+
+    def add(self, names: Iterable[str]):
+        """
+        Counts the group names of a data object.
+
+        :param names: The names, each at most once.
+        """
+        new_entries = []
+        for name in names:
+            count = self._counts.get(name, 0)
+            self._counts[name] = count + 1
+            if not count:
+                new_entries.append((self.get_key(name), name))
+
+        if len(new_entries) == 1:
+            insort(self._entries, new_entries[0])
+        elif new_entries:
+            # Sorting runs of already sorted entries is about as cheap as inserting each of them
+            self._entries.extend(new_entries)
+            self._entries.sort()
+
+    def remove(self, names: Iterable[str]):
+        """
+        Stops counting the group names of a data object.
+
+        :param names: The names, each at most once.
+        """
+        for name in names:
+            count = self._counts.get(name, 0)
+            if count > 1:
+                self._counts[name] = count - 1
+            elif count:
+                del self._counts[name]
+                entry = (self.get_key(name), name)
+                del self._entries[bisect_left(self._entries, entry)]
+
+    def search(self, prefix: str, limit: int) -> list[str]:
+        """
+        Finds the names starting with a prefix, ignoring case and surrounding whitespace.
+
+        :param prefix: The prefix. An empty prefix matches every name.
+        :param limit: The maximum number of names to return.
+
+        :return: The matching names, in sorted order.
+        """
+        key = self.get_key(prefix)
+        start = bisect_left(self._entries, (key, ""))
+        names = []
+        for entry_key, name in self._entries[start:start + limit]:
+            if not entry_key.startswith(key):
+                break
+
+            names.append(name)
+
+        return names
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._counts
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def clear(self):
+        self._counts.clear()
+        self._entries.clear()
\ No newline at end of file
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional
+
+@dataclass(eq = False)
+class Job:
+    """
+    A unit of long-running work, split into steps by a generator. The generator yields the number of steps completed
+    so far after each step, so the work can be paused between any two steps.
+    """
+    name: str
+    steps: Iterator[int]
+    total: int
+    on_finish: Optional[Callable[["Job"], None]] = None
+    progress: int = 0
+    started: bool = False
+    finished: bool = False
+    cancelled: bool = False
+    error: str = ""
+    elapsed: float = 0.0
+
+    @property
+    def fraction(self) -> float:
+        return self.progress / self.total if self.total else 0.0
\ No newline at end of file
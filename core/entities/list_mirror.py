@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+
+from .draw_model import DrawModel
+
+@dataclass
+class ListMirror:
+    """
+    The Python side of a panel's list view. The list itself draws a collection mirroring a draw model, while the keys
+    it filters and sorts on are precomputed here, so filtering does no string work beyond matching.
+    """
+    draw_model: DrawModel
+    # Per row, in the order of the mirrored collection
+    search_keys: list[str]
+    row_groups: list[str]
+    group_rows: list[bool]
+    # Position of each row when sorted alphabetically
+    alpha_order: list[int]
+
+    @classmethod
+    def from_draw_model(cls, draw_model: DrawModel) -> "ListMirror":
+        rows = cls.get_rows(draw_model)
+        search_keys = [name.lower() for name, _group, _is_group in rows]
+        alpha_order = [0] * len(rows)
+        for position, index in enumerate(sorted(range(len(rows)), key = search_keys.__getitem__)):
+            alpha_order[index] = position
+
+        return cls(
+            draw_model = draw_model,
+            search_keys = search_keys,
+            row_groups = [group for _name, group, _is_group in rows],
+            group_rows = [is_group for _name, _group, is_group in rows],
+            alpha_order = alpha_order
+        )
+
+    @staticmethod
+    def get_rows(draw_model: DrawModel) -> list[tuple[str, str, bool]]:
+        """
+        :return: The rows of a list view, as (name, group name, is group header) tuples. Every group is a header row
+        followed by its properties; ungrouped properties come last.
+        """
+        rows = []
+        for group_name, props in draw_model.groups:
+            rows.append((group_name, group_name, True))
+            rows.extend((prop_name, group_name, False) for prop_name in props)
+
+        rows.extend((prop_name, "", False) for prop_name in draw_model.ungrouped if not prop_name.startswith("_"))
+
+        return rows
\ No newline at end of file
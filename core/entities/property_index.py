@@ -0,0 +1,71 @@
+import re
+from bisect import bisect_left
+
+# Words of a property name: acronyms, capitalized or lowercase words, numbers and other letters
+_TOKEN_PATTERN = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+|[^\W\d_]+")
+
+class PropertyIndex:
+    """
+    A search index over property names. Names are split into tokens on underscores, camelCase and digits, e.g.
+    `rigFKArm_2` into `rig`, `fk`, `arm` and `2`. A query matches a name if every token of the query is a prefix or a
+    substring of one of the name's tokens. Prefixes are found by bisecting the sorted tokens, and substrings by scanning
+    the distinct tokens only, which are far fewer than the names in typical files.
+    """
+
+    def __init__(self, names: list[str]):
+        """
+        :param names: The property names to index.
+        """
+        self._names_by_token: dict[str, set[str]] = {}
+        for name in names:
+            for token in self.tokenize(name):
+                self._names_by_token.setdefault(token, set()).add(name)
+
+        self._tokens = sorted(self._names_by_token)
+
+    @staticmethod
+    def tokenize(text: str) -> list[str]:
+        """
+        Splits text into lowercase tokens.
+
+        :param text: The text to split, e.g. a property name or a query.
+
+        :return: The tokens.
+        """
+        return [token.lower() for token in _TOKEN_PATTERN.findall(text)]
+
+    def search(self, query: str) -> set[str] | None:
+        """
+        Finds the names matching a query.
+
+        :param query: The query.
+
+        :return: The matching names, or None if the query has no tokens, i.e. it does not filter anything.
+        """
+        query_tokens = self.tokenize(query)
+        if not query_tokens:
+            return None
+
+        matches = None
+        for query_token in query_tokens:
+            token_matches = self._match_token(query_token)
+            matches = token_matches if matches is None else matches & token_matches
+            if not matches:
+                break
+
+        return matches
+
+    def _match_token(self, query_token: str) -> set[str]:
+        matches = set()
+
+        # Tokens starting with the query token are adjacent in the sorted tokens
+        index = bisect_left(self._tokens, query_token)
+        while index < len(self._tokens) and self._tokens[index].startswith(query_token):
+            matches |= self._names_by_token[self._tokens[index]]
+            index += 1
+
+        for token, names in self._names_by_token.items():
+            if query_token in token and not token.startswith(query_token):
+                matches |= names
+
+        return matches
\ No newline at end of file
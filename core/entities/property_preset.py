@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+from .property_snapshot import PropertySnapshot
+
+@dataclass(frozen = True)
+class PropertyPreset:
+    """A compiled property preset, ready to be applied to any number of Blender data objects."""
+    name: str
+    snapshots: tuple[PropertySnapshot, ...]
+    file_path: str = ""
+
+    def __len__(self) -> int:
+        return len(self.snapshots)
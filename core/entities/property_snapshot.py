@@ -0,0 +1,12 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from .ui_data import UIData
+
+@dataclass(frozen = True)
+class PropertySnapshot:
+    """A detached copy of a single custom property, including its UI data and group membership."""
+    name: str
+    value: Any
+    ui_data: UIData = field(default_factory = UIData)
+    group: str = ""
@@ -0,0 +1,125 @@
+from dataclasses import dataclass, field
+
+@dataclass(eq = False)
+class PropertyTable:
+    """
+    A columnar cache of the custom property values of many data objects. Each column holds the values of one property
+    for every row, along with their display text, so drawing and sorting the table never reads Blender data. Rows are in
+    the order of the collection of data objects they were read from.
+    """
+    row_names: list[str] = field(default_factory = list)
+    # Unique key of each row, e.g. the data path of its data object, since names are only unique within a library
+    row_keys: list[str] = field(default_factory = list)
+    # The values of each column per row, None where the row has no such property
+    values: dict[str, list] = field(default_factory = dict)
+    texts: dict[str, list[str]] = field(default_factory = dict)
+    sort_column: str = ""
+    sort_reverse: bool = False
+    _rows: dict[str, int] = field(default_factory = dict, repr = False)
+    # Sorted position of every row, per column and direction. Dropped once a value of the column changes.
+    _positions: dict[tuple[str, bool], list[int]] = field(default_factory = dict, repr = False)
+
+    def set_rows(self, row_names: list[str], row_keys: list[str]):
+        """Replaces the rows. Columns have to be set again afterward."""
+        self.row_names = row_names
+        self.row_keys = row_keys
+        self._rows = {key: index for index, key in enumerate(row_keys)}
+        self._positions.clear()
+
+    def get_row(self, key: str) -> int | None:
+        return self._rows.get(key)
+
+    def set_column(self, column: str, values: list, texts: list[str]):
+        """
+        Sets the values of a column, adding the column if needed.
+
+        :param column: The name of the property shown in the column.
+        :param values: The value of each row.
+        :param texts: The display text of each row.
+        """
+        self.values[column] = values
+        self.texts[column] = texts
+        self._drop_positions(column)
+
+    def remove_column(self, column: str):
+        self.values.pop(column, None)
+        self.texts.pop(column, None)
+        self._drop_positions(column)
+        if self.sort_column == column:
+            self.sort_column = ""
+
+    def set_cell(self, row: int, column: str, value, text: str) -> bool:
+        """
+        Sets the value of a single cell.
+
+        :return: True if the value changed.
+        """
+        old_value = self.values[column][row]
+        if old_value == value and type(old_value) is type(value):
+            return False
+
+        self.values[column][row] = value
+        self.texts[column][row] = text
+        self._drop_positions(column)
+
+        return True
+
+    def set_sort(self, column: str):
+        """Sorts by a column, reversing the direction if the table is already sorted by it."""
+        if self.sort_column == column:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_column = column
+            self.sort_reverse = False
+
+    def get_positions(self) -> list[int]:
+        """
+        Gets the position of every row in the current sort order, as UI lists expect it. Rows without a value are
+        always last. Positions are computed once per column and direction until the column changes.
+
+        :return: The position of each row, or an empty list if the table is not sorted.
+        """
+        if self.sort_column not in self.values:
+            return []
+
+        key = (self.sort_column, self.sort_reverse)
+        positions = self._positions.get(key)
+        if positions is not None:
+            return positions
+
+        values = self.values[self.sort_column]
+        present = [row for row, value in enumerate(values) if value is not None]
+        present.sort(key = lambda row: _sort_key(values[row]), reverse = self.sort_reverse)
+        missing = [row for row, value in enumerate(values) if value is None]
+
+        positions = [0] * len(values)
+        for position, row in enumerate(present + missing):
+            positions[row] = position
+
+        self._positions[key] = positions
+
+        return positions
+
+    def clear(self):
+        self.row_names = []
+        self.row_keys = []
+        self._rows.clear()
+        self.values.clear()
+        self.texts.clear()
+        self._positions.clear()
+        self.sort_column = ""
+        self.sort_reverse = False
+
+    def _drop_positions(self, column: str):
+        self._positions.pop((column, False), None)
+        self._positions.pop((column, True), None)
+
+def _sort_key(value) -> tuple:
+    """Sorts numbers before text, and text before other values, so a column of mixed types can still be sorted."""
+    if isinstance(value, (bool, int, float)):
+        return 0, value, ""
+
+    if isinstance(value, str):
+        return 1, 0, value.casefold()
+
+    return 2, 0, repr(value)
\ No newline at end of file
@@ -0,0 +1,23 @@
+from dataclasses import dataclass, field
+
+@dataclass(eq = False)
+class SelectionView:
+    """
+    The union of the groups and properties of several data objects, along with the value each property has on all of
+    them. Properties whose values differ between the data objects are mixed. It is valid as long as the data objects and
+    their value generations are unchanged.
+    """
+    # The memory address and value generation of each data object, in drawing order
+    key: tuple[tuple[int, int], ...] = ()
+    groups: list[tuple[str, list[str]]] = field(default_factory = list)
+    ungrouped: list[str] = field(default_factory = list)
+    # Number of data objects having each property
+    counts: dict[str, int] = field(default_factory = dict)
+    # The value shared by every data object having the property, and its display text. Mixed properties have neither.
+    values: dict[str, object] = field(default_factory = dict)
+    texts: dict[str, str] = field(default_factory = dict)
+    mixed: set[str] = field(default_factory = set)
+
+    @property
+    def object_count(self) -> int:
+        return len(self.key)
@@ -1,2 +1,11 @@
 original_draws = {}
-expand_states = {}
\ No newline at end of file
+
+# Draw models of the data objects drawn by the custom properties panels, keyed by their memory address
+draw_models = {}
+
+# Names of the panels drawn as list views, and the Python side of each list view keyed by its data path
+list_view_panels = set()
+list_mirrors = {}
+
+# Durations of the add-on's startup phases, in seconds
+startup_timings = {}
\ No newline at end of file
@@ -1,7 +1,25 @@
 from .ops.add_property_group import AddPropertyGroupOperator
+from .ops.add_table_column import AddTableColumnOperator
+from .ops.apply_preset import ApplyPresetOperator
+from .ops.cancel_jobs import CancelJobsOperator
+from .ops.capture_profile import CaptureProfileOperator
+from .ops.copy_properties import CopyPropertiesOperator
 from .ops.edit_property_menu.edit_property_menu import EditPropertyMenuOperator
+from .ops.edit_selected_property import EditSelectedPropertyOperator
+from .ops.edit_table_cell import EditTableCellOperator
+from .ops.estimate_cache_memory import EstimateCacheMemoryOperator
 from .ops.expand_toggle import ExpandToggleOperator
+from .ops.export_spans import ExportSpansOperator
+from .ops.move_property import MovePropertyOperator
+from .ops.refresh_table import RefreshTableOperator
 from .ops.remove_property_group import RemovePropertyGroupOperator
+from .ops.remove_table_column import RemoveTableColumnOperator
+from .ops.reset_spans import ResetSpansOperator
+from .ops.save_preset import SavePresetOperator
+from .ops.set_group_order import SetGroupOrderOperator
+from .ops.sort_table import SortTableOperator
+from .ops.toggle_pinned_group import TogglePinnedGroupOperator
+from .ops.verify_all_group_data import VerifyAllGroupDataOperator
 from .ops.edit_property_menu.default_array_element import DefaultArrayElement
 
 __all__ = [
@@ -10,4 +28,22 @@ __all__ = [
     "EditPropertyMenuOperator",
     "RemovePropertyGroupOperator",
     "DefaultArrayElement",
+    "CopyPropertiesOperator",
+    "ApplyPresetOperator",
+    "SavePresetOperator",
+    "ExportSpansOperator",
+    "ResetSpansOperator",
+    "CaptureProfileOperator",
+    "VerifyAllGroupDataOperator",
+    "CancelJobsOperator",
+    "MovePropertyOperator",
+    "SetGroupOrderOperator",
+    "AddTableColumnOperator",
+    "RemoveTableColumnOperator",
+    "SortTableOperator",
+    "EditTableCellOperator",
+    "RefreshTableOperator",
+    "TogglePinnedGroupOperator",
+    "EditSelectedPropertyOperator",
+    "EstimateCacheMemoryOperator",
 ]
\ No newline at end of file
@@ -8,5 +8,10 @@ __all__ = [
     "clear_state",
     "unregister_classes",
     "unregister_handlers",
-    "setup"
+    "setup",
+    "post_setup",
+    "deferred_setup",
+    "schedule_deferred_setup",
+    "cancel_deferred_setup",
+    "time_startup_phase"
 ]
\ No newline at end of file
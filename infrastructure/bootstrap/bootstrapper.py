@@ -1,18 +1,64 @@
+import time
+from contextlib import contextmanager
+
 import bpy
 from bpy.app.handlers import persistent
 
 from .. import (
     AddPropertyGroupOperator,
+    AddTableColumnOperator,
+    ApplyPresetOperator,
+    CancelJobsOperator,
+    CaptureProfileOperator,
+    CopyPropertiesOperator,
     EditPropertyMenuOperator,
+    EditSelectedPropertyOperator,
+    EditTableCellOperator,
+    EstimateCacheMemoryOperator,
     ExpandToggleOperator,
+    ExportSpansOperator,
+    MovePropertyOperator,
+    RefreshTableOperator,
     RemovePropertyGroupOperator,
+    RemoveTableColumnOperator,
+    ResetSpansOperator,
+    SavePresetOperator,
+    SetGroupOrderOperator,
+    SortTableOperator,
+    TogglePinnedGroupOperator,
+    VerifyAllGroupDataOperator,
     DefaultArrayElement
 )
-from ..ui import CPMPreferences, draw_panels
-from ...application.managers import FieldManager, GroupDataManager, PropertyDataManager
-from ...core import expand_states, original_draws
+from ..ui import (
+    CPM_UL_properties,
+    CPM_UL_property_table,
+    CPMListItem,
+    CPMListMirror,
+    CPMPreferences,
+    VIEW3D_PT_cpm_property_table,
+    VIEW3D_PT_cpm_selection,
+    cancel_list_mirror_rebuilds,
+    draw_panels
+)
+from ...application.managers import (
+    FieldManager,
+    GroupDataManager,
+    JobManager,
+    PreferencesManager,
+    PresetManager,
+    PropertyDataManager,
+    PropertyTableManager,
+    SelectionViewManager
+)
+from ...application.services import PreviewService
+from ...core import draw_models, list_mirrors, list_view_panels, original_draws, startup_timings
 from ...shared import consts
-from ...shared.utils import StructuredLogger
+from ...shared.entities import LogLevel
+from ...shared.utils import SpanRecorder, StructuredLogger
+
+logger = StructuredLogger(consts.MODULE_NAME)
+# Whether the add-on was registered while Blender started, rather than enabled later on
+_is_startup = False
 
 _classes = [
     DefaultArrayElement,
@@ -20,6 +66,30 @@ _classes = [
     RemovePropertyGroupOperator,
     EditPropertyMenuOperator,
     ExpandToggleOperator,
+    CopyPropertiesOperator,
+    ApplyPresetOperator,
+    SavePresetOperator,
+    ExportSpansOperator,
+    ResetSpansOperator,
+    CaptureProfileOperator,
+    VerifyAllGroupDataOperator,
+    EstimateCacheMemoryOperator,
+    CancelJobsOperator,
+    MovePropertyOperator,
+    SetGroupOrderOperator,
+    TogglePinnedGroupOperator,
+    EditSelectedPropertyOperator,
+    CPMListItem,
+    CPMListMirror,
+    CPM_UL_properties,
+    AddTableColumnOperator,
+    RemoveTableColumnOperator,
+    SortTableOperator,
+    EditTableCellOperator,
+    RefreshTableOperator,
+    CPM_UL_property_table,
+    VIEW3D_PT_cpm_selection,
+    VIEW3D_PT_cpm_property_table,
     CPMPreferences
 ]
 
@@ -32,11 +102,35 @@ def register_classes():
             bpy.utils.unregister_class(cls)
         bpy.utils.register_class(cls)
 
+    # Rows of the list views, which cannot be written to while drawing. Window manager properties are not saved.
+    bpy.types.WindowManager.cpm_list_mirrors = bpy.props.CollectionProperty(type = CPMListMirror)
+    # Every panel has its own search, so filtering one panel does not hide properties on the others
+    for panel in consts.BLENDER_PANELS:
+        setattr(bpy.types.WindowManager, consts.PROPERTY_SEARCH_PREFIX + panel.name, bpy.props.StringProperty(
+            name = "Search Properties",
+            description = "Only show properties whose name contains words starting with or containing the search",
+            # Search while typing
+            options = {'TEXTEDIT_UPDATE'}
+        ))
+    bpy.types.WindowManager.cpm_table_active_index = bpy.props.IntProperty()
+    bpy.types.WindowManager.cpm_edit_selection = bpy.props.BoolProperty(
+        name = "All Selected",
+        description = "Show the properties of every selected object at once, and edit them on all of them",
+        default = False
+    )
+    bpy.types.WindowManager.cpm_pinned_groups_only = bpy.props.BoolProperty(
+        name = "Pinned Groups Only",
+        description = "Only show the pinned groups of the selected objects in the sidebar"
+    )
+
 def register_handlers():
     # Ensure we don't have any duplicates
     unregister_handlers()
     bpy.app.handlers.save_pre.append(serialize_on_pre_save)
     bpy.app.handlers.load_post.append(deserialize_on_post_load)
+    bpy.app.handlers.undo_post.append(reload_on_undo_redo)
+    bpy.app.handlers.redo_post.append(reload_on_undo_redo)
+    bpy.app.handlers.depsgraph_update_post.append(reconcile_on_depsgraph_update)
 
 def register_draw_functions():
     for panel in consts.BLENDER_PANELS:
@@ -51,10 +145,28 @@ def unregister_draw_functions():
             getattr(bpy.types, panel_name).draw = original_draw
 
 def clear_state():
+    JobManager.cancel()
     original_draws.clear()
-    expand_states.clear()
+    draw_models.clear()
+    cancel_list_mirror_rebuilds()
+    list_mirrors.clear()
+    PreviewService.clear_cache()
+    PropertyTableManager.clear()
+    SelectionViewManager.clear()
+    list_view_panels.clear()
+    startup_timings.clear()
+    SpanRecorder.set_enabled(False)
+    SpanRecorder.arm_capture(None)
+    SpanRecorder.reset()
 
 def unregister_classes():
+    del bpy.types.WindowManager.cpm_list_mirrors
+    for panel in consts.BLENDER_PANELS:
+        delattr(bpy.types.WindowManager, consts.PROPERTY_SEARCH_PREFIX + panel.name)
+    del bpy.types.WindowManager.cpm_table_active_index
+    del bpy.types.WindowManager.cpm_edit_selection
+    del bpy.types.WindowManager.cpm_pinned_groups_only
+
     for cls in _classes:
         bpy.utils.unregister_class(cls)
 
@@ -65,6 +177,15 @@ def unregister_handlers():
     if deserialize_on_post_load in bpy.app.handlers.load_post:
         bpy.app.handlers.load_post.remove(deserialize_on_post_load)
 
+    if reload_on_undo_redo in bpy.app.handlers.undo_post:
+        bpy.app.handlers.undo_post.remove(reload_on_undo_redo)
+
+    if reload_on_undo_redo in bpy.app.handlers.redo_post:
+        bpy.app.handlers.redo_post.remove(reload_on_undo_redo)
+
+    if reconcile_on_depsgraph_update in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(reconcile_on_depsgraph_update)
+
 def setup():
     EditPropertyMenuOperator.initialize(
         group_data_manager = GroupDataManager,
@@ -73,29 +194,152 @@ def setup():
     )
 
     RemovePropertyGroupOperator.initialize(GroupDataManager)
+    ExpandToggleOperator.initialize(GroupDataManager)
+    CopyPropertiesOperator.initialize(PropertyDataManager)
+    ApplyPresetOperator.initialize(PresetManager)
+    SavePresetOperator.initialize(PresetManager, PropertyDataManager)
+    VerifyAllGroupDataOperator.initialize(GroupDataManager)
+    EstimateCacheMemoryOperator.initialize(GroupDataManager)
+    MovePropertyOperator.initialize(GroupDataManager)
+    SetGroupOrderOperator.initialize(GroupDataManager)
+    TogglePinnedGroupOperator.initialize(GroupDataManager)
+    EditSelectedPropertyOperator.initialize(PropertyDataManager, PropertyTableManager, SelectionViewManager)
+    AddTableColumnOperator.initialize(PropertyTableManager)
+    RemoveTableColumnOperator.initialize(PropertyTableManager)
+    SortTableOperator.initialize(PropertyTableManager)
+    EditTableCellOperator.initialize(PropertyDataManager, PropertyTableManager)
+    RefreshTableOperator.initialize(PropertyTableManager)
 
 def post_setup():
-    # Get the current log level from user preferences
-    prefs = bpy.context.preferences.addons[consts.MODULE_NAME].preferences
-    log_level = int(prefs.log_level)
-
-    # Create the logger
-    StructuredLogger(
-        name = consts.MODULE_NAME,
-        level = log_level
+    """Setup that has to be done before the add-on is used: anything file loading or saving depends on."""
+    prefs = _get_preferences()
+
+    # Use the preferred group data storage
+    GroupDataManager.set_storage(prefs.group_data_storage)
+    GroupDataManager.set_parse_executor(prefs.group_data_parsing)
+
+    # Draw the preferred panels as list views
+    PreferencesManager.on_list_view_panels_update(prefs, bpy.context)
+
+    # Record timings if enabled
+    SpanRecorder.set_enabled(prefs.record_timings)
+
+def deferred_setup(warm_caches: bool = True):
+    """
+    Setup that can wait until Blender is idle: wiring the logger, patching panel draws and warming caches.
+
+    :param warm_caches: Whether to load group data and presets up front. Blender data cannot be accessed while add-ons
+    are registered at startup, so this is only possible once Blender is idle.
+    """
+    with time_startup_phase("deferred_setup"):
+        # Get the current log level from user preferences
+        prefs = _get_preferences()
+        log_level = int(prefs.log_level)
+
+        # Create the logger
+        StructuredLogger(
+            name = consts.MODULE_NAME,
+            level = log_level
+        )
+
+        register_draw_functions()
+
+        if warm_caches:
+            GroupDataManager.warm_cache()
+            PresetManager.load_presets()
+
+def schedule_deferred_setup():
+    """Run the deferred setup once Blender is idle, or right away if deferred startup is disabled."""
+    global _is_startup
+    _is_startup = _is_blender_starting()
+    if _get_preferences().defer_startup and not bpy.app.background:
+        # A file given on the command line is loaded before Blender is first idle, which drops timers that are not
+        # persistent
+        bpy.app.timers.register(_run_deferred_setup, first_interval = 0, persistent = True)
+    else:
+        deferred_setup(warm_caches = False)
+
+def cancel_deferred_setup():
+    if bpy.app.timers.is_registered(_run_deferred_setup):
+        bpy.app.timers.unregister(_run_deferred_setup)
+
+@contextmanager
+def time_startup_phase(phase: str):
+    """Record how long a startup phase takes in `startup_timings`."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        startup_timings[phase] = time.perf_counter() - start
+
+def _run_deferred_setup():
+    if _is_startup:
+        # CPU time Blender has used up to its first idle moment, which approximates its startup time. It means nothing
+        # when the add-on was enabled later on.
+        startup_timings["blender_startup"] = time.process_time()
+
+    deferred_setup()
+
+    extra = {
+        "register_ms": round(startup_timings.get("register", 0.0) * 1000, 2),
+        "deferred_setup_ms": round(startup_timings["deferred_setup"] * 1000, 2)
+    }
+    if "blender_startup" in startup_timings:
+        cpm_time = startup_timings.get("register", 0.0) + startup_timings["deferred_setup"]
+        extra["startup_share"] = f"{cpm_time / startup_timings['blender_startup']:.2%}"
+
+    logger.log(
+        level = LogLevel.INFO,
+        message = "Finished deferred setup",
+        extra = extra
     )
 
+    # Run only once
+    return None
+
+def _is_blender_starting() -> bool:
+    """Checks whether add-ons are being registered while Blender starts, when Blender data cannot be accessed yet."""
+    return not hasattr(bpy.data, "objects")
+
+def _get_preferences():
+    return bpy.context.preferences.addons[consts.MODULE_NAME].preferences
+
 def _create_draw_function(data_path: str):
+    pose_mode_data_path = consts.POSE_MODE_DATA_PATHS.get(data_path, data_path)
+
     def draw_function(self, context):
-        return draw_panels(self, context, data_path)
+        return draw_panels(self, context, pose_mode_data_path if context.mode == 'POSE' else data_path)
 
     return draw_function
 
 # Handlers for Group Data serialization
 @persistent
 def deserialize_on_post_load(dummy):
+    # Jobs hold on to data of the previous file
+    JobManager.cancel()
+    draw_models.clear()
+    list_mirrors.clear()
+    PreviewService.clear_cache()
+    PropertyTableManager.mark_dirty()
+    SelectionViewManager.clear()
     GroupDataManager.on_file_load()
 
 @persistent
 def serialize_on_pre_save(dummy):
-    GroupDataManager.on_file_save()
\ No newline at end of file
+    GroupDataManager.on_file_save()
+
+@persistent
+def reload_on_undo_redo(dummy):
+    # Jobs hold references to data freed by undo
+    JobManager.cancel()
+    GroupDataManager.on_undo_redo()
+    cancel_list_mirror_rebuilds()
+    PropertyTableManager.mark_dirty()
+    SelectionViewManager.mark_dirty()
+
+@persistent
+def reconcile_on_depsgraph_update(scene, depsgraph):
+    # Updates report evaluated copies, while group data belongs to the originals
+    data_ids = [update.id.original for update in depsgraph.updates]
+    GroupDataManager.reconcile(data_ids)
+    PropertyTableManager.refresh(data_ids)
\ No newline at end of file
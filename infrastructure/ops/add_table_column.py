@@ -0,0 +1,45 @@
+import bpy
+
+from bpy.props import EnumProperty
+from ...shared import consts
+from ...application.managers import PropertyTableManager
+
+# Blender does not keep the strings of dynamic enum items alive, so the items are kept here
+_property_items = []
+
+def _get_property_items(_self, _context):
+    _property_items[:] = [(name, name, "") for name in sorted(PropertyTableManager.property_names, key = str.lower)]
+
+    return _property_items
+
+# noinspection PyTypeHints
+class AddTableColumnOperator(bpy.types.Operator):
+    """Add a column showing a property to the property table."""
+    bl_idname = consts.ops.CPM_ADD_TABLE_COLUMN
+    bl_label = "Add Column"
+    bl_description = "Add a column comparing a custom property across all objects"
+    bl_property = "name"
+
+    name: EnumProperty(name = "Property", items = _get_property_items)
+
+    @classmethod
+    def initialize(cls, property_table_manager: type[PropertyTableManager]):
+        """Initialize the operator."""
+        cls.property_table_manager = property_table_manager
+
+    def invoke(self, context, _):
+        # The search lists the properties found while reading the table
+        self.property_table_manager.get_table()
+        context.window_manager.invoke_search_popup(self)
+
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        if not self.name or not self.property_table_manager.add_column(self.name):
+            return {'CANCELLED'}
+
+        # Force UI redraw
+        for area in context.screen.areas:
+            area.tag_redraw()
+
+        return {'FINISHED'}
\ No newline at end of file
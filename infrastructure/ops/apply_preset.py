@@ -0,0 +1,64 @@
+import bpy
+
+from bpy.props import EnumProperty, StringProperty
+from ...shared import consts, utils
+from ...application.managers import PresetManager
+
+# noinspection PyTypeHints
+class ApplyPresetOperator(bpy.types.Operator):
+    """Apply a property preset to the active and selected data."""
+    bl_idname = consts.ops.CPM_APPLY_PRESET
+    bl_label = "Apply Property Preset"
+    bl_description = "Add the properties, UI data and groups of a preset to the active and selected data"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    data_path: StringProperty()
+    preset: EnumProperty(
+        name = "Preset",
+        items = PresetManager.get_preset_items
+    )
+    mode: EnumProperty(
+        name = "Existing Properties",
+        description = "What to do with properties that already exist on the data",
+        items = consts.COPY_MODES,
+        default = consts.CopyModes.OVERWRITE
+    )
+
+    @classmethod
+    def initialize(cls, preset_manager: type[PresetManager]):
+        """Initialize the operator."""
+        cls.preset_manager = preset_manager
+
+    def invoke(self, context, _):
+        # Pick up presets that were added or changed on disk
+        self.preset_manager.load_presets()
+
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        preset = self.preset_manager.get_preset(self.preset)
+        if preset is None:
+            self.report({'ERROR'}, f"Preset '{self.preset}' not found")
+
+            return {'CANCELLED'}
+
+        # Apply to the active data, followed by the rest of the selection
+        targets = []
+        seen = set()
+        active = utils.resolve_data_object(self.data_path)
+        for data_object in [active, *utils.resolve_selected_data_objects(self.data_path)]:
+            if data_object is None or data_object.as_pointer() in seen:
+                continue
+
+            seen.add(data_object.as_pointer())
+            targets.append(data_object)
+
+        count = self.preset_manager.apply_preset(preset, targets, self.mode)
+        self.report({'INFO'}, f"Applied preset '{preset.name}' to {count} targets")
+
+        # Redraw the Custom Properties panel
+        for area in context.screen.areas:
+            if area.type == 'PROPERTIES':
+                area.tag_redraw()
+
+        return {'FINISHED'}
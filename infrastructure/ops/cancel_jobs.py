@@ -0,0 +1,19 @@
+import bpy
+
+from ...application.managers import JobManager
+from ...shared import consts
+
+class CancelJobsOperator(bpy.types.Operator):
+    """Cancel all running background jobs."""
+    bl_idname = consts.ops.CPM_CANCEL_JOBS
+    bl_label = "Cancel Jobs"
+    bl_description = "Stop all running background jobs. Work they have already done is kept"
+
+    @classmethod
+    def poll(cls, context):
+        return bool(JobManager.get_jobs())
+
+    def execute(self, context):
+        JobManager.cancel()
+
+        return {'FINISHED'}
\ No newline at end of file
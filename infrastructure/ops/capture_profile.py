@@ -0,0 +1,30 @@
+import bpy
+
+from bpy.props import IntProperty
+from ...shared import consts, utils
+from ...shared.utils import ProfileCapture, SpanRecorder
+
+# noinspection PyTypeHints
+class CaptureProfileOperator(bpy.types.Operator):
+    """Profile the next CPM operations."""
+    bl_idname = consts.ops.CPM_CAPTURE_PROFILE
+    bl_label = "Capture Profile"
+    bl_description = ("Profile the next operations of CPM (panel draws, edits and saves) and write the profile to the "
+                      "add-on's configuration directory")
+
+    operation_count: IntProperty(
+        name = "Operations",
+        description = "Number of operations to profile",
+        default = 10,
+        min = 1,
+        soft_max = 100)
+
+    def invoke(self, context, _):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        output_dir = utils.get_user_config_dir(consts.PROFILES_DIR)
+        SpanRecorder.arm_capture(ProfileCapture(self.operation_count, output_dir))
+        self.report({'INFO'}, f"Profiling the next {self.operation_count} operations into {output_dir}")
+
+        return {'FINISHED'}
\ No newline at end of file
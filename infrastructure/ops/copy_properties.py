@@ -0,0 +1,59 @@
+import bpy
+
+from bpy.props import EnumProperty, StringProperty
+from ...shared import consts, utils
+from ...application.managers import PropertyDataManager
+
+# noinspection PyTypeHints
+class CopyPropertiesOperator(bpy.types.Operator):
+    """Copy custom properties, including their UI data and groups, from the active data to the selected data."""
+    bl_idname = consts.ops.CPM_COPY_PROPERTIES
+    bl_label = "Copy Properties to Selected"
+    bl_description = "Copy all custom properties, their UI data and groups from the active to the selected data"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    data_path: StringProperty()
+    mode: EnumProperty(
+        name = "Existing Properties",
+        description = "What to do with properties that already exist on the selected data",
+        items = consts.COPY_MODES,
+        default = consts.CopyModes.OVERWRITE
+    )
+
+    @classmethod
+    def initialize(cls, property_data_manager: type[PropertyDataManager]):
+        """Initialize the operator."""
+        cls.property_data_manager = property_data_manager
+
+    def invoke(self, context, _):
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        source = utils.resolve_data_object(self.data_path)
+        if source is None:
+            return {'CANCELLED'}
+
+        source_id = source.as_pointer()
+        targets = [
+            target for target in utils.resolve_selected_data_objects(self.data_path)
+            if target.as_pointer() != source_id
+        ]
+
+        if not targets:
+            self.report({'WARNING'}, "No other selected data to copy properties to")
+
+            return {'CANCELLED'}
+
+        # Take the snapshot once, then apply it to every target
+        snapshots = self.property_data_manager.snapshot_properties(source)
+        for target in targets:
+            self.property_data_manager.apply_snapshots(target, snapshots, self.mode)
+
+        self.report({'INFO'}, f"Copied {len(snapshots)} properties to {len(targets)} targets")
+
+        # Redraw the Custom Properties panel
+        for area in context.screen.areas:
+            if area.type == 'PROPERTIES':
+                area.tag_redraw()
+
+        return {'FINISHED'}
@@ -5,6 +5,7 @@ import bpy
 from .edit_property_menu_mixin import EditPropertyMenuOperatorMixin
 from ....application.managers import FieldManager, GroupDataManager, PropertyDataManager
 from ....shared import consts, utils
+from ....shared.utils import SpanRecorder
 
 class EditPropertyMenuOperator(bpy.types.Operator, EditPropertyMenuOperatorMixin):
     @classmethod
@@ -17,8 +18,16 @@ class EditPropertyMenuOperator(bpy.types.Operator, EditPropertyMenuOperatorMixin
         cls.property_data_manager = property_data_manager
         cls.field_manager = field_manager
 
-    # noinspection PyTypeChecker, PyAttributeOutsideInit
     def invoke(self, context, _):
+        with SpanRecorder.span("EditPropertyMenuOperator.invoke"):
+            return self._invoke(context)
+
+    def execute(self, context):
+        with SpanRecorder.span("EditPropertyMenuOperator.execute"):
+            return self._execute(context)
+
+    # noinspection PyTypeChecker, PyAttributeOutsideInit
+    def _invoke(self, context):
         # Initialize the operator_instance
         self.value: Any = None
         self.initialized = False
@@ -79,7 +88,7 @@ class EditPropertyMenuOperator(bpy.types.Operator, EditPropertyMenuOperatorMixin
                     field.ui_data_attr == "soft_min"):
                 field_row.enabled = self.use_soft_limits
 
-    def execute(self, context):
+    def _execute(self, context):
         data_object = utils.resolve_data_object(self.data_path)
         self._group_data = self.group_data_manager.get_group_data(data_object)
         self._group_data.set_operator(self)
@@ -1,4 +1,5 @@
 from bpy.props import BoolProperty, EnumProperty, FloatProperty, IntProperty, StringProperty, CollectionProperty
+from ....application.managers import GroupDataManager
 from ....application.services import PropertyTypeService, field_validation_service
 from ....shared import consts
 from ....shared.consts.enums import get_data_block_types
@@ -19,7 +20,12 @@ class EditPropertyMenuOperatorMixin:
         items = consts.PROPERTY_TYPES,
         update = PropertyTypeService.on_type_change
     )
-    group: StringProperty()
+    group: StringProperty(
+        maxlen = consts.GROUP_NAME_MAX_LENGTH,
+        # Existing group names are suggested, so groups are not duplicated by typos. New names can still be typed.
+        search = GroupDataManager.on_group_search,
+        search_options = {'SUGGESTION'}
+    )
     description: StringProperty()
     step_float: FloatProperty()
     step_int: IntProperty()
@@ -0,0 +1,58 @@
+from bpy.props import BoolProperty, FloatProperty, IntProperty, StringProperty
+from ....shared import consts
+
+# The operator property holding the value of each type of property that can be edited in a value dialog
+_VALUE_PROPERTIES = {
+    consts.PropertyTypes.FLOAT: "float_value",
+    consts.PropertyTypes.INT: "int_value",
+    consts.PropertyTypes.BOOL: "bool_value",
+    consts.PropertyTypes.STRING: "string_value",
+}
+
+# noinspection PyTypeHints
+class EditValueOperatorMixin:
+    """
+    The value of operators that edit the value of existing properties in a dialog. The value is held by the operator
+    property for its type, chosen with `choose_value_property`. Operators provide `property_data_manager`.
+    """
+    value_property: StringProperty(options = {'HIDDEN'})
+    float_value: FloatProperty(name = "Value")
+    int_value: IntProperty(name = "Value")
+    bool_value: BoolProperty(name = "Value")
+    string_value: StringProperty(name = "Value")
+
+    def choose_value_property(self, prop_type: str | None) -> bool:
+        """
+        Chooses the operator property holding the value for a type of property.
+
+        :param prop_type: The type of the property, or None if it is unknown.
+
+        :return: True if properties of the type can be edited, False otherwise.
+        """
+        self.value_property = _VALUE_PROPERTIES.get(prop_type, "")
+
+        return bool(self.value_property)
+
+    def get_value_type(self) -> str | None:
+        """Gets the type of property the value property was chosen for, or None if none was chosen."""
+        return next(
+            (prop_type for prop_type, value_property in _VALUE_PROPERTIES.items()
+             if value_property == self.value_property),
+            None
+        )
+
+    def get_value(self):
+        return getattr(self, self.value_property)
+
+    def set_value(self, value):
+        setattr(self, self.value_property, value)
+
+    def draw_value(self, text: str):
+        self.layout.prop(self, self.value_property, text = text)
+
+    def get_property_type(self, data_object, prop_name: str) -> str | None:
+        """Gets the type of a property, or None if it is of a type CPM does not know."""
+        try:
+            return self.property_data_manager.property_type_service.get_property_type(data_object, prop_name)
+        except TypeError:
+            return None
\ No newline at end of file
@@ -0,0 +1,85 @@
+import bpy
+
+from bpy.props import StringProperty
+from .edit_property_menu.edit_value_mixin import EditValueOperatorMixin
+from ...shared import consts, utils
+from ...application.managers import PropertyDataManager, PropertyTableManager, SelectionViewManager
+
+# noinspection PyTypeHints
+class EditSelectedPropertyOperator(bpy.types.Operator, EditValueOperatorMixin):
+    """Edit the value of a property of every selected object at once."""
+    bl_idname = consts.ops.CPM_EDIT_SELECTED_PROPERTY
+    bl_label = "Edit Value"
+    bl_description = "Set the value of the property on every selected object that has it"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    data_path: StringProperty()
+    name: StringProperty()
+
+    @classmethod
+    def initialize(
+            cls,
+            property_data_manager: type[PropertyDataManager],
+            property_table_manager: type[PropertyTableManager],
+            selection_view_manager: type[SelectionViewManager]):
+        """Initialize the operator."""
+        cls.property_data_manager = property_data_manager
+        cls.property_table_manager = property_table_manager
+        cls.selection_view_manager = selection_view_manager
+
+    def invoke(self, context, _):
+        data_objects = [
+            data_object for data_object in utils.resolve_selection(self.data_path)
+            if self.name in data_object
+        ]
+        if not data_objects:
+            return {'CANCELLED'}
+
+        # The active object's value is shown, like Blender does for mixed values
+        if not self.choose_value_property(self.get_property_type(data_objects[0], self.name)):
+            self.report({'INFO'}, f"Edit '{self.name}' from the custom properties of each object instead.")
+            return {'CANCELLED'}
+
+        self.set_value(data_objects[0][self.name])
+
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        self.draw_value(self.name)
+
+    def execute(self, context):
+        if not self.value_property:
+            return {'CANCELLED'}
+
+        # Only properties of the edited type are written, since values cannot be converted between every type
+        prop_type = self.get_value_type()
+        value = self.get_value()
+        written = 0
+        skipped = 0
+        for data_object in utils.resolve_selection(self.data_path):
+            if self.name not in data_object:
+                continue
+
+            if self.get_property_type(data_object, self.name) == prop_type and self.property_data_manager.set_value(
+                    data_object, self.name, value):
+                written += 1
+            else:
+                skipped += 1
+
+        if not written:
+            self.report({'ERROR'}, f"Could not set '{self.name}' on any selected object.")
+            return {'CANCELLED'}
+
+        if skipped:
+            self.report({'WARNING'}, f"Set '{self.name}' on {written} objects, skipped {skipped} of another type.")
+
+        # Properties written from scripts do not cause depsgraph updates
+        self.selection_view_manager.mark_dirty()
+        if self.name in self.property_table_manager.table.values:
+            self.property_table_manager.mark_dirty()
+
+        # Force UI redraw
+        for area in context.screen.areas:
+            area.tag_redraw()
+
+        return {'FINISHED'}
\ No newline at end of file
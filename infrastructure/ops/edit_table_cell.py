@@ -0,0 +1,60 @@
+import bpy
+
+from bpy.props import StringProperty
+from .edit_property_menu.edit_value_mixin import EditValueOperatorMixin
+from ...shared import consts, utils
+from ...application.managers import PropertyDataManager, PropertyTableManager
+
+# noinspection PyTypeHints
+class EditTableCellOperator(bpy.types.Operator, EditValueOperatorMixin):
+    """Edit the value of a cell of the property table."""
+    bl_idname = consts.ops.CPM_EDIT_TABLE_CELL
+    bl_label = "Edit Value"
+    bl_description = "Edit the value of the property on this object"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    # Data path of the object of the row, see `utils.get_data_path`
+    row: StringProperty()
+    column: StringProperty()
+
+    @classmethod
+    def initialize(
+            cls,
+            property_data_manager: type[PropertyDataManager],
+            property_table_manager: type[PropertyTableManager]):
+        """Initialize the operator."""
+        cls.property_data_manager = property_data_manager
+        cls.property_table_manager = property_table_manager
+
+    def invoke(self, context, _):
+        data_object = utils.resolve_data_object(self.row)
+        if data_object is None or self.column not in data_object:
+            return {'CANCELLED'}
+
+        if not self.choose_value_property(self.get_property_type(data_object, self.column)):
+            self.report({'INFO'}, f"Edit '{self.column}' from the object's custom properties panel instead.")
+            return {'CANCELLED'}
+
+        self.set_value(data_object[self.column])
+
+        return context.window_manager.invoke_props_dialog(self)
+
+    def draw(self, context):
+        self.draw_value(self.column)
+
+    def execute(self, context):
+        data_object = utils.resolve_data_object(self.row)
+        if data_object is None or not self.value_property:
+            return {'CANCELLED'}
+
+        if not self.property_data_manager.set_value(data_object, self.column, self.get_value()):
+            self.report({'ERROR'}, f"Could not set '{self.column}' of '{data_object.name}'.")
+            return {'CANCELLED'}
+
+        self.property_table_manager.refresh_row(data_object)
+
+        # Force UI redraw
+        for area in context.screen.areas:
+            area.tag_redraw()
+
+        return {'FINISHED'}
\ No newline at end of file
@@ -0,0 +1,21 @@
+import bpy
+
+from ...application.managers import GroupDataManager
+from ...shared import consts
+
+class EstimateCacheMemoryOperator(bpy.types.Operator):
+    """Estimate the memory used by the group data cache."""
+    bl_idname = consts.ops.CPM_ESTIMATE_CACHE_MEMORY
+    bl_label = "Estimate Memory"
+    bl_description = "Estimate the memory used by the cached group data. This walks all cached data"
+
+    @classmethod
+    def initialize(cls, group_data_manager: type[GroupDataManager]):
+        """Initialize the operator."""
+        cls.group_data_manager = group_data_manager
+
+    def execute(self, context):
+        stats = self.group_data_manager.get_cache_stats(include_memory = True)
+        self.report({'INFO'}, f"Group data cache uses ~{stats['memory_bytes'] / 1024:.1f} KiB")
+
+        return {'FINISHED'}
\ No newline at end of file
@@ -1,22 +1,38 @@
 import bpy
 
-from ...core import expand_states
-from ...shared import consts
+from ...application.managers import GroupDataManager
+from ...shared import consts, utils
 
 # noinspection PyTypeHints
 class ExpandToggleOperator(bpy.types.Operator):
-    """Toggle expand/collapse state for property groups"""
+    """Toggle expand/collapse state for property groups and tree view nodes"""
     bl_idname = consts.CPM_EXPAND_TOGGLE
     bl_label = "Toggle Expand"
     bl_description = "Toggle the expand/collapse state of a property group"
-    expand_key: bpy.props.StringProperty(
-        name="Expand Key",
-        description="Unique key for this expand state")
-    current_state: bpy.props.BoolProperty(
-        name="Current State",
-        description="Current expand/collapse state")
+    bl_options = {'REGISTER', 'UNDO'}
+    data_path: bpy.props.StringProperty(
+        name="Data Path",
+        description="Path to the data the group or property belongs to")
+    group: bpy.props.StringProperty(
+        name="Group",
+        description="Name of the group to toggle")
+    tree_path: bpy.props.StringProperty(
+        name="Tree Path",
+        description="Path of the tree view node to toggle, used instead of the group if set")
+
+    @classmethod
+    def initialize(cls, group_data_manager: type[GroupDataManager]):
+        """Initialize the operator."""
+        cls.group_data_manager = group_data_manager
 
     def execute(self, context):
-        expand_states[self.expand_key] = not self.current_state
+        data_object = utils.resolve_data_object(self.data_path)
+        if not data_object:
+            return {'CANCELLED'}
+
+        if self.tree_path:
+            self.group_data_manager.toggle_tree_expanded(data_object, self.tree_path)
+        else:
+            self.group_data_manager.toggle_group_expanded(data_object, self.group)
 
         return {'FINISHED'}
\ No newline at end of file
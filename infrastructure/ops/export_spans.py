@@ -0,0 +1,32 @@
+import bpy
+
+from bpy.props import StringProperty
+from ...shared import consts
+from ...shared.utils import SpanRecorder
+
+# noinspection PyTypeHints
+class ExportSpansOperator(bpy.types.Operator):
+    """Export the recorded timing spans."""
+    bl_idname = consts.ops.CPM_EXPORT_SPANS
+    bl_label = "Export Timings"
+    bl_description = "Export the recorded timings of CPM as JSON"
+
+    filepath: StringProperty(subtype = 'FILE_PATH', default = "cpm_timings.json")
+    filter_glob: StringProperty(default = "*.json", options = {'HIDDEN'})
+
+    def invoke(self, context, _):
+        context.window_manager.fileselect_add(self)
+
+        return {'RUNNING_MODAL'}
+
+    def execute(self, context):
+        try:
+            SpanRecorder.export(self.filepath)
+        except OSError as e:
+            self.report({'ERROR'}, f"Could not export timings: {e}")
+
+            return {'CANCELLED'}
+
+        self.report({'INFO'}, f"Exported timings to {self.filepath}")
+
+        return {'FINISHED'}
\ No newline at end of file
@@ -0,0 +1,39 @@
+import bpy
+
+from bpy.props import EnumProperty, StringProperty
+from ...shared import consts, utils
+from ...application.managers import GroupDataManager
+
+# noinspection PyTypeHints
+class MovePropertyOperator(bpy.types.Operator):
+    """Move a property up or down within its group."""
+    bl_idname = consts.ops.CPM_MOVE_PROPERTY
+    bl_label = "Move Property"
+    bl_description = "Move the property within its group. The group keeps this order from now on"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    data_path: StringProperty()
+    name: StringProperty()
+    direction: EnumProperty(
+        items = (
+            ('UP', "Up", "Move the property up"),
+            ('DOWN', "Down", "Move the property down"),
+        )
+    )
+
+    @classmethod
+    def initialize(cls, group_data_manager: type[GroupDataManager]):
+        """Initialize the operator."""
+        cls.group_data_manager = group_data_manager
+
+    def execute(self, context):
+        data_object = utils.resolve_data_object(self.data_path)
+        offset = -1 if self.direction == 'UP' else 1
+        if not self.group_data_manager.move_property(data_object, self.name, offset):
+            return {'CANCELLED'}
+
+        # Force UI redraw
+        for area in context.screen.areas:
+            area.tag_redraw()
+
+        return {'FINISHED'}
\ No newline at end of file
@@ -0,0 +1,25 @@
+import bpy
+
+from ...shared import consts
+from ...application.managers import PropertyTableManager
+
+class RefreshTableOperator(bpy.types.Operator):
+    """Read the property table again."""
+    bl_idname = consts.ops.CPM_REFRESH_TABLE
+    bl_label = "Refresh Table"
+    bl_description = ("Read all values of the property table again. Needed after scripts changed objects that are not "
+                      "in the current scene")
+
+    @classmethod
+    def initialize(cls, property_table_manager: type[PropertyTableManager]):
+        """Initialize the operator."""
+        cls.property_table_manager = property_table_manager
+
+    def execute(self, context):
+        self.property_table_manager.mark_dirty()
+
+        # Force UI redraw
+        for area in context.screen.areas:
+            area.tag_redraw()
+
+        return {'FINISHED'}
\ No newline at end of file
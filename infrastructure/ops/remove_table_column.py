@@ -0,0 +1,28 @@
+import bpy
+
+from bpy.props import StringProperty
+from ...shared import consts
+from ...application.managers import PropertyTableManager
+
+# noinspection PyTypeHints
+class RemoveTableColumnOperator(bpy.types.Operator):
+    """Remove a column from the property table."""
+    bl_idname = consts.ops.CPM_REMOVE_TABLE_COLUMN
+    bl_label = "Remove Column"
+    bl_description = "Remove the column from the property table. The property itself is kept"
+
+    column: StringProperty()
+
+    @classmethod
+    def initialize(cls, property_table_manager: type[PropertyTableManager]):
+        """Initialize the operator."""
+        cls.property_table_manager = property_table_manager
+
+    def execute(self, context):
+        self.property_table_manager.remove_column(self.column)
+
+        # Force UI redraw
+        for area in context.screen.areas:
+            area.tag_redraw()
+
+        return {'FINISHED'}
\ No newline at end of file
@@ -0,0 +1,19 @@
+import bpy
+
+from ...shared import consts
+from ...shared.utils import SpanRecorder
+
+class ResetSpansOperator(bpy.types.Operator):
+    """Discard the recorded timing spans."""
+    bl_idname = consts.ops.CPM_RESET_SPANS
+    bl_label = "Reset Timings"
+    bl_description = "Discard all timings recorded so far"
+
+    def execute(self, context):
+        SpanRecorder.reset()
+
+        # Redraw the preferences, which show the timings
+        for area in context.screen.areas:
+            area.tag_redraw()
+
+        return {'FINISHED'}
\ No newline at end of file
@@ -0,0 +1,42 @@
+import bpy
+
+from bpy.props import StringProperty
+from ...shared import consts, utils
+from ...application.managers import PresetManager, PropertyDataManager
+
+# noinspection PyTypeHints
+class SavePresetOperator(bpy.types.Operator):
+    """Save a property group as a preset."""
+    bl_idname = consts.ops.CPM_SAVE_PRESET
+    bl_label = "Save Group as Preset"
+    bl_description = "Save the properties of this group, including their UI data, as a reusable preset"
+
+    data_path: StringProperty()
+    group: StringProperty()
+    preset_name: StringProperty(name = "Preset Name")
+
+    @classmethod
+    def initialize(cls, preset_manager: type[PresetManager], property_data_manager: type[PropertyDataManager]):
+        """Initialize the operator."""
+        cls.preset_manager = preset_manager
+        cls.property_data_manager = property_data_manager
+
+    def invoke(self, context, _):
+        if not self.preset_name:
+            self.preset_name = self.group
+
+        return context.window_manager.invoke_props_dialog(self)
+
+    def execute(self, context):
+        data_object = utils.resolve_data_object(self.data_path)
+        if data_object is None or not self.preset_name:
+            return {'CANCELLED'}
+
+        snapshots = [
+            snapshot for snapshot in self.property_data_manager.snapshot_properties(data_object)
+            if snapshot.group == self.group
+        ]
+        file_path = self.preset_manager.save_preset(self.preset_name, snapshots)
+        self.report({'INFO'}, f"Saved preset '{self.preset_name}' to {file_path}")
+
+        return {'FINISHED'}
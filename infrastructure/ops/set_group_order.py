@@ -0,0 +1,32 @@
+import bpy
+
+from bpy.props import EnumProperty, StringProperty
+from ...shared import consts, utils
+from ...application.managers import GroupDataManager
+
+# noinspection PyTypeHints
+class SetGroupOrderOperator(bpy.types.Operator):
+    """Choose how the properties of a group are ordered."""
+    bl_idname = consts.ops.CPM_SET_GROUP_ORDER
+    bl_label = "Set Group Order"
+    bl_description = "Switch the group between alphabetical and manual ordering"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    data_path: StringProperty()
+    group: StringProperty()
+    order_mode: EnumProperty(items = consts.GROUP_ORDER_MODES)
+
+    @classmethod
+    def initialize(cls, group_data_manager: type[GroupDataManager]):
+        """Initialize the operator."""
+        cls.group_data_manager = group_data_manager
+
+    def execute(self, context):
+        data_object = utils.resolve_data_object(self.data_path)
+        self.group_data_manager.set_group_order_mode(data_object, self.group, self.order_mode)
+
+        # Force UI redraw
+        for area in context.screen.areas:
+            area.tag_redraw()
+
+        return {'FINISHED'}
\ No newline at end of file
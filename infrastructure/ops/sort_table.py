@@ -0,0 +1,28 @@
+import bpy
+
+from bpy.props import StringProperty
+from ...shared import consts
+from ...application.managers import PropertyTableManager
+
+# noinspection PyTypeHints
+class SortTableOperator(bpy.types.Operator):
+    """Sort the property table by a column."""
+    bl_idname = consts.ops.CPM_SORT_TABLE
+    bl_label = "Sort Table"
+    bl_description = "Sort the objects by this property. Click again to reverse the order"
+
+    column: StringProperty()
+
+    @classmethod
+    def initialize(cls, property_table_manager: type[PropertyTableManager]):
+        """Initialize the operator."""
+        cls.property_table_manager = property_table_manager
+
+    def execute(self, context):
+        self.property_table_manager.table.set_sort(self.column)
+
+        # Force UI redraw
+        for area in context.screen.areas:
+            area.tag_redraw()
+
+        return {'FINISHED'}
\ No newline at end of file
@@ -0,0 +1,34 @@
+import bpy
+
+from bpy.props import StringProperty
+from ...shared import consts, utils
+from ...application.managers import GroupDataManager
+
+# noinspection PyTypeHints
+class TogglePinnedGroupOperator(bpy.types.Operator):
+    """Pin or unpin a property group."""
+    bl_idname = consts.ops.CPM_TOGGLE_PINNED_GROUP
+    bl_label = "Toggle Pinned Group"
+    bl_description = "Pin the group, so the sidebar can show only pinned groups, or unpin it"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    data_path: StringProperty()
+    group: StringProperty()
+
+    @classmethod
+    def initialize(cls, group_data_manager: type[GroupDataManager]):
+        """Initialize the operator."""
+        cls.group_data_manager = group_data_manager
+
+    def execute(self, context):
+        data_object = utils.resolve_data_object(self.data_path)
+        if not data_object:
+            return {'CANCELLED'}
+
+        self.group_data_manager.toggle_group_pinned(data_object, self.group)
+
+        # Force UI redraw
+        for area in context.screen.areas:
+            area.tag_redraw()
+
+        return {'FINISHED'}
\ No newline at end of file
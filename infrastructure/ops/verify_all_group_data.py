@@ -0,0 +1,25 @@
+import bpy
+
+from ...application.managers import GroupDataManager, JobManager
+from ...shared import consts
+
+class VerifyAllGroupDataOperator(bpy.types.Operator):
+    """Remove stale entries from the group data of all data in the file."""
+    bl_idname = consts.ops.CPM_VERIFY_ALL_GROUP_DATA
+    bl_label = "Verify All Group Data"
+    bl_description = "Remove properties that no longer exist from the groups of all data in the file, in the background"
+
+    @classmethod
+    def initialize(cls, group_data_manager: type[GroupDataManager]):
+        """Initialize the operator."""
+        cls.group_data_manager = group_data_manager
+
+    @classmethod
+    def poll(cls, context):
+        return not JobManager.is_running(consts.VERIFY_ALL_JOB_NAME)
+
+    def execute(self, context):
+        job = self.group_data_manager.schedule_verify_all()
+        self.report({'INFO'}, f"Verifying the group data of {job.total} data objects")
+
+        return {'FINISHED'}
\ No newline at end of file
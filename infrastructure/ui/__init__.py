@@ -1,7 +1,17 @@
 from .cpm_preferences import CPMPreferences
-from .panels import draw_panels
+from .panels import cancel_list_mirror_rebuilds, draw_panels
+from .property_list import CPM_UL_properties, CPMListItem, CPMListMirror
+from .property_table import CPM_UL_property_table, VIEW3D_PT_cpm_property_table
+from .selection_panel import VIEW3D_PT_cpm_selection
 
 __all__ = [
     "draw_panels",
-    "CPMPreferences"
+    "cancel_list_mirror_rebuilds",
+    "CPMPreferences",
+    "CPMListItem",
+    "CPMListMirror",
+    "CPM_UL_properties",
+    "CPM_UL_property_table",
+    "VIEW3D_PT_cpm_property_table",
+    "VIEW3D_PT_cpm_selection"
 ]
\ No newline at end of file
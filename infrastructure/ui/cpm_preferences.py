@@ -1,7 +1,9 @@
 import bpy
 
-from ...application.managers import PreferencesManager
+from ...application.managers import GroupDataManager, JobManager, PreferencesManager
+from ...core import startup_timings
 from ...shared import consts
+from ...shared.utils import SpanRecorder
 
 class CPMPreferences(bpy.types.AddonPreferences):
     bl_idname = consts.MODULE_NAME
@@ -15,6 +17,138 @@ class CPMPreferences(bpy.types.AddonPreferences):
         update = PreferencesManager.on_log_level_update
     )
 
+    # noinspection PyTypeHints
+    group_data_storage: bpy.props.EnumProperty(
+        items = consts.GROUP_DATA_STORAGE_TYPES,
+        name = "Group Data Storage",
+        description = "How property groups are stored in .blend files",
+        default = consts.GroupDataStorageTypes.JSON,
+        update = PreferencesManager.on_group_data_storage_update
+    )
+
+    # noinspection PyTypeHints
+    group_data_parsing: bpy.props.EnumProperty(
+        items = consts.PARSE_EXECUTORS,
+        name = "Group Data Parsing",
+        description = "How group data is parsed when a file is loaded",
+        default = consts.ParseExecutors.AUTO,
+        update = PreferencesManager.on_group_data_parsing_update
+    )
+
+    # noinspection PyTypeHints
+    list_view_panels: bpy.props.EnumProperty(
+        items = consts.LIST_VIEW_PANELS,
+        name = "List View Panels",
+        description = "Panels that draw custom properties as a scrollable list, which stays fast with many properties",
+        options = {'ENUM_FLAG'},
+        update = PreferencesManager.on_list_view_panels_update
+    )
+
+    # noinspection PyTypeHints
+    defer_startup: bpy.props.BoolProperty(
+        name = "Deferred Startup",
+        description = "Patch panels and warm caches once Blender is idle after startup, instead of while it starts",
+        default = True
+    )
+
+    # noinspection PyTypeHints
+    record_timings: bpy.props.BoolProperty(
+        name = "Record Timings",
+        description = "Record how long drawing, editing, saving and loading take. Adds a small overhead while enabled",
+        default = False,
+        update = PreferencesManager.on_record_timings_update
+    )
+
     def draw(self, context):
         layout = self.layout
-        layout.prop(self, "log_level")
\ No newline at end of file
+        layout.prop(self, "log_level")
+        layout.prop(self, "group_data_storage")
+        layout.prop(self, "defer_startup")
+
+        header, body = layout.panel("CPM_PT_preferences_list_view", default_closed = True)
+        header.label(text = "List View")
+        if body is not None:
+            body.label(text = "Draw the custom properties of these panels as a scrollable list:")
+            body.grid_flow(columns = 4, even_columns = True).prop(self, "list_view_panels")
+
+        header, body = layout.panel("CPM_PT_preferences_maintenance", default_closed = True)
+        header.label(text = "Maintenance")
+        if body is not None:
+            self._draw_maintenance(body)
+
+        header, body = layout.panel("CPM_PT_preferences_performance", default_closed = True)
+        header.label(text = "Performance")
+        if body is not None:
+            self._draw_performance(body)
+
+    @staticmethod
+    def _draw_maintenance(layout):
+        row = layout.row()
+        row.operator(consts.ops.CPM_VERIFY_ALL_GROUP_DATA, icon = consts.icons.CHECKMARK)
+        row.operator(consts.ops.CPM_CANCEL_JOBS, icon = consts.icons.CANCEL)
+
+        jobs = JobManager.get_jobs()
+        if not jobs:
+            layout.label(text = "No background jobs running")
+            return
+
+        for job in jobs:
+            status = f"{job.fraction:.0%} ({job.progress}/{job.total})" if job.started else "Queued"
+            layout.label(text = f"{job.name}: {status}")
+
+    def _draw_performance(self, layout):
+        layout.prop(self, "group_data_parsing")
+
+        row = layout.row()
+        row.prop(self, "record_timings")
+        row.operator(consts.ops.CPM_EXPORT_SPANS, text = "Export", icon = consts.icons.EXPORT)
+        row.operator(consts.ops.CPM_RESET_SPANS, text = "Reset", icon = consts.icons.TRASH)
+
+        row = layout.row()
+        row.operator(consts.ops.CPM_CAPTURE_PROFILE, icon = consts.icons.TIME)
+        if SpanRecorder.capture is not None:
+            row.label(text = f"Capturing, {SpanRecorder.capture.remaining} operations left")
+        elif SpanRecorder.last_capture is not None:
+            row.label(text = f"Last profile: {SpanRecorder.last_capture.output_path}")
+
+        self._draw_startup_timings(layout)
+        self._draw_cache_stats(layout)
+
+        stats = SpanRecorder.get_stats()
+        if not stats:
+            layout.label(text = "No timings recorded" if self.record_timings else "Recording is disabled")
+            return
+
+        columns = layout.grid_flow(row_major = True, columns = 5, even_columns = False, align = True)
+        for heading in ("Span", "Count", "p50 (ms)", "p95 (ms)", "Max (ms)"):
+            columns.label(text = heading)
+
+        for name, span_stats in stats.items():
+            columns.label(text = name)
+            columns.label(text = str(span_stats["count"]))
+            columns.label(text = f"{span_stats['p50_ms']:.3f}")
+            columns.label(text = f"{span_stats['p95_ms']:.3f}")
+            columns.label(text = f"{span_stats['max_ms']:.3f}")
+
+    @staticmethod
+    def _draw_cache_stats(layout):
+        # Estimating the memory walks all cached data, so it is only done on request instead of on every draw
+        stats = GroupDataManager.get_cache_stats(include_memory = False)
+        box = layout.box()
+        row = box.row()
+        row.label(text = f"Group Data Cache: {stats['entries']} local, {stats['linked_entries']} linked")
+        row.operator(consts.ops.CPM_ESTIMATE_CACHE_MEMORY, icon = consts.icons.MEMORY)
+        columns = box.grid_flow(row_major = True, columns = 5, even_columns = True, align = True)
+        for counter in ("hits", "misses", "parses", "verify_prunes", "evictions"):
+            columns.label(text = f"{counter.replace('_', ' ').title()}: {stats[counter]}")
+
+    @staticmethod
+    def _draw_startup_timings(layout):
+        register_time = startup_timings.get("register", 0.0)
+        deferred_time = startup_timings.get("deferred_setup", 0.0)
+        text = f"Startup: {register_time * 1000:.1f} ms registering, {deferred_time * 1000:.1f} ms deferred"
+        if "blender_startup" in startup_timings:
+            share = (register_time + deferred_time) / startup_timings["blender_startup"]
+            text += f" ({share:.1%} of Blender's startup)"
+
+        layout.label(text = text)
\ No newline at end of file
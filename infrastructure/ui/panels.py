@@ -2,10 +2,13 @@ from itertools import chain
 
 import bpy
 
-from ...application.managers import GroupDataManager
-from ...core import expand_states
+from ...application.managers import GroupDataManager, SelectionViewManager
+from ...application.services import PreviewService
+from ...core import DrawModel, GroupData, ListMirror, SelectionView, draw_models, list_mirrors, list_view_panels
 from ...shared import consts, utils
+from ...shared.utils import SpanRecorder
 
+@SpanRecorder.timed("draw_panels")
 def draw_panels(panel: bpy.types.Panel, context, data_path: str):
     """
     Draws the panel associated with the provided context property_type.
@@ -18,9 +21,23 @@ def draw_panels(panel: bpy.types.Panel, context, data_path: str):
 
     # Get the data object dynamically
     data_object = utils.resolve_data_object(data_path)
-    if not data_object:
+    if data_object is None:
         return
 
+    # Draw the properties of every selected object at once, if several are selected. The active object may have no
+    # properties of its own while the others have.
+    if data_path.startswith("active_object"):
+        data_objects = utils.resolve_selection(data_path)
+        if len(data_objects) > 1:
+            layout.prop(
+                context.window_manager,
+                "cpm_edit_selection",
+                text = f"All {len(data_objects)} Selected",
+                icon = consts.icons.RESTRICT_SELECT_OFF)
+            if context.window_manager.cpm_edit_selection:
+                _draw_selection_view(layout, data_path, SelectionViewManager.get_view(data_objects))
+                return
+
     # Check if there are any properties to draw
     if not hasattr(data_object, consts.KEYS_ATTR) or not len(data_object.keys()) > 0:
         return
@@ -29,26 +46,33 @@ def draw_panels(panel: bpy.types.Panel, context, data_path: str):
     _draw_add_buttons(layout, data_path)
     layout.separator()
 
-    # Get deserialized data (data is automatically verified)
-    group_data = GroupDataManager.get_group_data(data_object)
-
     # Draw properties based on the associated group
-    lambda_sort = lambda x: x.lower()
-    for group_name, props in group_data.items():
-        props.sort(key = lambda_sort)
-        _draw_property_group(
+    draw_model = get_draw_model(data_object)
+    panel_name = type(panel).__name__
+    if panel_name in list_view_panels:
+        _draw_property_list(layout, context, data_object, data_path, draw_model)
+        return
+
+    # Only draw the properties matching the search. Groups with matches are expanded, so the matches are visible.
+    search_property = consts.PROPERTY_SEARCH_PREFIX + panel_name
+    layout.prop(context.window_manager, search_property, text = "", icon = consts.icons.VIEWZOOM)
+    search = getattr(context.window_manager, search_property)
+    if search:
+        draw_model = draw_model.filter(search, consts.SEARCH_CACHE_SIZE)
+
+    for group_name, props in draw_model.groups:
+        draw_property_group(
             layout,
             data_object,
             data_path,
             group_name,
-            props
+            props,
+            force_expanded = bool(search)
         )
 
     # Draw ungrouped properties
-    grouped = sorted(set(chain.from_iterable(group_data.values())))
-    ungrouped = sorted(set(data_object.keys()) - set(grouped), key = lambda_sort)
-    for prop_name in ungrouped:
-        _draw_property_row(
+    for prop_name in draw_model.ungrouped:
+        draw_property_row(
             layout,
             data_object,
             data_path,
@@ -56,14 +80,167 @@ def draw_panels(panel: bpy.types.Panel, context, data_path: str):
             group_name=""
         )
 
+def get_draw_model(data_object) -> DrawModel:
+    """
+    Gets what to draw for a data object. Groups are kept in order as they change, so they are drawn as they are.
+    Finding and sorting the ungrouped properties is only done again once the group data or the property names of the
+    data object changed.
+    """
+    object_id = data_object.as_pointer()
+    keys = list(data_object.keys())
+    generation = GroupDataManager.get_generation(data_object)
+    draw_model = draw_models.get(object_id)
+    if draw_model is not None and draw_model.is_valid(generation, keys):
+        return draw_model
+
+    # Get deserialized data (data is automatically verified)
+    group_data = GroupDataManager.get_group_data(data_object)
+
+    # Properties removed without a depsgraph update (e.g. by scripts) are still in the group data until it is
+    # reconciled, and cannot be drawn. Group data must not be written while drawing, so they are only left out here.
+    key_set = set(keys)
+    groups = [
+        (group_name, [prop for prop in props if prop in key_set])
+        for group_name, props in group_data.items()
+    ]
+    grouped = set(chain.from_iterable(group_data.values()))
+    ungrouped = sorted(key_set - grouped, key = lambda x: x.lower())
+
+    # Loading group data may have started a new generation
+    draw_model = DrawModel(
+        generation = GroupDataManager.get_generation(data_object),
+        keys = keys,
+        groups = groups,
+        ungrouped = ungrouped
+    )
+    draw_models[object_id] = draw_model
+
+    return draw_model
+
+def _draw_selection_view(layout, data_path: str, view: SelectionView):
+    """
+    Draws the union of the properties of the selected data objects. Values that differ between them are drawn as mixed,
+    and editing a value writes it to every selected data object having the property.
+    """
+    for group_name, props in view.groups:
+        box = layout.box()
+        box.label(text = group_name)
+        for prop_name in props:
+            _draw_selection_row(box, data_path, view, prop_name)
+
+    for prop_name in view.ungrouped:
+        _draw_selection_row(layout, data_path, view, prop_name)
+
+def _draw_selection_row(layout, data_path: str, view: SelectionView, prop_name: str):
+    row = layout.row()
+
+    # Properties only some of the data objects have show how many have them
+    count = view.counts[prop_name]
+    row.label(text = prop_name if count == view.object_count else f"{prop_name} ({count}/{view.object_count})")
+
+    edit_op = row.operator(consts.ops.CPM_EDIT_SELECTED_PROPERTY, text = view.texts.get(prop_name, "Mixed"))
+    edit_op.data_path = data_path
+    edit_op.name = prop_name
+
+def _draw_property_list(layout, context, data_object, data_path: str, draw_model: DrawModel):
+    """
+    Draws the properties as a list view, which only draws the rows that are scrolled into view. The list draws a
+    collection mirroring the draw model, which cannot be written to while drawing, so it is rebuilt from a timer when
+    the draw model changed. Until then the previous rows are drawn.
+    """
+    mirror = list_mirrors.get(data_path)
+    if mirror is None or mirror.draw_model is not draw_model:
+        _schedule_list_mirror_rebuild(data_object, data_path)
+
+    collection = context.window_manager.cpm_list_mirrors.get(data_path)
+    if mirror is None or collection is None:
+        layout.label(text = "Building list...")
+        return
+
+    layout.template_list(
+        consts.CPM_UL_PROPERTIES,
+        data_path,
+        collection,
+        "items",
+        collection,
+        "active_index",
+        rows = consts.LIST_VIEW_ROWS
+    )
+
+# Data whose list mirrors are waiting to be rebuilt, keyed by the data path of the panel. Data is kept as a path from
+# `utils.get_data_path`, since the data can be freed, e.g. by undo, before the timer runs, and paths relative to the
+# context of the Properties editor, like "material", do not resolve in the context of timers.
+_pending_list_rebuilds = {}
+
+def _schedule_list_mirror_rebuild(data_object, data_path: str):
+    _pending_list_rebuilds[data_path] = utils.get_data_path(data_object)
+    if not bpy.app.timers.is_registered(_rebuild_list_mirrors):
+        bpy.app.timers.register(_rebuild_list_mirrors, first_interval = 0)
+
+def cancel_list_mirror_rebuilds():
+    _pending_list_rebuilds.clear()
+    if bpy.app.timers.is_registered(_rebuild_list_mirrors):
+        bpy.app.timers.unregister(_rebuild_list_mirrors)
+
+def _rebuild_list_mirrors():
+    """Timer callback that rebuilds the collections the list views draw."""
+    collections = bpy.context.window_manager.cpm_list_mirrors
+    for data_path, resolvable_path in _pending_list_rebuilds.items():
+        data_object = utils.resolve_data_object(resolvable_path)
+        if data_object is None:
+            # The data was removed in the meantime
+            continue
+
+        draw_model = get_draw_model(data_object)
+
+        collection = collections.get(data_path)
+        if collection is None:
+            collection = collections.add()
+            collection.name = data_path
+
+        collection.items.clear()
+        for name, group_name, is_group in ListMirror.get_rows(draw_model):
+            item = collection.items.add()
+            item.name = name
+            item.group = group_name
+            item.is_group = is_group
+
+        list_mirrors[data_path] = ListMirror.from_draw_model(draw_model)
+
+    _pending_list_rebuilds.clear()
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'PROPERTIES':
+                area.tag_redraw()
+
+    # Run only once
+    return None
+
 def _draw_add_buttons(layout, data_path):
+    row = layout.row()
+
     # Draw the original "New" button
-    new_prop_op = layout.operator(
+    new_prop_op = row.operator(
         consts.ops.WM_PROPERTIES_ADD,
         text = "New",
         icon=  consts.ADD)
     new_prop_op.data_path = data_path
 
+    # Draw the "Copy to Selected" button for data that can be part of a selection
+    if data_path.startswith("active_object"):
+        copy_op = row.operator(
+            consts.ops.CPM_COPY_PROPERTIES,
+            text = "Copy to Selected",
+            icon = consts.icons.COPYDOWN)
+        copy_op.data_path = data_path
+
+    # Draw the "Apply Preset" button
+    apply_preset_op = row.operator(
+        consts.ops.CPM_APPLY_PRESET,
+        text = "Apply Preset",
+        icon = consts.icons.PRESET)
+    apply_preset_op.data_path = data_path
+
     # Draw the "New Group" button
     # new_prop_group_op = layout.operator(
     #     consts.ops.CPM_ADD_PROPERTY_GROUP,
@@ -71,8 +248,20 @@ def _draw_add_buttons(layout, data_path):
     #     icon = consts.icons.ADD)
     # new_prop_group_op.data_path = data_path
 
-def _draw_property_row(layout, data_object, data_path, prop_name, group_name):
-    """Draws a single property row."""
+def draw_property_row(
+        layout,
+        data_object,
+        data_path,
+        prop_name,
+        group_name,
+        draw_tree: bool = True,
+        movable: bool = False):
+    """
+    Draws a single property row.
+
+    :param draw_tree: Whether Python properties can be expanded into a tree view below the row.
+    :param movable: Whether to draw buttons that move the property up and down within its group.
+    """
     if prop_name.startswith("_"):
         # Skip private properties
         return
@@ -81,10 +270,16 @@ def _draw_property_row(layout, data_object, data_path, prop_name, group_name):
 
     # Check if property is PYTHON type (dict/IDPropertyGroup)
     value = data_object[prop_name]
+    is_tree_open = False
     if type(value).__name__ == consts.PropertyTypes.ID_PROPERTY_GROUP:
-        # Display Python properties as read-only string representations
-        row.label(text = prop_name)
-        row.label(text = str(dict(value)))
+        # Display Python properties as read-only, truncated previews that are only rebuilt when the data changed
+        if draw_tree:
+            is_tree_open = _draw_tree_toggle(row, data_object, data_path, prop_name, prop_name)
+        else:
+            row.label(text = prop_name)
+
+        generation = GroupDataManager.get_value_generation(data_object)
+        row.label(text = PreviewService.get_preview(data_object, prop_name, value, generation))
     else:
         row.label(text = prop_name)
         row.prop(
@@ -93,6 +288,13 @@ def _draw_property_row(layout, data_object, data_path, prop_name, group_name):
             text = ""
         )
 
+    if movable:
+        for direction, icon in (('UP', consts.icons.TRIA_UP), ('DOWN', consts.icons.TRIA_DOWN)):
+            move_op = row.operator(consts.ops.CPM_MOVE_PROPERTY, text = "", icon = icon, emboss = False)
+            move_op.data_path = data_path
+            move_op.name = prop_name
+            move_op.direction = direction
+
     # Draw the "edit property" button
     edit_op = row.operator(
         consts.ops.CPM_EDIT_PROPERTY,
@@ -114,12 +316,65 @@ def _draw_property_row(layout, data_object, data_path, prop_name, group_name):
     remove_op.property_name = prop_name
     remove_op.data_path = data_path
 
-def _draw_property_group(
+    if is_tree_open:
+        _draw_python_tree(layout, data_object, data_path, prop_name, value, depth = 1)
+
+def _draw_tree_toggle(row, data_object, data_path: str, tree_path: str, text: str) -> bool:
+    """
+    Draws the toggle of a tree view node, which is collapsed by default.
+
+    :param tree_path: The path of the node, see `GroupData.get_tree_path`.
+
+    :return: Whether the node is expanded.
+    """
+    is_expanded = tree_path in GroupDataManager.get_group_data(data_object).expanded_trees
+    toggle_op = row.operator(
+        consts.ops.CPM_EXPAND_TOGGLE,
+        text = text,
+        icon = consts.icons.DOWNARROW_HLT if is_expanded else consts.icons.RIGHTARROW,
+        emboss = False)
+    toggle_op.data_path = data_path
+    toggle_op.tree_path = tree_path
+
+    return is_expanded
+
+def _draw_python_tree(layout, data_object, data_path: str, path: str, value, depth: int):
+    """
+    Draws the nested values of a Python property. Only expanded levels are visited, and every level draws a bounded
+    number of values.
+
+    :param path: The path of the value's node, see `GroupData.get_tree_path`.
+    :param value: The value whose nested values to draw.
+    :param depth: The nesting level, used to indent the rows.
+    """
+    generation = GroupDataManager.get_value_generation(data_object)
+    for key, child in PreviewService.get_children(value):
+        child_path = GroupData.get_tree_path(path, key)
+        row = layout.row()
+        row.separator(factor = consts.TREE_INDENT * depth)
+        if PreviewService.is_nested(child):
+            is_expanded = _draw_tree_toggle(row, data_object, data_path, child_path, str(key))
+            row.label(text = PreviewService.get_preview(data_object, child_path, child, generation))
+            if is_expanded:
+                _draw_python_tree(layout, data_object, data_path, child_path, child, depth + 1)
+        else:
+            row.label(text = str(key))
+            row.label(text = PreviewService.format_preview(child, consts.PREVIEW_MAX_LENGTH))
+
+    hidden = len(value) - consts.PREVIEW_MAX_CHILDREN
+    if hidden > 0:
+        row = layout.row()
+        row.separator(factor = consts.TREE_INDENT * depth)
+        row.label(text = f"{hidden} more")
+
+def draw_property_group(
         layout: bpy.types.UILayout,
         data_object: bpy.types.Object,
         data_path: str,
         group_name: str,
-        props: list):
+        props: list,
+        force_expanded: bool = False,
+        pinnable: bool = False):
     """
     Draws a subpanel for a group of properties.
     Args:
@@ -128,13 +383,35 @@ def _draw_property_group(
         :param data_path: String path to the data object (e.g., "view_layer", "scene")
         :param group_name: String name of the group.
         :param props: A list of the group's properties.
+        :param force_expanded: Whether to draw the group's contents even if it is collapsed.
+        :param pinnable: Whether to draw a button that pins the group.
     """
     box = layout.box()
-    header = box.row()
+    group_data = GroupDataManager.get_group_data(data_object)
+    is_expanded = draw_group_header(box.row(), data_path, group_name, group_data, pinnable) or force_expanded
+
+    # Only draw the group's contents if expanded. Properties can be moved in manually ordered groups, unless only
+    # search results are shown.
+    if is_expanded:
+        movable = group_data.get_order_mode(group_name) == consts.GroupOrderModes.MANUAL and not force_expanded
+        for prop_name in props:
+            draw_property_row(box, data_object, data_path, prop_name, group_name, movable = movable)
+
+def draw_group_header(
+        header,
+        data_path: str,
+        group_name: str,
+        group_data: GroupData,
+        pinnable: bool = False) -> bool:
+    """
+    Draws the header of a group: its expand toggle and its buttons.
 
-    # Create a unique key for this group to store the expand state
-    expand_key = f"_cpm_{data_object.name}_{data_path}_{group_name}"
-    is_expanded = expand_states.get(expand_key, True)
+    :param group_data: The group data the group belongs to, which holds its expand state, pin state and order mode.
+    :param pinnable: Whether to draw a button that pins the group.
+
+    :return: Whether the group is expanded.
+    """
+    is_expanded = group_data.is_group_expanded(group_name)
 
     toggle_op = header.operator(
         consts.ops.CPM_EXPAND_TOGGLE,
@@ -142,18 +419,43 @@ def _draw_property_group(
         icon = consts.icons.DOWNARROW_HLT if is_expanded
             else consts.icons.RIGHTARROW,
         emboss = False)
-    toggle_op.expand_key = expand_key
-    toggle_op.current_state = is_expanded
+    toggle_op.data_path = data_path
+    toggle_op.group = group_name
+
+    if pinnable:
+        pin_op = header.operator(
+            consts.ops.CPM_TOGGLE_PINNED_GROUP,
+            text = "",
+            icon = consts.icons.PINNED if group_name in group_data.pinned_groups else consts.icons.UNPINNED,
+            emboss = False)
+        pin_op.data_path = data_path
+        pin_op.group = group_name
+
+    # Draw the order mode, which toggles when clicked
+    is_alphabetical = group_data.get_order_mode(group_name) == consts.GroupOrderModes.ALPHABETICAL
+    order_op = header.operator(
+        consts.ops.CPM_SET_GROUP_ORDER,
+        text = "",
+        icon = consts.icons.SORTALPHA if is_alphabetical else consts.icons.GRIP,
+        emboss = False)
+    order_op.data_path = data_path
+    order_op.group = group_name
+    order_op.order_mode = consts.GroupOrderModes.MANUAL if is_alphabetical else consts.GroupOrderModes.ALPHABETICAL
+
+    save_preset_op = header.operator(
+        consts.ops.CPM_SAVE_PRESET,
+        text = "",
+        icon = consts.icons.PRESET_NEW,
+        emboss = False)
+    save_preset_op.data_path = data_path
+    save_preset_op.group = group_name
 
     remove_group_op = header.operator(
         consts.ops.CPM_REMOVE_PROPERTY_GROUP,
         text = "",
-        icon = 'TRASH',
+        icon = consts.icons.TRASH,
         emboss = False)
     remove_group_op.data_path = data_path
     remove_group_op.group = group_name
 
-    # Only draw the group's contents if expanded
-    if is_expanded:
-        for prop_name in props:
-            _draw_property_row(box, data_object, data_path, prop_name, group_name)
\ No newline at end of file
+    return is_expanded
\ No newline at end of file
@@ -0,0 +1,58 @@
+import bpy
+from bpy.props import BoolProperty, CollectionProperty, IntProperty, StringProperty
+
+from .panels import draw_group_header, draw_property_row
+from ...application.managers import GroupDataManager
+from ...core import list_mirrors
+from ...shared import utils
+
+# noinspection PyTypeHints
+class CPMListItem(bpy.types.PropertyGroup):
+    """A row of a list view: a group header, or a property named `name`."""
+    group: StringProperty()
+    is_group: BoolProperty()
+
+# noinspection PyTypeHints
+class CPMListMirror(bpy.types.PropertyGroup):
+    """The rows of the list view of the panels drawing the data at the data path `name`."""
+    items: CollectionProperty(type = CPMListItem)
+    active_index: IntProperty()
+
+class CPM_UL_properties(bpy.types.UIList):
+    """Draws custom properties and their groups, only drawing the rows that are scrolled into view."""
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index = 0, flt_flag = 0):
+        data_object = utils.resolve_data_object(data.name)
+        if not data_object:
+            return
+
+        if item.is_group:
+            draw_group_header(layout, data.name, item.name, GroupDataManager.get_group_data(data_object))
+        elif item.name in data_object:
+            # Rows may briefly be stale while the mirror is rebuilt
+            draw_property_row(layout, data_object, data.name, item.name, item.group, draw_tree = False)
+
+    def filter_items(self, context, data, propname):
+        mirror = list_mirrors.get(data.name)
+        items = getattr(data, propname)
+        if mirror is None or len(mirror.search_keys) != len(items):
+            return [self.bitflag_filter_item] * len(items), []
+
+        search = self.filter_name.lower().strip("*")
+        # Groups make no sense once rows are searched or sorted, so only properties are shown then
+        flat = bool(search) or self.use_filter_sort_alpha
+        data_object = utils.resolve_data_object(data.name)
+        collapsed = set()
+        if not flat and data_object:
+            collapsed = GroupDataManager.get_group_data(data_object).collapsed_groups
+
+        flags = []
+        for search_key, group_name, is_group in zip(mirror.search_keys, mirror.row_groups, mirror.group_rows):
+            if flat:
+                shown = not is_group and (search in search_key) != self.use_filter_invert
+            else:
+                shown = is_group or group_name not in collapsed
+
+            flags.append(self.bitflag_filter_item if shown else 0)
+
+        return flags, mirror.alpha_order if self.use_filter_sort_alpha else []
\ No newline at end of file
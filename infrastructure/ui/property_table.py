@@ -0,0 +1,81 @@
+import bpy
+
+from ...application.managers import PropertyTableManager
+from ...shared import consts
+
+class CPM_UL_property_table(bpy.types.UIList):
+    """Draws a row of the property table per object, only drawing the rows that are scrolled into view."""
+
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index = 0, flt_flag = 0):
+        table = PropertyTableManager.table
+        row = layout.row(align = True)
+        row.label(text = item.name, icon = consts.icons.OBJECT_DATA)
+        if index >= len(table.row_names) or table.row_names[index] != item.name:
+            # The table is read again on the next redraw
+            return
+
+        for column, texts in table.texts.items():
+            edit_op = row.operator(consts.ops.CPM_EDIT_TABLE_CELL, text = texts[index])
+            edit_op.row = table.row_keys[index]
+            edit_op.column = column
+
+    def filter_items(self, context, data, propname):
+        # Rows are in the order of the objects, so the cached values line up with the items
+        table = PropertyTableManager.get_table()
+        item_count = len(getattr(data, propname))
+        if len(table.row_names) != item_count:
+            return [self.bitflag_filter_item] * item_count, []
+
+        search = self.filter_name.lower().strip("*")
+        if search:
+            flags = [
+                self.bitflag_filter_item if (search in name.lower()) != self.use_filter_invert else 0
+                for name in table.row_names
+            ]
+        else:
+            flags = [self.bitflag_filter_item] * item_count
+
+        return flags, table.get_positions()
+
+class VIEW3D_PT_cpm_property_table(bpy.types.Panel):
+    """Compares custom properties across all objects, with an object per row and a property per column."""
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = consts.SIDEBAR_CATEGORY
+    bl_label = "Property Table"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        table = PropertyTableManager.get_table()
+
+        row = layout.row()
+        row.operator(consts.ops.CPM_ADD_TABLE_COLUMN, icon = consts.icons.ADD)
+        row.operator(consts.ops.CPM_REFRESH_TABLE, text = "", icon = consts.icons.FILE_REFRESH)
+        if not table.values:
+            layout.label(text = "Add a column to compare a property across objects")
+            return
+
+        # Column headers sort the table when clicked
+        header = layout.row(align = True)
+        header.label(text = "Object")
+        for column in table.values:
+            column_row = header.row(align = True)
+            icon = 'NONE'
+            if column == table.sort_column:
+                icon = consts.icons.TRIA_DOWN if table.sort_reverse else consts.icons.TRIA_UP
+
+            sort_op = column_row.operator(consts.ops.CPM_SORT_TABLE, text = column, icon = icon)
+            sort_op.column = column
+            remove_op = column_row.operator(consts.ops.CPM_REMOVE_TABLE_COLUMN, text = "", icon = consts.icons.X)
+            remove_op.column = column
+
+        layout.template_list(
+            consts.CPM_UL_PROPERTY_TABLE,
+            "",
+            bpy.data,
+            "objects",
+            context.window_manager,
+            "cpm_table_active_index",
+            rows = consts.TABLE_VIEW_ROWS
+        )
\ No newline at end of file
@@ -0,0 +1,71 @@
+import bpy
+
+from .panels import draw_property_group, draw_property_row, get_draw_model
+from ...application.managers import GroupDataManager
+from ...shared import consts, utils
+
+class VIEW3D_PT_cpm_selection(bpy.types.Panel):
+    """
+    Draws the grouped custom properties of the active and selected objects. Each object is drawn from its cached draw
+    model, so properties are only walked again once they changed, not when the selection does.
+    """
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = consts.SIDEBAR_CATEGORY
+    bl_label = "Selected Objects"
+
+    def draw(self, context):
+        layout = self.layout
+        pinned_only = context.window_manager.cpm_pinned_groups_only
+        layout.prop(context.window_manager, "cpm_pinned_groups_only", icon = consts.icons.PINNED)
+
+        data_objects = _get_selection(context)
+        if not data_objects:
+            layout.label(text = "No objects selected")
+            return
+
+        # Only a bounded number of objects is drawn, so selecting many objects stays cheap
+        for data_object in data_objects[:consts.SIDEBAR_MAX_OBJECTS]:
+            if data_object == context.active_object:
+                data_path = "active_object"
+            else:
+                data_path = utils.get_data_path(data_object)
+
+            _draw_object(layout, data_object, data_path, pinned_only)
+
+        hidden = len(data_objects) - consts.SIDEBAR_MAX_OBJECTS
+        if hidden > 0:
+            layout.label(text = f"{hidden} more selected")
+
+def _get_selection(context) -> list:
+    """Gets the active object, followed by the other selected objects."""
+    active_object = context.active_object
+    selected = [data_object for data_object in context.selected_objects if data_object != active_object]
+
+    return selected if active_object is None else [active_object, *selected]
+
+def _draw_object(layout, data_object, data_path: str, pinned_only: bool):
+    """
+    Draws the groups and ungrouped properties of an object. Objects without anything to draw are left out.
+
+    :param data_path: String path to the object, which the buttons of its properties and groups use.
+    :param pinned_only: Whether to only draw the pinned groups of the object.
+    """
+    draw_model = get_draw_model(data_object)
+    groups = draw_model.groups
+    ungrouped = draw_model.ungrouped
+    if pinned_only:
+        pinned_groups = GroupDataManager.get_group_data(data_object).pinned_groups
+        groups = [(group_name, props) for group_name, props in groups if group_name in pinned_groups]
+        ungrouped = []
+
+    if not groups and all(prop_name.startswith("_") for prop_name in ungrouped):
+        return
+
+    column = layout.column()
+    column.label(text = data_object.name, icon = consts.icons.OBJECT_DATA)
+    for group_name, props in groups:
+        draw_property_group(column, data_object, data_path, group_name, props, pinnable = True)
+
+    for prop_name in ungrouped:
+        draw_property_row(column, data_object, data_path, prop_name, group_name = "")
\ No newline at end of file
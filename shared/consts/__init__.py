@@ -1,43 +1,201 @@
+"""
+The add-on's constants, in one flat namespace (`consts.MODULE_NAME`, `consts.PropertyTypes`, ...). Each constants module
+can be accessed directly as well (`consts.ops.CPM_EDIT_PROPERTY`).
+
+Names are resolved from the static map below the first time they are accessed, so importing this package is cheap and
+works from zipped installs. Add new constants to the map of the module that defines them.
+"""
 import importlib
-from pathlib import Path
-
-# Get all Python files in the current directory (excluding __init__.py and any "private" files)
-current_dir = Path(__file__).parent
-const_files = [
-    file.stem for file in current_dir.glob("*.py")
-    if file.stem != "__init__" and not file.stem.startswith("_")
-]
-
-# Import all consts from each file
-imported_names = []
-name_sources = {}
-for file_name in const_files:
-    try:
-        module = importlib.import_module(f".{file_name}", package = __name__)
-
-        # Import all uppercase constants
-        for const_name in dir(module):
-            const_value = getattr(module, const_name)
-            is_class = isinstance(const_value, type)
-
-            # Skip if the constant either is not uppercase, is private, or is callable, and is neither an Enum class nor
-            # instance
-            if ((not const_name.isupper()
-                or const_name.startswith("_")
-                or callable(const_value))
-                and not is_class):
-
-                continue
-
-            # Check for naming conflicts
-            if const_name in name_sources:
-                raise ImportError(f"Duplicate constant name: {const_name} (from {name_sources[const_name]} and {file_name})")
-
-            globals()[const_name] = getattr(module, const_name)
-            imported_names.append(const_name)
-            name_sources[const_name] = file_name
-
-    except ImportError as e:
-        print(f"Warning: Could not import constants from {file_name}: {e}")
-
-__all__ = imported_names
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .config import *
+    from .defaults import *
+    from .enums import *
+    from .icons import *
+    from .misc import *
+    from .ops import *
+    from .panels import *
+
+# Names of the constants defined by each constants module
+_MODULE_CONSTANTS = {
+    "config": (
+        "ARRAY_LENGTH_MAX",
+        "ARRAY_LENGTH_MIN",
+        "GROUP_NAME_MAX_LENGTH",
+        "GROUP_SEARCH_MAX_RESULTS",
+        "JOB_TICK_INTERVAL",
+        "JOB_TIME_BUDGET",
+        "LIST_VIEW_ROWS",
+        "PARALLEL_PARSE_MIN_BYTES",
+        "PARSE_BATCHES_PER_WORKER",
+        "PREVIEW_CACHE_SIZE",
+        "PREVIEW_MAX_CHILDREN",
+        "PREVIEW_MAX_LENGTH",
+        "PROFILE_SUMMARY_LIMIT",
+        "SEARCH_CACHE_SIZE",
+        "SIDEBAR_MAX_OBJECTS",
+        "SPAN_SAMPLE_LIMIT",
+        "TABLE_CELL_MAX_LENGTH",
+        "TABLE_VIEW_ROWS",
+        "TREE_INDENT",
+    ),
+    "defaults": (
+        "DEFAULT_BOOL_ARRAY",
+        "DEFAULT_DESCRIPTION",
+        "DEFAULT_FLOAT_ARRAY",
+        "DEFAULT_ID_TYPE",
+        "DEFAULT_INT_ARRAY",
+        "DEFAULT_MAX_FLOAT",
+        "DEFAULT_MAX_FLOAT_ARRAY",
+        "DEFAULT_MAX_INT",
+        "DEFAULT_MAX_INT_ARRAY",
+        "DEFAULT_MIN_FLOAT",
+        "DEFAULT_MIN_FLOAT_ARRAY",
+        "DEFAULT_MIN_INT",
+        "DEFAULT_MIN_INT_ARRAY",
+        "DEFAULT_PRECISION_FLOAT",
+        "DEFAULT_PRECISION_FLOAT_ARRAY",
+        "DEFAULT_SOFT_MAX_FLOAT",
+        "DEFAULT_SOFT_MAX_FLOAT_ARRAY",
+        "DEFAULT_SOFT_MAX_INT",
+        "DEFAULT_SOFT_MAX_INT_ARRAY",
+        "DEFAULT_SOFT_MIN_FLOAT",
+        "DEFAULT_SOFT_MIN_FLOAT_ARRAY",
+        "DEFAULT_SOFT_MIN_INT",
+        "DEFAULT_SOFT_MIN_INT_ARRAY",
+        "DEFAULT_STEP_FLOAT",
+        "DEFAULT_STEP_FLOAT_ARRAY",
+        "DEFAULT_STEP_INT",
+        "DEFAULT_STEP_INT_ARRAY",
+        "DEFAULT_SUBTYPE",
+        "DEFAULT_VALUE_BOOL",
+        "DEFAULT_VALUE_BOOL_ARRAY",
+        "DEFAULT_VALUE_FLOAT",
+        "DEFAULT_VALUE_INT",
+        "DEFAULT_VALUE_STRING",
+    ),
+    "enums": (
+        "COPY_MODES",
+        "CopyModes",
+        "GROUP_DATA_STORAGE_TYPES",
+        "GroupDataStorageTypes",
+        "GROUP_ORDER_MODES",
+        "GroupOrderModes",
+        "LIST_VIEW_PANELS",
+        "LOG_LEVELS",
+        "PARSE_EXECUTORS",
+        "PROPERTY_SUBTYPES",
+        "PROPERTY_SUBTYPE_VECTORS",
+        "PROPERTY_TYPES",
+        "ParseExecutors",
+        "PropertyTypes",
+    ),
+    "icons": (
+        "ADD",
+        "CANCEL",
+        "CHECKMARK",
+        "COPYDOWN",
+        "DOWNARROW_HLT",
+        "EXPORT",
+        "FILE_REFRESH",
+        "GRIP",
+        "MEMORY",
+        "OBJECT_DATA",
+        "PINNED",
+        "PREFERENCES",
+        "PRESET",
+        "PRESET_NEW",
+        "RESTRICT_SELECT_OFF",
+        "RIGHTARROW",
+        "SORTALPHA",
+        "TIME",
+        "TRASH",
+        "TRIA_DOWN",
+        "TRIA_UP",
+        "UNPINNED",
+        "VIEWZOOM",
+        "X",
+    ),
+    "misc": (
+        "ADDON_NAME",
+        "ALL",
+        "CPM_NATIVE_GROUP_DATA",
+        "CPM_SERIALIZED_GROUP_DATA",
+        "DEFAULT_GROUP_DATA",
+        "GROUP_DATA_VERSION",
+        "KEYS_ATTR",
+        "MODULE_NAME",
+        "PRESETS_DIR",
+        "PRESET_FILE_EXTENSION",
+        "PROFILES_DIR",
+        "PROFILE_FILE_EXTENSION",
+        "PROPERTY_SEARCH_PREFIX",
+        "TREE_PATH_SEPARATOR",
+        "VERIFY_ALL_JOB_NAME",
+    ),
+    "ops": (
+        "CPM_ADD_PROPERTY_GROUP",
+        "CPM_ADD_TABLE_COLUMN",
+        "CPM_APPLY_PRESET",
+        "CPM_CANCEL_JOBS",
+        "CPM_CAPTURE_PROFILE",
+        "CPM_COPY_PROPERTIES",
+        "CPM_EDIT_PROPERTY",
+        "CPM_EDIT_SELECTED_PROPERTY",
+        "CPM_EDIT_TABLE_CELL",
+        "CPM_ESTIMATE_CACHE_MEMORY",
+        "CPM_EXPAND_TOGGLE",
+        "CPM_EXPORT_SPANS",
+        "CPM_MOVE_PROPERTY",
+        "CPM_REFRESH_TABLE",
+        "CPM_REMOVE_PROPERTY_GROUP",
+        "CPM_REMOVE_TABLE_COLUMN",
+        "CPM_RESET_SPANS",
+        "CPM_SAVE_PRESET",
+        "CPM_SET_GROUP_ORDER",
+        "CPM_SORT_TABLE",
+        "CPM_TOGGLE_PINNED_GROUP",
+        "CPM_VERIFY_ALL_GROUP_DATA",
+        "WM_PROPERTIES_ADD",
+        "WM_PROPERTIES_REMOVE",
+    ),
+    "panels": (
+        "BLENDER_PANELS",
+        "CPM_UL_PROPERTIES",
+        "CPM_UL_PROPERTY_TABLE",
+        "DATA_COLLECTIONS",
+        "ID_TYPE_COLLECTIONS",
+        "NESTED_DATA_PATHS",
+        "POSE_MODE_DATA_PATHS",
+        "Panel",
+        "SIDEBAR_CATEGORY",
+    ),
+}
+
+_CONSTANT_MODULES = {
+    name: module_name
+    for module_name, names in _MODULE_CONSTANTS.items()
+    for name in names
+}
+
+__all__ = list(_CONSTANT_MODULES)
+
+def __getattr__(name: str):
+    module_name = _CONSTANT_MODULES.get(name)
+    if module_name is None:
+        if name in _MODULE_CONSTANTS:
+            # Importing a submodule binds it to the package, so this only happens once
+            return importlib.import_module(f".{name}", __name__)
+
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+
+    # Bind the constant, so later lookups do not go through this function
+    globals()[name] = value
+
+    return value
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_CONSTANT_MODULES, *_MODULE_CONSTANTS})
\ No newline at end of file
@@ -1,2 +1,19 @@
 ARRAY_LENGTH_MAX = 32
-ARRAY_LENGTH_MIN = 1
\ No newline at end of file
+ARRAY_LENGTH_MIN = 1
+GROUP_NAME_MAX_LENGTH = 64 # Same as ID property names (including the terminator), which native group storage uses
+SPAN_SAMPLE_LIMIT = 1000 # Most recent samples kept per timing span
+PROFILE_SUMMARY_LIMIT = 40 # Functions listed in the text summary of a profile capture
+SEARCH_CACHE_SIZE = 16 # Most recent property searches whose results are kept per data object
+PREVIEW_MAX_LENGTH = 80 # Characters shown by the preview of a Python property
+PREVIEW_MAX_CHILDREN = 50 # Nested values drawn per level of a Python property's tree view
+TREE_INDENT = 2.0 # Indentation of each level of a tree view, as a factor of a separator's width
+PREVIEW_CACHE_SIZE = 1024 # Most recently drawn previews that are kept
+LIST_VIEW_ROWS = 12 # Rows shown by list views before they scroll
+JOB_TIME_BUDGET = 0.008 # Seconds background jobs may run per timer tick, so Blender stays responsive
+JOB_TICK_INTERVAL = 0.02 # Seconds between the timer ticks that run background jobs
+PARALLEL_PARSE_MIN_BYTES = 1 << 20 # Serialized group data below this size is parsed serially, since pools cost more to start
+PARSE_BATCHES_PER_WORKER = 4 # Batches serialized group data is split into per pool worker
+TABLE_VIEW_ROWS = 16 # Rows shown by the property table before it scrolls
+TABLE_CELL_MAX_LENGTH = 24 # Characters shown per cell of the property table
+SIDEBAR_MAX_OBJECTS = 16 # Selected objects the sidebar draws the properties of, so large selections stay cheap to draw
+GROUP_SEARCH_MAX_RESULTS = 100 # Group names suggested while typing a group name
\ No newline at end of file
@@ -4,6 +4,8 @@ from collections.abc import Sequence
 
 import bpy
 
+from .panels import BLENDER_PANELS
+
 PROPERTY_TYPES = (
     ('FLOAT', "Float", "A single floating-point value"),
     ('FLOAT_ARRAY', "Float Array", "An array of floating-point values"),
@@ -55,6 +57,53 @@ PROPERTY_SUBTYPE_VECTORS = (
     ('XYZ', "XYZ", "")
 )  # https://projects.blender.org/blender/blender/src/branch/main/scripts/startup/bl_operators/wm.py#L1409
 
+COPY_MODES = (
+    ('OVERWRITE', "Overwrite", "Replace properties that already exist on the targets"),
+    ('SKIP', "Skip", "Leave properties that already exist on the targets untouched"),
+    ('MERGE', "Merge", "Keep the values of existing properties, but take their UI data and group from the source"),
+)
+
+class CopyModes:
+    OVERWRITE = COPY_MODES[0][0]
+    SKIP = COPY_MODES[1][0]
+    MERGE = COPY_MODES[2][0]
+
+GROUP_DATA_STORAGE_TYPES = (
+    ('JSON', "JSON String", "Store group data as a JSON string, written when the file is saved"),
+    ('NATIVE', "Native Properties", "Store group data as native ID properties, written as soon as it changes"),
+)
+
+class GroupDataStorageTypes:
+    JSON = GROUP_DATA_STORAGE_TYPES[0][0]
+    NATIVE = GROUP_DATA_STORAGE_TYPES[1][0]
+
+PARSE_EXECUTORS = (
+    ('AUTO', "Automatic", "Parse serially or in threads, based on the amount of group data"),
+    ('SERIAL', "Serial", "Parse group data on the main thread"),
+    ('THREAD', "Threads", "Parse group data in a thread pool"),
+    ('PROCESS', "Processes", "Parse group data in a process pool, which only pays off for very large files"),
+)
+
+class ParseExecutors:
+    AUTO = PARSE_EXECUTORS[0][0]
+    SERIAL = PARSE_EXECUTORS[1][0]
+    THREAD = PARSE_EXECUTORS[2][0]
+    PROCESS = PARSE_EXECUTORS[3][0]
+
+GROUP_ORDER_MODES = (
+    ('ALPHABETICAL', "Alphabetical", "Keep the properties of the group sorted by name"),
+    ('MANUAL', "Manual", "Keep the properties of the group in the order they were arranged in"),
+)
+
+class GroupOrderModes:
+    ALPHABETICAL = GROUP_ORDER_MODES[0][0]
+    MANUAL = GROUP_ORDER_MODES[1][0]
+
+LIST_VIEW_PANELS = tuple(
+    (panel.name, panel.label, f"Draw the custom properties of the {panel.label} panel as a scrollable list")
+    for panel in BLENDER_PANELS
+)
+
 LOG_LEVELS = (
     (str(logging.CRITICAL + 1), "None", "Shows no messages"),
     (str(logging.DEBUG), "Debug", "Shows debug, info, warning, error, and critical messages"),
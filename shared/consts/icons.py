@@ -2,4 +2,23 @@ ADD = 'ADD'
 PREFERENCES = 'PREFERENCES'
 DOWNARROW_HLT = 'DOWNARROW_HLT'
 RIGHTARROW = 'RIGHTARROW'
-X = 'X'
\ No newline at end of file
+X = 'X'
+COPYDOWN = 'COPYDOWN'
+PRESET = 'PRESET'
+PRESET_NEW = 'PRESET_NEW'
+TRASH = 'TRASH'
+EXPORT = 'EXPORT'
+TIME = 'TIME'
+CHECKMARK = 'CHECKMARK'
+CANCEL = 'CANCEL'
+VIEWZOOM = 'VIEWZOOM'
+SORTALPHA = 'SORTALPHA'
+GRIP = 'GRIP'
+TRIA_UP = 'TRIA_UP'
+TRIA_DOWN = 'TRIA_DOWN'
+OBJECT_DATA = 'OBJECT_DATA'
+FILE_REFRESH = 'FILE_REFRESH'
+PINNED = 'PINNED'
+UNPINNED = 'UNPINNED'
+RESTRICT_SELECT_OFF = 'RESTRICT_SELECT_OFF'
+MEMORY = 'MEMORY'
\ No newline at end of file
@@ -1,6 +1,15 @@
 ADDON_NAME = "Custom Properties Manager"
 MODULE_NAME = "custom_properties_manager"
 CPM_SERIALIZED_GROUP_DATA = "_cpm_serialized_group_data"
+CPM_NATIVE_GROUP_DATA = "_cpm_group_data"
 DEFAULT_GROUP_DATA = "{}"
+GROUP_DATA_VERSION = 2 # Version of the format group data is stored in. Unversioned group data is version 1.
 KEYS_ATTR = "keys"
-ALL = 'ALL'
\ No newline at end of file
+PROPERTY_SEARCH_PREFIX = "cpm_property_search_" # Window manager property holding the search of a panel, by panel name
+ALL = 'ALL'
+PRESETS_DIR = "presets"
+PRESET_FILE_EXTENSION = ".json"
+PROFILES_DIR = "profiles"
+PROFILE_FILE_EXTENSION = ".prof"
+TREE_PATH_SEPARATOR = "\x1f" # Separates the keys in paths of tree view nodes. Unlike slashes, it is not used in names.
+VERIFY_ALL_JOB_NAME = "Verify Group Data"
\ No newline at end of file
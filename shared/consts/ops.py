@@ -6,4 +6,22 @@ WM_PROPERTIES_REMOVE = "wm.properties_remove"
 CPM_EXPAND_TOGGLE = "cpm.expand_toggle"
 CPM_ADD_PROPERTY_GROUP = "cpm.add_property_group"
 CPM_EDIT_PROPERTY = "cpm.edit_property"
-CPM_REMOVE_PROPERTY_GROUP = "cpm.remove_property_group"
\ No newline at end of file
+CPM_REMOVE_PROPERTY_GROUP = "cpm.remove_property_group"
+CPM_COPY_PROPERTIES = "cpm.copy_properties"
+CPM_APPLY_PRESET = "cpm.apply_preset"
+CPM_SAVE_PRESET = "cpm.save_preset"
+CPM_EXPORT_SPANS = "cpm.export_spans"
+CPM_RESET_SPANS = "cpm.reset_spans"
+CPM_CAPTURE_PROFILE = "cpm.capture_profile"
+CPM_VERIFY_ALL_GROUP_DATA = "cpm.verify_all_group_data"
+CPM_CANCEL_JOBS = "cpm.cancel_jobs"
+CPM_ESTIMATE_CACHE_MEMORY = "cpm.estimate_cache_memory"
+CPM_MOVE_PROPERTY = "cpm.move_property"
+CPM_SET_GROUP_ORDER = "cpm.set_group_order"
+CPM_ADD_TABLE_COLUMN = "cpm.add_table_column"
+CPM_REMOVE_TABLE_COLUMN = "cpm.remove_table_column"
+CPM_SORT_TABLE = "cpm.sort_table"
+CPM_EDIT_TABLE_CELL = "cpm.edit_table_cell"
+CPM_REFRESH_TABLE = "cpm.refresh_table"
+CPM_TOGGLE_PINNED_GROUP = "cpm.toggle_pinned_group"
+CPM_EDIT_SELECTED_PROPERTY = "cpm.edit_selected_property"
\ No newline at end of file
@@ -1,9 +1,91 @@
 from collections import namedtuple
 
-Panel = namedtuple("Panel", ["name", "data_path"])
+Panel = namedtuple("Panel", ["name", "data_path", "label"])
 BLENDER_PANELS = [
-    Panel("VIEWLAYER_PT_layer_custom_props", "view_layer"),
-    Panel("SCENE_PT_custom_props", "scene"),
-    Panel("OBJECT_PT_custom_props", "active_object"),
-    Panel("DATA_PT_custom_props_light", "active_object.data"),
-]
\ No newline at end of file
+    Panel("VIEWLAYER_PT_layer_custom_props", "view_layer", "View Layer"),
+    Panel("SCENE_PT_custom_props", "scene", "Scene"),
+    Panel("OBJECT_PT_custom_props", "active_object", "Object"),
+    Panel("DATA_PT_custom_props_light", "active_object.data", "Light"),
+    Panel("DATA_PT_custom_props_mesh", "active_object.data", "Mesh"),
+    Panel("DATA_PT_custom_props_curve", "active_object.data", "Curve"),
+    Panel("DATA_PT_custom_props_curves", "active_object.data", "Curves"),
+    Panel("DATA_PT_custom_props_camera", "active_object.data", "Camera"),
+    Panel("DATA_PT_custom_props_arm", "active_object.data", "Armature"),
+    Panel("DATA_PT_custom_props_lattice", "active_object.data", "Lattice"),
+    Panel("DATA_PT_custom_props_metaball", "active_object.data", "Metaball"),
+    Panel("DATA_PT_custom_props_speaker", "active_object.data", "Speaker"),
+    Panel("DATA_PT_custom_props_pointcloud", "active_object.data", "Point Cloud"),
+    Panel("DATA_PT_custom_props_volume", "active_object.data", "Volume"),
+    Panel("BONE_PT_custom_props", "active_bone", "Bone"),
+    Panel("MATERIAL_PT_custom_props", "material", "Material"),
+    Panel("WORLD_PT_custom_props", "world", "World"),
+    Panel("TEXTURE_PT_custom_props", "texture", "Texture"),
+    Panel("COLLECTION_PT_collection_custom_props", "collection", "Collection"),
+]
+
+# Data paths of panels that draw other data in Pose Mode, like Blender's own panels do, e.g. the Bone panel draws the
+# bone or edit bone outside of Pose Mode and the pose bone in it
+POSE_MODE_DATA_PATHS = {
+    "active_bone": "active_pose_bone",
+}
+
+# `bpy.data` collections whose data can hold group data. Collections missing from the running Blender version are
+# skipped.
+DATA_COLLECTIONS = (
+    "scenes",
+    "objects",
+    "meshes",
+    "curves",
+    "hair_curves",
+    "armatures",
+    "lights",
+    "cameras",
+    "lattices",
+    "metaballs",
+    "speakers",
+    "pointclouds",
+    "volumes",
+    "materials",
+    "textures",
+    "worlds",
+    "collections",
+    "node_groups",
+)
+
+# `bpy.data` collection holding the IDs of each `ID.id_type`
+ID_TYPE_COLLECTIONS = {
+    'SCENE': "scenes",
+    'OBJECT': "objects",
+    'MESH': "meshes",
+    'CURVE': "curves",
+    'CURVES': "hair_curves",
+    'ARMATURE': "armatures",
+    'LIGHT': "lights",
+    'CAMERA': "cameras",
+    'LATTICE': "lattices",
+    'META': "metaballs",
+    'SPEAKER': "speakers",
+    'POINTCLOUD': "pointclouds",
+    'VOLUME': "volumes",
+    'MATERIAL': "materials",
+    'TEXTURE': "textures",
+    'WORLD': "worlds",
+    'COLLECTION': "collections",
+    'NODETREE': "node_groups",
+}
+
+# Data that is not an ID itself, but is owned by the IDs of a `bpy.data` collection and can hold group data
+NESTED_DATA_PATHS = {
+    "scenes": ("view_layers",),
+    "objects": ("pose.bones",),
+    "armatures": ("bones",),
+}
+
+# Identifier of the list view of custom properties
+CPM_UL_PROPERTIES = "CPM_UL_properties"
+
+# Identifier of the list drawing the rows of the property table
+CPM_UL_PROPERTY_TABLE = "CPM_UL_property_table"
+
+# Tab of the 3D Viewport sidebar holding the add-on's own panels
+SIDEBAR_CATEGORY = "CPM"
@@ -1,9 +1,17 @@
 from .common import *
 from .logger import StructuredLogger
+from .profile_capture import ProfileCapture
+from .spans import SpanRecorder
 
 __all__ = [
     "resolve_data_object",
+    "resolve_selected_data_objects",
+    "resolve_selection",
+    "get_data_path",
     "get_dynamic_blender_property",
     "get_blender_operator_type",
-    "StructuredLogger"
+    "get_user_config_dir",
+    "StructuredLogger",
+    "SpanRecorder",
+    "ProfileCapture"
 ]
\ No newline at end of file
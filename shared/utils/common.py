@@ -1,24 +1,40 @@
+import os
+import re
 import bpy
 
 from typing import Union
 from .. import consts
 
+# The add-on's root package, used to locate its user directories
+_ADDON_PACKAGE = __package__.removesuffix(".shared.utils")
+# Paths `get_data_path` returns: the collection, name and library of an ID, and the path of data nested in it
+_DATA_PATH_PATTERN = re.compile(r'blend_data\.(\w+)\["((?:[^"\\]|\\.)*)", (?:None|"((?:[^"\\]|\\.)*)")\](?:\.(.+))?')
+
 def resolve_data_object(data_path: str) -> Union[bpy.types.Object, None]:
     """
     Resolve a data_path string to the actual object.
 
-    :param data_path: String like "view_layer", "scene", "active_object.data", etc.
+    :param data_path: String like "view_layer", "scene", "active_object.data", etc. Paths `get_data_path` returns are
+    looked up in `bpy.data`, and other paths looking up a collection item by name are resolved by Blender.
 
     :return: The resolved Blender object or None, if not found.
     """
     # Handle nested paths like "active_object.data"
     obj = bpy.context
     try:
+        match = _DATA_PATH_PATTERN.fullmatch(data_path)
+        if match is not None:
+            return _resolve_blend_data_path(*match.groups())
+
+        if "[" in data_path:
+            # Names can contain dots, so these paths cannot be split
+            return bpy.context.path_resolve(data_path)
+
         for attr in data_path.split("."):
             obj = getattr(obj, attr)
 
         return obj
-    except AttributeError as e:
+    except (AttributeError, ValueError) as e:
         # Lazy import to avoid circular dependency
         from .logger import StructuredLogger
         from ...shared.entities import LogLevel
@@ -35,6 +51,107 @@ def resolve_data_object(data_path: str) -> Union[bpy.types.Object, None]:
 
         return None
 
+def resolve_selected_data_objects(data_path: str) -> list:
+    """
+    Resolve a data_path string against every selected object instead of only the active one. Data shared between
+    several objects (e.g. a mesh) is only returned once. Data nested in objects is only returned if it is of the same
+    type as the active object's (e.g. only meshes, if the active object is a mesh), or as the first selected object's
+    if there is no active object.
+
+    :param data_path: String like "active_object" or "active_object.data". Paths that do not start at the active
+    object have no selection and resolve to an empty list.
+
+    :return: The resolved Blender objects, in selection order.
+    """
+    root, _, sub_path = data_path.partition(".")
+    if root != "active_object":
+        return []
+
+    active = _resolve_sub_path(bpy.context.active_object, sub_path)
+    data_type = None if active is None else type(active)
+
+    data_objects = []
+    seen = set()
+    for obj in bpy.context.selected_objects:
+        obj = _resolve_sub_path(obj, sub_path)
+        if obj is None or obj.as_pointer() in seen:
+            continue
+
+        data_type = data_type or type(obj)
+        if type(obj) is not data_type:
+            continue
+
+        seen.add(obj.as_pointer())
+        data_objects.append(obj)
+
+    return data_objects
+
+def _resolve_sub_path(obj, sub_path: str):
+    for attr in sub_path.split(".") if sub_path else ():
+        obj = getattr(obj, attr, None)
+
+    return obj
+
+def resolve_selection(data_path: str) -> list:
+    """
+    Resolve a data_path string against the active object and every selected object.
+
+    :param data_path: String like "active_object" or "active_object.data".
+
+    :return: The resolved Blender objects, starting with the active object's.
+    """
+    active = resolve_data_object(data_path)
+    selected = [data_object for data_object in resolve_selected_data_objects(data_path) if data_object != active]
+
+    return selected if active is None else [active, *selected]
+
+def get_data_path(data) -> str:
+    """
+    Get a data_path string that resolves to the same data in any context, for data that cannot be reached through the
+    context (e.g. the selected objects other than the active one) or is resolved outside of drawing. The ID owning the
+    data is looked up by name and library, so linked data sharing its name with local data is told apart.
+
+    :param data: An ID, or data nested in one (e.g. a pose bone).
+
+    :return: A path like 'blend_data.objects["Cube", None]', which `resolve_data_object` and Blender's own operators
+    understand.
+    """
+    owner = data.id_data
+    library = "None" if owner.library is None else f'"{bpy.utils.escape_identifier(owner.library.filepath)}"'
+    collection_name = consts.ID_TYPE_COLLECTIONS[owner.id_type]
+    data_path = f'blend_data.{collection_name}["{bpy.utils.escape_identifier(owner.name)}", {library}]'
+    if data != owner:
+        data_path += "." + data.path_from_id()
+
+    return data_path
+
+def _resolve_blend_data_path(collection_name: str, name: str, library: str | None, sub_path: str | None):
+    """Resolves the parts of a path `get_data_path` returns, see `_DATA_PATH_PATTERN`."""
+    collection = getattr(bpy.data, collection_name)
+    key = (
+        bpy.utils.unescape_identifier(name),
+        None if library is None else bpy.utils.unescape_identifier(library)
+    )
+    owner = collection.get(key)
+    if owner is None or sub_path is None:
+        return owner
+
+    return owner.path_resolve(sub_path)
+
+def get_user_config_dir(sub_dir: str) -> str:
+    """
+    Get (and create, if needed) a directory in the add-on's user configuration directory.
+
+    :param sub_dir: Name of the directory inside the add-on's configuration directory.
+
+    :return: The absolute path to the directory.
+    """
+    try:
+        return bpy.utils.extension_path_user(_ADDON_PACKAGE, path = sub_dir, create = True)
+    except (AttributeError, ValueError):
+        # Installed as a legacy add-on, which has no extension directory
+        return bpy.utils.user_resource('CONFIG', path = os.path.join(consts.MODULE_NAME, sub_dir), create = True)
+
 def get_dynamic_blender_property(attr_type: str):
     types = {
         consts.PropertyTypes.FLOAT: bpy.props.FloatProperty,
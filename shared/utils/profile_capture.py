@@ -0,0 +1,120 @@
+import io
+import os
+import re
+from datetime import datetime
+
+from .logger import StructuredLogger
+from .. import consts
+from ..entities import LogLevel
+
+# The add-on's root directory, used to filter profiles down to CPM's own code
+_ADDON_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+class ProfileCapture:
+    """
+    Profiles a number of CPM operations with cProfile. An operation is an outermost span, such as a panel draw, an
+    edit dialog being opened or applied, or a file being saved. Once the last operation finishes, the profile is written
+    as a `.prof` file, along with a text summary restricted to CPM's modules.
+    """
+    logger = StructuredLogger(consts.MODULE_NAME)
+
+    def __init__(self, operation_count: int, output_dir: str):
+        """
+        :param operation_count: The number of operations to profile.
+        :param output_dir: The directory to write the profile to.
+        """
+        self.operation_count = operation_count
+        self.output_dir = output_dir
+        self.operations: list[str] = []
+        self.output_path = ""
+
+        # Profiling is rare, so its modules are only imported when a capture is armed
+        import cProfile
+
+        self._profiler = cProfile.Profile()
+
+    @property
+    def remaining(self) -> int:
+        return self.operation_count - len(self.operations)
+
+    def start(self) -> bool:
+        """
+        Start profiling an operation.
+
+        :return: False if profiling could not be started, e.g. because another profiler is active.
+        """
+        try:
+            self._profiler.enable()
+        except ValueError as e:
+            self.logger.log(
+                level = LogLevel.WARNING,
+                message = "Could not start profiling",
+                extra = {"error": str(e)}
+            )
+
+            return False
+
+        return True
+
+    def stop(self, operation: str) -> bool:
+        """
+        Stop profiling the current operation.
+
+        :param operation: The name of the operation's span.
+
+        :return: True if this was the last operation and the profile has been written.
+        """
+        self._profiler.disable()
+        self.operations.append(operation)
+        if self.remaining > 0:
+            return False
+
+        self.write()
+
+        return True
+
+    def write(self):
+        """Write the profile and its summary to the output directory."""
+        import pstats
+
+        base_path = os.path.join(self.output_dir, f"cpm_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        self.output_path = base_path + consts.PROFILE_FILE_EXTENSION
+        try:
+            self._profiler.dump_stats(self.output_path)
+        except OSError as e:
+            self.logger.log(
+                level = LogLevel.ERROR,
+                message = "Could not write profile",
+                extra = {"path": self.output_path, "error": str(e)}
+            )
+
+            return
+
+        summary = io.StringIO()
+        summary.write(f"Operations ({len(self.operations)}):\n")
+        for operation in self.operations:
+            summary.write(f"    {operation}\n")
+
+        summary.write("\n")
+        stats = pstats.Stats(self._profiler, stream = summary)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE)
+        stats.print_stats(re.escape(_ADDON_DIR), consts.PROFILE_SUMMARY_LIMIT)
+
+        try:
+            with open(base_path + ".txt", "w", encoding = "utf-8") as file:
+                file.write(summary.getvalue())
+        except OSError as e:
+            self.logger.log(
+                level = LogLevel.ERROR,
+                message = "Could not write profile summary",
+                extra = {"path": base_path + ".txt", "error": str(e)}
+            )
+
+        self.logger.log(
+            level = LogLevel.INFO,
+            message = "Wrote profile",
+            extra = {
+                "path": self.output_path,
+                "operations": len(self.operations)
+            }
+        )
\ No newline at end of file
@@ -0,0 +1,162 @@
+import functools
+import json
+import math
+import time
+from collections import deque
+from typing import Callable
+
+from .profile_capture import ProfileCapture
+from .. import consts
+
+class SpanRecorder:
+    """
+    Records how long named spans of CPM code take. Recording is off by default; while it is off, timed functions and
+    spans only cost a flag check.
+
+    Functions are timed with the `timed` decorator. Blender validates the signature of registered methods (like an
+    operator's `invoke`), so those are timed with the `span` context manager instead.
+
+    Spans also drive profile captures: while a capture is armed, every outermost span is profiled as one operation.
+    """
+    enabled: bool = False
+    # Whether spans do anything at all, i.e. recording is enabled or a capture is armed
+    active: bool = False
+    capture: ProfileCapture | None = None
+    last_capture: ProfileCapture | None = None
+    _depth: int = 0
+    _samples: dict[str, deque[float]] = {}
+    _counts: dict[str, int] = {}
+
+    @classmethod
+    def set_enabled(cls, enabled: bool):
+        cls.enabled = enabled
+        cls.active = cls.enabled or cls.capture is not None
+
+    @classmethod
+    def arm_capture(cls, capture: ProfileCapture | None):
+        """
+        Profile the next operations with the given capture, replacing any capture that is still armed.
+
+        :param capture: The capture to arm, or None to disarm the current one.
+        """
+        cls.capture = capture
+        cls.active = cls.enabled or cls.capture is not None
+
+    @classmethod
+    def _begin(cls):
+        if cls._depth == 0 and cls.capture is not None and not cls.capture.start():
+            cls.arm_capture(None)
+
+        cls._depth += 1
+
+    @classmethod
+    def _end(cls, name: str, duration: float):
+        cls._depth -= 1
+        if cls.enabled:
+            cls.record(name, duration)
+
+        if cls._depth == 0 and cls.capture is not None and cls.capture.stop(name):
+            cls.last_capture = cls.capture
+            cls.arm_capture(None)
+
+    @classmethod
+    def record(cls, name: str, duration: float):
+        """
+        Record one run of a span. Only the most recent samples are kept for each span, while the count covers all
+        runs.
+
+        :param name: The name of the span.
+        :param duration: The time the run took, in seconds.
+        """
+        samples = cls._samples.get(name)
+        if samples is None:
+            samples = cls._samples[name] = deque(maxlen = consts.SPAN_SAMPLE_LIMIT)
+            cls._counts[name] = 0
+
+        samples.append(duration)
+        cls._counts[name] += 1
+
+    @classmethod
+    def timed(cls, name: str) -> Callable[[Callable], Callable]:
+        """Decorator that records every call to a function as a span."""
+        def decorator(function: Callable) -> Callable:
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not cls.active:
+                    return function(*args, **kwargs)
+
+                cls._begin()
+                start = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    cls._end(name, time.perf_counter() - start)
+
+            return wrapper
+
+        return decorator
+
+    @classmethod
+    def span(cls, name: str) -> "_Span":
+        """Context manager that records the time spent inside it as a span."""
+        return _Span(cls, name)
+
+    @classmethod
+    def get_stats(cls) -> dict[str, dict[str, float]]:
+        """
+        Aggregate the recorded spans.
+
+        :return: A mapping of span names to their count and their p50, p95 and maximum duration in milliseconds, sorted
+        by the total time spent in each span.
+        """
+        stats = {}
+        for name, samples in cls._samples.items():
+            ordered = sorted(samples)
+            stats[name] = {
+                "count": cls._counts[name],
+                "p50_ms": _percentile(ordered, 0.5) * 1000,
+                "p95_ms": _percentile(ordered, 0.95) * 1000,
+                "max_ms": ordered[-1] * 1000,
+                "total_ms": sum(ordered) * 1000
+            }
+
+        return dict(sorted(stats.items(), key = lambda item: item[1]["total_ms"], reverse = True))
+
+    @classmethod
+    def export(cls, file_path: str):
+        """
+        Write the aggregated spans to a JSON file.
+
+        :param file_path: The file to write.
+        """
+        with open(file_path, "w", encoding = "utf-8") as file:
+            json.dump({"sample_limit": consts.SPAN_SAMPLE_LIMIT, "spans": cls.get_stats()}, file, indent = 4)
+
+    @classmethod
+    def reset(cls):
+        cls._samples.clear()
+        cls._counts.clear()
+
+class _Span:
+    __slots__ = ("_recorder", "_name", "_start")
+
+    def __init__(self, recorder: type[SpanRecorder], name: str):
+        self._recorder = recorder
+        self._name = name
+        self._start = None
+
+    def __enter__(self):
+        if self._recorder.active:
+            self._recorder._begin()
+            self._start = time.perf_counter()
+
+        return self
+
+    def __exit__(self, *_):
+        if self._start is not None:
+            self._recorder._end(self._name, time.perf_counter() - self._start)
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted samples."""
+    index = max(0, math.ceil(fraction * len(ordered)) - 1)
+    return ordered[index]